@@ -0,0 +1,255 @@
+"""
+Benchmarks of model generation and of validation with generated models.
+
+Run from the repository root:
+
+    python pydantic-modelgen/benchmarks/run.py              # compare against baselines.json
+    python pydantic-modelgen/benchmarks/run.py --save       # store new baselines
+    python pydantic-modelgen/benchmarks/run.py -k enum      # only benchmarks containing "enum"
+
+Each benchmark is timed with `timeit`, taking the best of several repetitions. A benchmark
+counts as a regression if it is slower than its baseline by more than the tolerance. Baselines
+depend on the machine, so store them on the machine the benchmarks are compared on.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import schemas
+from pydanticmodelgen import (
+    EnumRegistry,
+    dump_many_json,
+    generate_basemodel,
+    generate_typeadapter,
+    validate_many,
+)
+from pydanticmodelgen.validation import clear_validated_schemas
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+
+Benchmark = Callable[[], Callable[[], Any]]
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(function: Benchmark) -> Benchmark:
+    """Registers a benchmark. It returns the function to time, after doing any setup."""
+    BENCHMARKS[function.__name__] = function
+    return function
+
+
+def generation(schema: dict[str, Any], **kwargs: Any) -> Callable[[], Any]:
+    def generate() -> Any:
+        # Otherwise, only the first repetition would validate the schema.
+        clear_validated_schemas()
+        return generate_basemodel(schema, **kwargs)
+
+    return generate
+
+
+def validation(schema: dict[str, Any], record: dict[str, Any], **kwargs: Any) -> Callable[[], Any]:
+    model = generate_basemodel(schema, **kwargs)
+    records = [record] * 100
+
+    def validate() -> Any:
+        for item in records:
+            model.model_validate(item)
+
+    return validate
+
+
+@benchmark
+def generate_wide() -> Callable[[], Any]:
+    return generation(schemas.wide_schema())
+
+
+@benchmark
+def generate_wide_without_schema_validation() -> Callable[[], Any]:
+    return generation(schemas.wide_schema(), validate_schema=False)
+
+
+@benchmark
+def generate_deep() -> Callable[[], Any]:
+    return generation(schemas.deep_schema())
+
+
+@benchmark
+def generate_deep_lazy() -> Callable[[], Any]:
+    return generation(schemas.deep_schema(), lazy=True)
+
+
+@benchmark
+def generate_large_enum() -> Callable[[], Any]:
+    return generation(schemas.large_enum_schema())
+
+
+@benchmark
+def generate_large_date_enum() -> Callable[[], Any]:
+    return generation(schemas.large_enum_schema(format="date"))
+
+
+@benchmark
+def generate_large_enum_compact() -> Callable[[], Any]:
+    schema = schemas.large_enum_schema()
+
+    def generate() -> Any:
+        clear_validated_schemas()
+        # A new registry per repetition, since a shared one would return the enum it built first.
+        return generate_basemodel(schema, enum_registry=EnumRegistry(large_enum_threshold=1000))
+
+    return generate
+
+
+@benchmark
+def generate_array_of_objects() -> Callable[[], Any]:
+    return generation(schemas.array_of_objects_schema())
+
+
+@benchmark
+def generate_custom_format() -> Callable[[], Any]:
+    return generation(schemas.custom_format_schema(), format_validation={"even": schemas.is_even})
+
+
+@benchmark
+def validate_wide_100() -> Callable[[], Any]:
+    return validation(schemas.wide_schema(), schemas.wide_record())
+
+
+@benchmark
+def validate_deep_100() -> Callable[[], Any]:
+    return validation(schemas.deep_schema(), schemas.deep_record())
+
+
+@benchmark
+def validate_large_enum_100() -> Callable[[], Any]:
+    return validation(schemas.large_enum_schema(), {"value": "value_4999"})
+
+
+@benchmark
+def validate_array_of_objects_100() -> Callable[[], Any]:
+    return validation(schemas.array_of_objects_schema(), schemas.array_of_objects_record())
+
+
+@benchmark
+def validate_custom_format_100() -> Callable[[], Any]:
+    return validation(
+        schemas.custom_format_schema(),
+        schemas.custom_format_record(),
+        format_validation={"even": schemas.is_even},
+    )
+
+
+@benchmark
+def validate_deep_typeadapter_100() -> Callable[[], Any]:
+    adapter = generate_typeadapter(schemas.deep_schema())
+    records = [schemas.deep_record()] * 100
+
+    def validate() -> Any:
+        for item in records:
+            adapter.validate_python(item)
+
+    return validate
+
+
+@benchmark
+def validate_many_wide_100() -> Callable[[], Any]:
+    model = generate_basemodel(schemas.wide_schema())
+    records = [schemas.wide_record()] * 100
+    return lambda: validate_many(model, records)
+
+
+def serialization(schema: dict[str, Any], record: dict[str, Any]) -> Callable[[], Any]:
+    model = generate_basemodel(schema)
+    instances = [model.model_validate(record)] * 100
+
+    def dump() -> Any:
+        for instance in instances:
+            instance.model_dump_json()
+
+    return dump
+
+
+def bulk_serialization(schema: dict[str, Any], record: dict[str, Any]) -> Callable[[], Any]:
+    model = generate_basemodel(schema)
+    instances = [model.model_validate(record)] * 100
+    return lambda: dump_many_json(model, instances)
+
+
+@benchmark
+def dump_json_wide_100() -> Callable[[], Any]:
+    return serialization(schemas.wide_schema(), schemas.wide_record())
+
+
+@benchmark
+def dump_json_enums_100() -> Callable[[], Any]:
+    return serialization(schemas.enums_schema(), schemas.enums_record())
+
+
+@benchmark
+def dump_many_json_wide_100() -> Callable[[], Any]:
+    return bulk_serialization(schemas.wide_schema(), schemas.wide_record())
+
+
+@benchmark
+def dump_many_json_enums_100() -> Callable[[], Any]:
+    return bulk_serialization(schemas.enums_schema(), schemas.enums_record())
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    """Returns the best time of a single call in seconds."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-k", "--keyword", default="", help="Only run matching benchmarks.")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per benchmark.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed slowdown relative to the baseline, e.g. 0.5 for 50%%.",
+    )
+    parser.add_argument("--save", action="store_true", help="Store the results as baselines.")
+    arguments = parser.parse_args(argv)
+
+    baselines: dict[str, float] = {}
+    if BASELINES_PATH.exists():
+        baselines = json.loads(BASELINES_PATH.read_text())
+
+    results: dict[str, float] = {}
+    regressions = []
+    print(f"{'benchmark':<45}{'time':>12}{'baseline':>12}{'ratio':>8}")
+    for name, setup in BENCHMARKS.items():
+        if arguments.keyword not in name:
+            continue
+        results[name] = seconds = measure(setup(), arguments.repeat)
+        line = f"{name:<45}{seconds * 1000:>10.3f}ms"
+        if name in baselines:
+            ratio = seconds / baselines[name]
+            line += f"{baselines[name] * 1000:>10.3f}ms{ratio:>8.2f}"
+            if ratio > 1 + arguments.tolerance:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+
+    if arguments.save:
+        BASELINES_PATH.write_text(json.dumps({**baselines, **results}, indent=4) + "\n")
+        print(f"Saved baselines to {BASELINES_PATH}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
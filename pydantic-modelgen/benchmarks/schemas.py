@@ -0,0 +1,165 @@
+"""
+Synthetic JSON Schemas and matching records for the benchmarks.
+
+All generators are deterministic, so that timings of different runs are comparable.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+_PROPERTY_SCHEMAS: list[dict[str, Any]] = [
+    {"type": "string", "minLength": 1, "maxLength": 64},
+    {"type": "integer", "minimum": 0, "maximum": 1000},
+    {"type": "number", "exclusiveMinimum": 0},
+    {"type": "boolean"},
+    {"type": "string", "format": "date-time"},
+    {"type": "string", "pattern": "^[a-z]+$"},
+    {"type": "array", "items": {"type": "integer"}, "maxItems": 10},
+    {"enum": ["red", "green", "blue"]},
+]
+
+_PROPERTY_VALUES: list[Any] = [
+    "value",
+    42,
+    3.14,
+    True,
+    "2024-01-01T12:00:00",
+    "abc",
+    [1, 2, 3],
+    "green",
+]
+
+
+def wide_schema(properties: int = 1000) -> dict[str, Any]:
+    """An object with many properties of mixed types."""
+    return {
+        "title": "Wide",
+        "type": "object",
+        "properties": {
+            f"property_{index}": _PROPERTY_SCHEMAS[index % len(_PROPERTY_SCHEMAS)]
+            for index in range(properties)
+        },
+    }
+
+
+def wide_record(properties: int = 1000) -> dict[str, Any]:
+    """A valid instance of `wide_schema`."""
+    return {
+        f"property_{index}": _PROPERTY_VALUES[index % len(_PROPERTY_VALUES)]
+        for index in range(properties)
+    }
+
+
+def deep_schema(depth: int = 50) -> dict[str, Any]:
+    """Objects nested `depth` levels deep, each with a few scalar properties."""
+    schema: dict[str, Any] = {"type": "object", "properties": {"leaf": {"type": "string"}}}
+    for level in range(depth):
+        schema = {
+            "type": "object",
+            "properties": {
+                f"child_{level}": schema,
+                f"name_{level}": {"type": "string"},
+                f"count_{level}": {"type": "integer"},
+            },
+        }
+    return {"title": "Deep", **schema}
+
+
+def deep_record(depth: int = 50) -> dict[str, Any]:
+    """A valid instance of `deep_schema`."""
+    record: dict[str, Any] = {"leaf": "leaf"}
+    for level in range(depth):
+        record = {f"child_{level}": record, f"name_{level}": "name", f"count_{level}": level}
+    return record
+
+
+def large_enum_schema(values: int = 5000, format: str | None = None) -> dict[str, Any]:
+    """An object with a single enum property with many values."""
+    if format == "date":
+        enum = [(date(2000, 1, 1) + timedelta(days=index)).isoformat() for index in range(values)]
+    else:
+        enum = [f"value_{index}" for index in range(values)]
+    property_schema: dict[str, Any] = {"enum": enum}
+    if format is not None:
+        property_schema["format"] = format
+    return {"title": "LargeEnum", "type": "object", "properties": {"value": property_schema}}
+
+
+def enums_schema(properties: int = 50) -> dict[str, Any]:
+    """An object with many enum properties and an array of enum values."""
+    colors: dict[str, Any] = {"enum": ["red", "green", "blue"]}
+    return {
+        "title": "Enums",
+        "type": "object",
+        "properties": {
+            **{f"property_{index}": colors for index in range(properties)},
+            "tags": {"type": "array", "items": {"enum": ["a", "b", "c"]}},
+        },
+    }
+
+
+def enums_record(properties: int = 50) -> dict[str, Any]:
+    """A valid instance of `enums_schema`."""
+    return {
+        **{f"property_{index}": "green" for index in range(properties)},
+        "tags": ["a", "b", "c"] * 10,
+    }
+
+
+def array_of_objects_schema() -> dict[str, Any]:
+    """An object with an array of referenced objects."""
+    return {
+        "title": "Order",
+        "type": "object",
+        "required": ["id", "items"],
+        "properties": {
+            "id": {"type": "integer"},
+            "items": {"type": "array", "items": {"$ref": "#/definitions/Item"}},
+        },
+        "definitions": {
+            "Item": {
+                "type": "object",
+                "required": ["sku", "quantity"],
+                "properties": {
+                    "sku": {"type": "string", "pattern": "^[A-Z]{3}-[0-9]{4}$"},
+                    "quantity": {"type": "integer", "minimum": 1},
+                    "price": {"type": "number", "minimum": 0},
+                    "tags": {"type": "array", "items": {"type": "string"}},
+                },
+            }
+        },
+    }
+
+
+def array_of_objects_record(items: int = 100) -> dict[str, Any]:
+    """A valid instance of `array_of_objects_schema`."""
+    return {
+        "id": 1,
+        "items": [
+            {"sku": f"ABC-{index:04d}", "quantity": index + 1, "price": 9.99, "tags": ["a"]}
+            for index in range(items)
+        ],
+    }
+
+
+def is_even(value: int) -> bool:
+    return value % 2 == 0
+
+
+def custom_format_schema(properties: int = 100) -> dict[str, Any]:
+    """An object whose properties all use the custom format "even", see `is_even`."""
+    return {
+        "title": "CustomFormat",
+        "type": "object",
+        "properties": {
+            f"property_{index}": {"type": "integer", "format": "even"}
+            for index in range(properties)
+        },
+    }
+
+
+def custom_format_record(properties: int = 100) -> dict[str, Any]:
+    """A valid instance of `custom_format_schema`."""
+    return {f"property_{index}": 2 * index for index in range(properties)}
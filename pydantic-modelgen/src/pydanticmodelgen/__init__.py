@@ -1,3 +1,73 @@
-from .generate_model import generate_basemodel
+from .async_generation import generate_basemodel_async
+from .batch import BatchValidationResult, RecordError, validate_many, validate_many_json
+from .batch_formats import BatchFormatValidator
+from .cache import CacheInfo, ModelCache, schema_fingerprint
+from .codegen import generate_module_source, write_module
+from .columnar import ColumnarResult, validate_columns
+from .compiler import compile_schema
+from .context import GenerationReport
+from .disk_cache import DiskCache
+from .enums import EnumRegistry
+from .generate_model import (
+    BatchResult,
+    generate_basemodel,
+    generate_basemodel_from_ir,
+    generate_basemodels,
+    generate_dataclass,
+    generate_typeadapter,
+)
+from .incremental import RegenerationResult, regenerate_basemodel
+from .ir import ModelDiff, SchemaIR, diff_models, node_from_dict
+from .parallel import ParallelValidator
+from .patterns import PatternCacheInfo, clear_pattern_cache, pattern_cache_info
+from .pickling import dumps_for_known_models, register_model
+from .profiling import GenerationProfile, profile_generation
+from .resolver import SchemaResolver, load_schema_store
+from .serialization import dump_many_json
+from .streaming import StreamStats, validate_json_array, validate_ndjson
 
-__all__ = ["generate_basemodel"]
+__all__ = [
+    "BatchFormatValidator",
+    "BatchResult",
+    "BatchValidationResult",
+    "CacheInfo",
+    "ColumnarResult",
+    "DiskCache",
+    "EnumRegistry",
+    "GenerationProfile",
+    "GenerationReport",
+    "ModelCache",
+    "ModelDiff",
+    "ParallelValidator",
+    "PatternCacheInfo",
+    "RecordError",
+    "RegenerationResult",
+    "SchemaIR",
+    "SchemaResolver",
+    "StreamStats",
+    "clear_pattern_cache",
+    "compile_schema",
+    "diff_models",
+    "dump_many_json",
+    "dumps_for_known_models",
+    "generate_basemodel",
+    "generate_basemodel_async",
+    "generate_basemodel_from_ir",
+    "generate_basemodels",
+    "generate_dataclass",
+    "generate_module_source",
+    "generate_typeadapter",
+    "load_schema_store",
+    "node_from_dict",
+    "pattern_cache_info",
+    "profile_generation",
+    "regenerate_basemodel",
+    "register_model",
+    "schema_fingerprint",
+    "validate_columns",
+    "validate_json_array",
+    "validate_many",
+    "validate_many_json",
+    "validate_ndjson",
+    "write_module",
+]
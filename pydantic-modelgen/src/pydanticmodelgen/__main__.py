@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from jsonschema import ValidationError
+
+from .codegen import generate_module_source
+from .errors import CodeGenerationError, EnumConversionError, SchemaConversionError
+from .resolver import load_schema_store
+
+
+def parse_format_validator(argument: str) -> tuple[str, str]:
+    """Parses a "FORMAT=package.module:function" argument."""
+    format_name, separator, import_path = argument.partition("=")
+    if not separator or not format_name or not import_path:
+        raise argparse.ArgumentTypeError(
+            f"expected FORMAT=package.module:function, got {argument!r}"
+        )
+    return format_name, import_path
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m pydanticmodelgen",
+        description="Generate a Python module with Pydantic models from JSON Schema files.",
+    )
+    parser.add_argument(
+        "schemas",
+        nargs="+",
+        type=Path,
+        help="JSON Schema files. Each model is named after the schema title or the file name.",
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, help="The module to write. Defaults to standard output."
+    )
+    parser.add_argument(
+        "--format-validator",
+        action="append",
+        default=[],
+        type=parse_format_validator,
+        metavar="FORMAT=MODULE:FUNCTION",
+        help="A validation function for a custom format. Can be given multiple times.",
+    )
+    parser.add_argument(
+        "--schema-dir",
+        type=Path,
+        help="A directory of JSON Schemas that references to other documents are resolved against.",
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Do not validate the schemas against the JSON Schema meta-schema.",
+    )
+    parser.add_argument(
+        "--strict-formats",
+        action="store_true",
+        help="Validate standard formats such as email, ipv4 or uri with native Pydantic types.",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs the command line interface and returns the exit code."""
+    parser = build_parser()
+    arguments = parser.parse_args(argv)
+
+    schema_store: dict[str, Any] = {}
+    if arguments.schema_dir is not None:
+        schema_store.update(load_schema_store(arguments.schema_dir))
+    schemas: dict[str, Any] = {}
+    for path in arguments.schemas:
+        schema = json.loads(path.read_text(encoding="utf-8"))
+        schema_store.setdefault(path.name, schema)
+        schemas[schema.get("title") or path.stem] = schema
+
+    try:
+        source = generate_module_source(
+            schemas,
+            validate_schema=not arguments.no_validate,
+            format_validation=dict(arguments.format_validator),
+            schema_store=schema_store,
+            strict_formats=arguments.strict_formats,
+        )
+    except (CodeGenerationError, EnumConversionError, SchemaConversionError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    except ValidationError as e:
+        print(f"error: invalid JSON Schema: {e.message}", file=sys.stderr)
+        return 1
+
+    if arguments.output is None:
+        sys.stdout.write(source)
+    else:
+        arguments.output.write_text(source, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
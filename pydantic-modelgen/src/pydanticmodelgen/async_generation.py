@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any
+
+from pydantic import BaseModel
+
+from .cache import ModelCache
+from .disk_cache import DiskCache
+from .enums import EnumRegistry
+from .generate_model import generate_basemodel
+
+
+async def generate_basemodel_async(
+    schema: Mapping[str, Any],
+    validate_schema: bool = True,
+    model_name: str | None = None,
+    format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
+    cache: ModelCache | None = None,
+    schema_store: Mapping[str, Any] | None = None,
+    disk_cache: DiskCache | None = None,
+    enum_registry: EnumRegistry | None = None,
+    strict_formats: bool = False,
+    lazy: bool = False,
+    frozen: bool = False,
+    executor: Executor | None = None,
+) -> type[BaseModel]:
+    """
+    Generates a Pydantic BaseModel from a JSON Schema without blocking the event loop.
+
+    The model is built in a thread of the executor. With a cache, cached models are returned
+    without switching threads, and concurrent calls for the same missing model, from any tasks
+    or threads, wait for a single build. Waiting tasks do not occupy a thread, and cancelling
+    one of them does not cancel the build.
+
+    See `generate_basemodel` for the other parameters.
+
+    :param executor: The executor to build the model in. Defaults to the default executor of
+        the event loop.
+    :return: The generated Pydantic BaseModel.
+    """
+    loop = asyncio.get_running_loop()
+    build = partial(
+        generate_basemodel,
+        schema,
+        validate_schema,
+        model_name,
+        format_validation=format_validation,
+        schema_store=schema_store,
+        disk_cache=disk_cache,
+        enum_registry=enum_registry,
+        strict_formats=strict_formats,
+        lazy=lazy,
+        frozen=frozen,
+    )
+    if cache is None:
+        return await loop.run_in_executor(executor, build)
+
+    key = cache.make_key(
+        schema,
+        validate_schema,
+        model_name,
+        format_validation,
+        schema_store,
+        enum_registry,
+        strict_formats,
+        lazy,
+        frozen,
+    )
+    future, is_builder = cache.claim(key)
+    if future.done():
+        return future.result()
+    if is_builder:
+        loop.run_in_executor(
+            executor, cache.complete, key, future, build, format_validation, schema_store
+        )
+    return await asyncio.shield(asyncio.wrap_future(future))
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Sequence
+from typing import Any, List, NamedTuple
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import from_json
+
+from .batch_formats import DEFER_CONTEXT, BatchFormatValidator, get_format_plan
+
+# The attribute of a model holding its `TypeAdapter` for lists. The adapter refers to the model,
+# so it is stored on the model rather than in a mapping keyed by it, which would keep it alive.
+_LIST_ADAPTER_ATTRIBUTE = "__pydanticmodelgen_list_adapter__"
+
+
+class RecordError(NamedTuple):
+    """An error of a single record, see `BatchValidationResult`."""
+
+    record_index: int
+    loc: tuple[int | str, ...]
+    type: str
+    msg: str
+
+
+class BatchValidationResult(NamedTuple):
+    """
+    The result of `validate_many`.
+
+    :param instances: The valid records as model instances, in input order.
+    :param indices: The input index of each instance.
+    :param errors: One entry per error of an invalid record. The location is relative to the
+        record. A record can have multiple errors.
+    """
+
+    instances: list[Any]
+    indices: list[int]
+    errors: list[RecordError]
+
+    @property
+    def invalid_indices(self) -> list[int]:
+        """The sorted input indices of the invalid records."""
+        return sorted({error.record_index for error in self.errors})
+
+
+def get_list_adapter(model: type[BaseModel]) -> TypeAdapter[Any]:
+    """
+    Returns the `TypeAdapter` validating lists of the model.
+
+    The adapter is built once per model and released together with it.
+    """
+    adapter = vars(model).get(_LIST_ADAPTER_ATTRIBUTE)
+    if adapter is None:
+        adapter = TypeAdapter(make_list_type(model))
+        setattr(model, _LIST_ADAPTER_ATTRIBUTE, adapter)
+    return adapter
+
+
+def make_list_type(item_type: Any) -> Any:
+    """
+    Returns the type of lists of the given items.
+
+    Subscripting `typing.List` goes through a global cache of `typing`, which would keep the
+    last item types alive, so the builtin `list` is subscripted instead where supported.
+    """
+    if sys.version_info < (3, 9):  # noqa: UP036
+        return List[item_type]
+    return list[item_type]
+
+
+def validate_many(
+    model: type[BaseModel], records: Iterable[Any], strict: bool | None = None
+) -> BatchValidationResult:
+    """
+    Validates many records against a model at once.
+
+    All records are validated by a single call into pydantic-core instead of one call per
+    record. Only if some records are invalid, the valid ones are validated a second time to
+    obtain their instances. Fields with a `BatchFormatValidator` are checked afterwards, with
+    one call per format for the whole batch.
+
+    :param model: The model, e.g. as returned by `generate_basemodel`.
+    :param records: The records to validate, e.g. dictionaries.
+    :param strict: Whether to validate in strict mode, see `BaseModel.model_validate`.
+    :return: The instances of the valid records and the errors of the invalid ones.
+    """
+    if not isinstance(records, Sequence):
+        records = list(records)
+    adapter = get_list_adapter(model)
+    context = get_validation_context(model)
+    try:
+        instances = adapter.validate_python(records, strict=strict, context=context)
+    except ValidationError as e:
+        errors = get_record_errors(e)
+        result = revalidate_valid_records(adapter, records, errors, strict, context)
+    else:
+        result = BatchValidationResult(instances, list(range(len(instances))), [])
+    return result if context is None else check_batch_formats(result)
+
+
+def validate_many_json(
+    model: type[BaseModel], json_data: str | bytes | bytearray, strict: bool | None = None
+) -> BatchValidationResult:
+    """
+    Validates a JSON array of records against a model at once, see `validate_many`.
+
+    The JSON is parsed and validated in a single pass without building intermediate Python
+    objects. Only if some records are invalid, the JSON is parsed into Python objects and the
+    valid records are validated again.
+
+    :param model: The model, e.g. as returned by `generate_basemodel`.
+    :param json_data: The JSON array of records.
+    :param strict: Whether to validate in strict mode, see `BaseModel.model_validate_json`.
+    :return: The instances of the valid records and the errors of the invalid ones.
+    :raises pydantic.ValidationError: If the data is not a JSON array.
+    """
+    adapter = get_list_adapter(model)
+    context = get_validation_context(model)
+    try:
+        instances = adapter.validate_json(json_data, strict=strict, context=context)
+    except ValidationError as e:
+        errors = get_record_errors(e)
+        result = revalidate_valid_records(adapter, from_json(json_data), errors, strict, context)
+    else:
+        result = BatchValidationResult(instances, list(range(len(instances))), [])
+    return result if context is None else check_batch_formats(result)
+
+
+def revalidate_valid_records(
+    adapter: TypeAdapter[Any],
+    records: Sequence[Any],
+    errors: list[RecordError],
+    strict: bool | None = None,
+    context: dict[str, Any] | None = None,
+) -> BatchValidationResult:
+    """Builds the result of a batch with invalid records by validating the valid ones again."""
+    invalid = {error.record_index for error in errors}
+    indices = [index for index in range(len(records)) if index not in invalid]
+    instances = adapter.validate_python(
+        [records[index] for index in indices], strict=strict, context=context
+    )
+    return BatchValidationResult(instances, indices, errors)
+
+
+def get_validation_context(model: type[BaseModel]) -> dict[str, Any] | None:
+    """Returns the context deferring batch format validation, if the model uses any."""
+    return DEFER_CONTEXT if get_format_plan(model) is not None else None
+
+
+def check_batch_formats(result: BatchValidationResult) -> BatchValidationResult:
+    """
+    Checks the fields of the instances that have batch format validators, including those of
+    nested models, and removes the invalid instances from the result.
+
+    Each validator is called once with the values of all instances. Unlike when validating a
+    single record, the location of an error is the field rather than the model.
+    """
+    columns: dict[BatchFormatValidator, list[tuple[int, tuple[int | str, ...], Any]]] = {}
+    for position, instance in enumerate(result.instances):
+        collect_format_values(instance, result.indices[position], (), columns)
+    format_errors = []
+    for validator, entries in columns.items():
+        mask = validator.validate_column([value for _, _, value in entries])
+        for position, (index, loc, value) in enumerate(entries):
+            if not mask[position]:
+                message = f"Value error, Invalid value for format in field '{loc[-1]}': {value}"
+                format_errors.append(RecordError(index, loc, "value_error", message))
+    if not format_errors:
+        return result
+    invalid = {error.record_index for error in format_errors}
+    valid = [position for position, index in enumerate(result.indices) if index not in invalid]
+    errors = sorted([*result.errors, *format_errors], key=lambda error: error.record_index)
+    return BatchValidationResult(
+        [result.instances[position] for position in valid],
+        [result.indices[position] for position in valid],
+        errors,
+    )
+
+
+def collect_format_values(
+    value: Any,
+    record_index: int,
+    loc: tuple[int | str, ...],
+    columns: dict[BatchFormatValidator, list[tuple[int, tuple[int | str, ...], Any]]],
+) -> None:
+    """Adds the values of fields with batch format validators within a value to their columns."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        for item_index, item in enumerate(value):
+            collect_format_values(item, record_index, (*loc, item_index), columns)
+        return
+    plan = get_format_plan(type(value)) if isinstance(value, BaseModel) else None
+    if plan is None:
+        return
+    fields_set = value.model_fields_set
+    for field_name, validator in plan.fields:
+        if field_name in fields_set:
+            column = columns.setdefault(validator, [])
+            column.append((record_index, (*loc, field_name), getattr(value, field_name)))
+    for field_name in plan.nested:
+        collect_format_values(getattr(value, field_name), record_index, (*loc, field_name), columns)
+
+
+def get_record_errors(error: ValidationError) -> list[RecordError]:
+    """
+    Converts the errors of validating a list into per-record errors.
+
+    :raises pydantic.ValidationError: If the list itself is invalid, e.g. not a list at all or
+        malformed JSON.
+    """
+    record_errors = []
+    for details in error.errors(include_url=False, include_input=False):
+        loc = details["loc"]
+        if not loc or not isinstance(loc[0], int):
+            raise error
+        record_errors.append(RecordError(loc[0], tuple(loc[1:]), details["type"], details["msg"]))
+    return record_errors
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any, NamedTuple
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel, ValidationInfo, model_validator
+
+# Key of the validation context which defers batch format validation to `validate_many`.
+DEFER_CONTEXT_KEY = "pydanticmodelgen_defer_batch_formats"
+DEFER_CONTEXT = {DEFER_CONTEXT_KEY: True}
+
+
+class FormatPlan(NamedTuple):
+    """The fields of a model `validate_many` checks with batch format validators."""
+
+    fields: tuple[tuple[str, BatchFormatValidator], ...]
+    nested: tuple[str, ...]
+
+
+_plans: WeakKeyDictionary[type[BaseModel], FormatPlan] = WeakKeyDictionary()
+
+
+class BatchFormatValidator:
+    """
+    A custom format validation function checking a whole column of values at once.
+
+    Use it in `format_validation` instead of a function taking a single value. Batch validation
+    with `validate_many` (and thus streaming and parallel validation) then calls the function
+    once per batch and format with the values of all records, instead of once per value.
+    Validating single records, e.g. with `model_validate`, calls it with one value at a time.
+
+    :param function: The function taking a list of values, or a NumPy array if `array` is set,
+        and returning a boolean mask of the same length, `True` for valid values.
+    :param memoize: Whether to remember the result of each distinct hashable value, so repeated
+        values are only passed to the function once.
+    :param maxsize: The maximum number of remembered results. The memo is cleared when full.
+    :param array: Whether to pass the values as a NumPy array, which requires `numpy`.
+    """
+
+    def __init__(
+        self,
+        function: Callable[[Any], Sequence[bool]],
+        memoize: bool = True,
+        maxsize: int = 65536,
+        array: bool = False,
+    ) -> None:
+        if array and find_spec("numpy") is None:
+            raise ImportError("BatchFormatValidator(array=True) requires numpy")
+        self.function = function
+        self.memoize = memoize
+        self.maxsize = maxsize
+        self.array = array
+        self._results: dict[Hashable, bool] = {}
+
+    def __repr__(self) -> str:
+        return f"BatchFormatValidator({self.function!r})"
+
+    def __call__(self, value: Any) -> bool:
+        return self.validate_column([value])[0]
+
+    def validate_column(self, values: Sequence[Any]) -> list[bool]:
+        """
+        Checks a column of values, passing each distinct value to the function only once.
+
+        :param values: The values to check.
+        :return: Whether each value is valid.
+        :raises ValueError: If the function does not return one result per value.
+        """
+        results: list[bool | None] = [None] * len(values)
+        unique_values: list[Any] = []
+        unique_keys: list[Hashable | None] = []
+        unique_positions: list[list[int]] = []
+        unique_indices: dict[Hashable, int] = {}
+        for position, value in enumerate(values):
+            key = make_memo_key(value)
+            if key is not None:
+                if self.memoize and key in self._results:
+                    results[position] = self._results[key]
+                    continue
+                if key in unique_indices:
+                    unique_positions[unique_indices[key]].append(position)
+                    continue
+                unique_indices[key] = len(unique_values)
+            unique_values.append(value)
+            unique_keys.append(key)
+            unique_positions.append([position])
+
+        if unique_values:
+            mask = self.call_function(unique_values)
+            if self.memoize and len(self._results) + len(mask) > self.maxsize:
+                self._results.clear()
+            for unique_index, valid in enumerate(mask):
+                for position in unique_positions[unique_index]:
+                    results[position] = valid
+                key = unique_keys[unique_index]
+                if self.memoize and key is not None:
+                    self._results[key] = valid
+        return results  # type: ignore[return-value]
+
+    def call_function(self, values: list[Any]) -> list[bool]:
+        if self.array:
+            numpy = import_module("numpy")
+            mask = self.function(numpy.asarray(values))
+        else:
+            mask = self.function(values)
+        results = [bool(valid) for valid in mask]
+        if len(results) != len(values):
+            raise ValueError(f"{self!r} returned {len(results)} results for {len(values)} values")
+        return results
+
+    def cache_clear(self) -> None:
+        """Forgets all remembered results."""
+        self._results.clear()
+
+
+def make_memo_key(value: Any) -> Hashable | None:
+    """Returns the key of a value in the memo, or `None` if it is unhashable."""
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    # The type is part of the key since e.g. `1 == 1.0 == True`.
+    return type(value), value
+
+
+def create_batch_format_validator(fields: Mapping[str, BatchFormatValidator]) -> Any:
+    """
+    Creates a model validator checking the fields with batch format validators.
+
+    It checks all of them in one call per instance, unless `validate_many` defers the checks to
+    the whole batch.
+    """
+
+    def validate_batch_formats(self: BaseModel, info: ValidationInfo) -> BaseModel:
+        if info.context and info.context.get(DEFER_CONTEXT_KEY):
+            return self
+        fields_set = self.model_fields_set
+        for field_name, validator in fields.items():
+            if field_name in fields_set:
+                value = getattr(self, field_name)
+                if not validator(value):
+                    raise ValueError(f"Invalid value for format in field '{field_name}': {value}")
+        return self
+
+    return model_validator(mode="after")(validate_batch_formats)  # type: ignore[arg-type]
+
+
+def register_format_plan(model: type[BaseModel], plan: FormatPlan) -> None:
+    _plans[model] = plan
+
+
+def get_format_plan(model: type[BaseModel]) -> FormatPlan | None:
+    """Returns the batch format plan of a model, or `None` if it has none."""
+    return _plans.get(model)
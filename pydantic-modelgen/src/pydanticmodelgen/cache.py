@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from .enums import EnumRegistry
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `ModelCache`, mirroring `functools.lru_cache`'s `cache_info()`."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+def schema_fingerprint(schema: Mapping[str, Any]) -> str:
+    """
+    Computes a canonical hash of a JSON Schema.
+
+    Two schemas that only differ in the order of their keys have the same fingerprint.
+
+    :param schema: The JSON Schema to hash.
+    :return: The hex digest of the SHA-256 hash of the canonical JSON representation.
+    """
+    canonical = json.dumps(
+        schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=repr
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ModelCache:
+    """
+    A size-bounded LRU cache of generated models.
+
+    Entries are keyed by the fingerprint of the JSON Schema together with all other arguments of
+    `generate_basemodel` that influence the result. Custom format validation functions are keyed
+    by identity, so passing a new function object results in a new model.
+
+    The cache is thread-safe. If multiple threads (or tasks, see `generate_basemodel_async`) ask
+    for the same missing model at once, it is only built once and all of them get that model.
+
+    :param maxsize: The maximum number of models to keep. `None` means unbounded.
+    """
+
+    def __init__(self, maxsize: int | None = 128) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be non-negative or None")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[type[BaseModel], tuple[Any, ...]]] = (
+            OrderedDict()
+        )
+        self._in_flight: dict[Hashable, Future[type[BaseModel]]] = {}
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        schema: Mapping[str, Any],
+        validate_schema: bool = True,
+        model_name: str | None = None,
+        format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
+        schema_store: Mapping[str, Any] | None = None,
+        enum_registry: EnumRegistry | None = None,
+        strict_formats: bool = False,
+        lazy: bool = False,
+        frozen: bool = False,
+    ) -> tuple[Hashable, ...]:
+        """
+        Builds the cache key for the given arguments of `generate_basemodel`.
+
+        Like the format validation functions, the schema store is keyed by identity. Of the enum
+        registry, only the threshold for compact enums is part of the key.
+        """
+        format_key = tuple(
+            sorted((name, id(func)) for name, func in (format_validation or {}).items())
+        )
+        store_key = None if schema_store is None else id(schema_store)
+        enum_key = None if enum_registry is None else enum_registry.large_enum_threshold
+        return (
+            schema_fingerprint(schema),
+            model_name,
+            validate_schema,
+            format_key,
+            store_key,
+            enum_key,
+            strict_formats,
+            lazy,
+            frozen,
+        )
+
+    def get(self, key: Hashable) -> type[BaseModel] | None:
+        """Returns the cached model for the key, or `None` if there is none."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def get_or_build(
+        self,
+        key: Hashable,
+        build: Callable[[], type[BaseModel]],
+        format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
+        schema_store: Mapping[str, Any] | None = None,
+    ) -> type[BaseModel]:
+        """
+        Returns the cached model for the key, building and storing it if necessary.
+
+        If another thread is building the model for the key already, waits for it instead of
+        building the model again. If that build fails, the exception is raised in all waiting
+        threads, and the next call builds the model again.
+
+        :param key: The key as returned by `make_key`.
+        :param build: The function building the model.
+        :param format_validation: The format validation functions, see `put`.
+        :param schema_store: The schema store, see `put`.
+        :return: The model.
+        """
+        future, is_builder = self.claim(key)
+        if is_builder:
+            self.complete(key, future, build, format_validation, schema_store)
+        return future.result()
+
+    def claim(self, key: Hashable) -> tuple[Future[type[BaseModel]], bool]:
+        """
+        Returns the future of the model for the key and whether the caller has to build it.
+
+        The future is already done if the model is cached. Otherwise, the first caller has to
+        build the model and pass it to `complete`, and all others get the same future.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                future: Future[type[BaseModel]] = Future()
+                future.set_result(entry[0])
+                return future, False
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                self._hits += 1
+                return in_flight, False
+            self._misses += 1
+            future = Future()
+            self._in_flight[key] = future
+            return future, True
+
+    def complete(
+        self,
+        key: Hashable,
+        future: Future[type[BaseModel]],
+        build: Callable[[], type[BaseModel]],
+        format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
+        schema_store: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Builds the model for a key claimed with `claim` and resolves its future."""
+        try:
+            model = build()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        with self._lock:
+            self.put(key, model, format_validation, schema_store)
+            del self._in_flight[key]
+        future.set_result(model)
+
+    def put(
+        self,
+        key: Hashable,
+        model: type[BaseModel],
+        format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
+        schema_store: Mapping[str, Any] | None = None,
+    ) -> None:
+        """
+        Stores a model in the cache, evicting the least recently used entry if necessary.
+
+        :param key: The key as returned by `make_key`.
+        :param model: The generated model.
+        :param format_validation: The format validation functions used to build the model.
+            References to them are kept alive so that their ids, which are part of the key, cannot
+            be reused by other objects while the entry exists.
+        :param schema_store: The schema store used to build the model, kept alive for the same
+            reason.
+        """
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = (model, (*(format_validation or {}).values(), schema_store))
+            self._entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self, schema: Mapping[str, Any]) -> int:
+        """
+        Removes all models generated from the given JSON Schema, regardless of the other arguments
+        they were generated with.
+
+        :param schema: The JSON Schema whose models to remove.
+        :return: The number of removed entries.
+        """
+        fingerprint = schema_fingerprint(schema)
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == fingerprint]  # type: ignore[index]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Returns the hit/miss statistics and the current size of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
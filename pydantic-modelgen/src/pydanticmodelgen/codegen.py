@@ -0,0 +1,489 @@
+from __future__ import annotations
+
+import keyword
+import re
+from collections.abc import Hashable, Mapping
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any, Callable, Union
+
+from pydantic import BaseModel
+
+from .compiler import SchemaCompiler
+from .enums import EnumRegistry
+from .errors import CodeGenerationError
+from .formats import EMAIL_PATTERN, HOSTNAME_PATTERN, JSON_POINTER_PATTERN, has_email_validator
+from .ir import (
+    ArrayType,
+    Constraints,
+    EnumType,
+    FieldSpec,
+    ModelSpec,
+    ModelType,
+    RefType,
+    SchemaIR,
+    TypeSpec,
+)
+from .patterns import get_pattern_kwargs
+from .translation.field_type import load_enum_value
+from .validation import validate_json_schema
+
+# A format validation function, or its import path such as "my_package.validators:is_even".
+FormatValidatorReference = Union[str, Callable[[Any], bool]]  # noqa: UP007
+
+_SCALAR_SOURCES = {
+    "str": "str",
+    "int": "int",
+    "float": "float",
+    "bool": "bool",
+    "null": "None",
+    "any": "Any",
+    "datetime": "datetime.datetime",
+    "date": "datetime.date",
+    "time": "datetime.time",
+    "uuid": "UUID",
+    "ipv4": "IPv4Address",
+    "ipv6": "IPv6Address",
+    "uri": "AnyUrl",
+    "iri": "AnyUrl",
+    "duration": "datetime.timedelta",
+    "hostname": (
+        f"Annotated[str, StringConstraints(pattern={HOSTNAME_PATTERN!r}, max_length=253)]"
+    ),
+    "json-pointer": f"Annotated[str, StringConstraints(pattern={JSON_POINTER_PATTERN!r})]",
+}
+
+_EMAIL_FALLBACK_SOURCE = f"Annotated[str, StringConstraints(pattern={EMAIL_PATTERN!r})]"
+
+_SCALAR_IMPORTS = {
+    "any": "from typing import Any",
+    "datetime": "import datetime",
+    "date": "import datetime",
+    "time": "import datetime",
+    "uuid": "from uuid import UUID",
+    "ipv4": "from ipaddress import IPv4Address",
+    "ipv6": "from ipaddress import IPv6Address",
+    "uri": "from pydantic import AnyUrl",
+    "iri": "from pydantic import AnyUrl",
+    "duration": "import datetime",
+}
+
+_ANNOTATED_FIELD_IMPORTS = ["from typing_extensions import Annotated", "from pydantic import Field"]
+
+_CONSTRAINED_STR_IMPORTS = [
+    "from typing_extensions import Annotated",
+    "from pydantic import StringConstraints",
+]
+
+_RESERVED_NAMES = {
+    "datetime",
+    "Enum",
+    "Annotated",
+    "Any",
+    "Callable",
+    "List",
+    "Set",
+    "UUID",
+    "IPv4Address",
+    "IPv6Address",
+    "AnyUrl",
+    "EmailStr",
+    "StringConstraints",
+    "BaseModel",
+    "ConfigDict",
+    "Field",
+    "create_model",
+    "field_validator",
+}
+
+# Names that class bodies may refer to besides those in the rendered field types.
+_CLASS_BODY_NAMES = {"Annotated", "Field", "re", "datetime", "_format_validator"}
+
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_]\w*")
+
+_FORMAT_VALIDATOR_HELPER = """\
+def _format_validator(function: Callable[[Any], bool], field_name: str) -> Any:
+    def validate(cls: Any, value: Any) -> Any:
+        if not function(value):
+            raise ValueError(f"Invalid value for format in field '{field_name}': {value}")
+        return value
+
+    return field_validator(field_name)(validate)"""
+
+
+def generate_module_source(
+    schemas: Mapping[str, Mapping[str, Any]],
+    validate_schema: bool = True,
+    format_validation: Mapping[str, FormatValidatorReference] | None = None,
+    schema_store: Mapping[str, Any] | None = None,
+    strict_formats: bool = False,
+) -> str:
+    """
+    Generates the source code of a Python module defining Pydantic models for JSON Schemas.
+
+    The module only depends on Pydantic and the modules of the format validation functions and
+    defines the same models, enums, constraints and validators as `generate_basemodels`.
+    Models whose field names are valid Python identifiers are defined with class syntax, all
+    others with `pydantic.create_model`.
+
+    :param schemas: A mapping of model names to the JSON Schemas to convert.
+    :param validate_schema: Whether to validate the JSON Schemas. Defaults to True.
+    :param format_validation: A mapping of custom format names to validation functions. The
+        functions are referenced by their import path in the generated module, so they must be
+        importable, i.e. be defined at the top level of a module. Instead of a function, its
+        import path can be given as "package.module:function".
+    :param schema_store: A mapping of URIs to additional JSON Schema documents that references
+        are resolved against, see `generate_basemodel`.
+    :param strict_formats: Whether to validate standard formats with native Pydantic types, see
+        `generate_basemodel`.
+    :return: The source code of the module.
+    """
+    if validate_schema:
+        for schema in schemas.values():
+            validate_json_schema(schema)
+
+    compiler = SchemaCompiler(schema_store, strict_formats)
+    for name, schema in schemas.items():
+        compiler.add_document(name, schema)
+    emitter = ModuleEmitter(format_validation)
+    for name, schema in schemas.items():
+        emitter.add_schema(name, compiler.compile(schema, name, uri=name))
+    return emitter.render()
+
+
+def write_module(
+    path: str | Path,
+    schemas: Mapping[str, Mapping[str, Any]],
+    validate_schema: bool = True,
+    format_validation: Mapping[str, FormatValidatorReference] | None = None,
+    schema_store: Mapping[str, Any] | None = None,
+    strict_formats: bool = False,
+) -> None:
+    """
+    Writes a Python module defining Pydantic models for JSON Schemas, see `generate_module_source`.
+
+    :param path: The path of the module to write, e.g. "models.py".
+    """
+    source = generate_module_source(
+        schemas,
+        validate_schema=validate_schema,
+        format_validation=format_validation,
+        schema_store=schema_store,
+        strict_formats=strict_formats,
+    )
+    Path(path).write_text(source, encoding="utf-8")
+
+
+def get_import_path(validator: FormatValidatorReference) -> tuple[str, str]:
+    """
+    Determines where a format validation function can be imported from.
+
+    :param validator: The function or its import path "package.module:function".
+    :return: The module and the (possibly dotted) name of the function within the module.
+    :raises CodeGenerationError: If the function cannot be imported by the generated module.
+    """
+    if isinstance(validator, str):
+        module, separator, qualname = validator.partition(":")
+        if not separator:
+            module, _, qualname = validator.rpartition(".")
+    else:
+        module = getattr(validator, "__module__", None) or ""
+        qualname = getattr(validator, "__qualname__", "")
+    if not module or not qualname or "<" in qualname or module == "__main__":
+        raise CodeGenerationError(
+            f"Format validator {validator!r} is not importable. Define it at the top level of a "
+            "module or pass its import path as 'package.module:function'."
+        )
+    return module, qualname
+
+
+def to_identifier(name: str) -> str:
+    """Converts a name into a valid Python identifier."""
+    identifier = re.sub(r"\W", "_", name)
+    if not identifier or identifier[0].isdigit() or keyword.iskeyword(identifier):
+        identifier = "_" + identifier
+    return identifier
+
+
+def is_plain_field_name(name: str) -> bool:
+    """Returns whether a field can be declared with class syntax under its own name."""
+    return (
+        name.isidentifier()
+        and not keyword.iskeyword(name)
+        and not name.startswith("_")
+        and not hasattr(BaseModel, name)
+    )
+
+
+def render_value(value: Any) -> str:
+    """Renders a JSON value, a date/time enum value or a pattern as a Python expression."""
+    if value is ...:
+        return "..."
+    if isinstance(value, re.Pattern):
+        return f"re.compile({value.pattern!r})"
+    if isinstance(value, (datetime, date, time)):
+        return f"datetime.{type(value).__name__}.fromisoformat({value.isoformat()!r})"
+    return repr(value)
+
+
+class ModuleEmitter:
+    """
+    Renders the IRs of JSON Schemas as the source code of a Python module.
+
+    Like `GenerationContext`, structurally identical nested models and enums are only defined
+    once and referenced models once per location.
+
+    :param format_validation: A mapping of custom format names to validation functions or their
+        import paths.
+    """
+
+    def __init__(
+        self, format_validation: Mapping[str, FormatValidatorReference] | None = None
+    ) -> None:
+        self.imports: set[str] = set()
+        self.validator_imports: set[str] = set()
+        self.identifiers: set[str] = set(_RESERVED_NAMES)
+        self.blocks: list[str] = []
+        self.definitions: dict[str, ModelSpec] = {}
+        self.enums: dict[Hashable, str] = {}
+        self.models: dict[Hashable, str] = {}
+        self.referenced_models: dict[str, str] = {}
+        self.in_progress: set[str] = set()
+        self.model_identifiers: list[str] = []
+        self.has_forward_refs = False
+        self.exports: dict[str, str] = {}
+        self.format_validators: dict[str, str] = {}
+        self.format_validator_sources = dict(format_validation or {})
+
+    def add_schema(self, name: str, schema_ir: SchemaIR) -> str:
+        """Adds the models of an IR and returns the identifier of its root model."""
+        self.definitions.update(schema_ir.definitions)
+        identifier = self.emit_reference(schema_ir.root)
+        self.exports[name] = identifier
+        return identifier
+
+    def unique_identifier(self, name: str) -> str:
+        identifier = base = to_identifier(name)
+        counter = 2
+        while identifier in self.identifiers:
+            identifier = f"{base}_{counter}"
+            counter += 1
+        self.identifiers.add(identifier)
+        return identifier
+
+    def emit_reference(self, ref: str) -> str:
+        if ref in self.referenced_models:
+            identifier = self.referenced_models[ref]
+            if ref in self.in_progress:
+                self.has_forward_refs = True
+                return repr(identifier)
+            return identifier
+        spec = self.definitions[ref]
+        identifier = self.unique_identifier(spec.name)
+        self.referenced_models[ref] = identifier
+        self.in_progress.add(ref)
+        self.emit_model(spec, identifier)
+        self.in_progress.discard(ref)
+        return identifier
+
+    def emit_nested_model(self, spec: ModelSpec) -> str:
+        key = spec.structure()
+        if key not in self.models:
+            identifier = self.unique_identifier(spec.name)
+            self.emit_model(spec, identifier)
+            self.models[key] = identifier
+        return self.models[key]
+
+    def emit_enum(self, enum_type: EnumType) -> str:
+        key = EnumRegistry.make_key(enum_type)
+        if key not in self.enums:
+            enum_name = enum_type.name + "Enum"
+            identifier = self.unique_identifier(enum_name)
+            members = [
+                (value, load_enum_value(value, enum_type.format)) for value in enum_type.values
+            ]
+            if any(isinstance(member, (datetime, date, time)) for _, member in members):
+                self.imports.add("import datetime")
+            self.imports.add("from enum import Enum")
+            rendered = ", ".join(
+                f"{render_value(value)}: {render_value(member)}" for value, member in members
+            )
+            self.blocks.append(f"{identifier} = Enum({enum_name!r}, {{{rendered}}})")
+            self.enums[key] = identifier
+        return self.enums[key]
+
+    def get_format_validator(self, format_name: str) -> str:
+        if format_name not in self.format_validators:
+            module, qualname = get_import_path(self.format_validator_sources[format_name])
+            head, _, tail = qualname.partition(".")
+            alias = self.unique_identifier("_format_" + format_name)
+            self.validator_imports.add(f"from {module} import {head} as {alias}")
+            self.format_validators[format_name] = f"{alias}.{tail}" if tail else alias
+        return self.format_validators[format_name]
+
+    def render_type(self, type_spec: TypeSpec) -> str:
+        if isinstance(type_spec, EnumType):
+            return self.emit_enum(type_spec)
+        if isinstance(type_spec, ArrayType):
+            item_type = self.render_type(type_spec.items)
+            if type_spec.item_constraints:
+                self.imports.add("from typing_extensions import Annotated")
+                item_type = (
+                    f"Annotated[{item_type}, {self.render_field_call(type_spec.item_constraints)}]"
+                )
+            container = "Set" if type_spec.unique else "List"
+            self.imports.add(f"from typing import {container}")
+            return f"{container}[{item_type}]"
+        if isinstance(type_spec, ModelType):
+            return self.emit_nested_model(type_spec.model)
+        if isinstance(type_spec, RefType):
+            return self.emit_reference(type_spec.ref)
+        if type_spec.name in ("email", "idn-email"):
+            return self.render_email_type()
+        if type_spec.name in _SCALAR_IMPORTS:
+            self.imports.add(_SCALAR_IMPORTS[type_spec.name])
+        elif type_spec.name in ("hostname", "json-pointer"):
+            self.imports.update(_CONSTRAINED_STR_IMPORTS)
+        return _SCALAR_SOURCES[type_spec.name]
+
+    def render_email_type(self) -> str:
+        """Renders the type of strict e-mail formats, like `formats.get_email_type`."""
+        if has_email_validator():
+            self.imports.add("from pydantic import EmailStr")
+            return "EmailStr"
+        self.imports.update(_CONSTRAINED_STR_IMPORTS)
+        return _EMAIL_FALLBACK_SOURCE
+
+    def emit_model(self, spec: ModelSpec, identifier: str) -> None:
+        field_types = {field.name: self.render_type(field.type) for field in spec.fields}
+        validators = {
+            field.name: self.get_format_validator(field.format)
+            for field in spec.fields
+            if field.format is not None and field.format in self.format_validator_sources
+        }
+        if validators:
+            self.imports.update(
+                ["from typing import Any, Callable", "from pydantic import field_validator"]
+            )
+        config_arguments = [
+            f"extra={'allow' if spec.additional_properties else 'ignore'!r}",
+            "use_enum_values=True",
+        ]
+        self.imports.add("from pydantic import ConfigDict")
+
+        use_class_syntax = all(
+            is_plain_field_name(field.name) for field in spec.fields
+        ) and not self.shadows_names(spec, field_types)
+        if use_class_syntax:
+            if identifier != spec.name:
+                config_arguments.append(f"title={spec.name!r}")
+            lines = [f"class {identifier}(BaseModel):"]
+            lines.append(f"    model_config = ConfigDict({', '.join(config_arguments)})")
+            for field in spec.fields:
+                lines.append(f"    {self.render_class_field(field, field_types[field.name])}")
+            for field_name, validator in validators.items():
+                lines.append(
+                    f"    {field_name}_validator = _format_validator({validator}, {field_name!r})"
+                )
+            self.imports.add("from pydantic import BaseModel")
+        else:
+            lines = [f"{identifier} = create_model("]
+            lines.append(f"    {spec.name!r},")
+            lines.append(f"    __config__=ConfigDict({', '.join(config_arguments)}),")
+            if validators:
+                lines.append("    __validators__={")
+                for field_name, validator in validators.items():
+                    lines.append(
+                        f"        {field_name + '_validator'!r}: "
+                        f"_format_validator({validator}, {field_name!r}),"
+                    )
+                lines.append("    },")
+            lines.append("    **{")
+            for field in spec.fields:
+                lines.append(
+                    f"        {field.name!r}: "
+                    f"{self.render_annotated_field(field, field_types[field.name])},"
+                )
+            lines.append("    },")
+            lines.append(")")
+            self.imports.add("from pydantic import create_model")
+        self.blocks.append("\n".join(lines))
+        self.model_identifiers.append(identifier)
+
+    def shadows_names(self, spec: ModelSpec, field_types: dict[str, str]) -> bool:
+        """
+        Returns whether a field of a model would shadow a name used in the module if declared
+        with class syntax, where `name: T = None` rebinds `name` for the rest of the class body.
+        """
+        used = set(_CLASS_BODY_NAMES)
+        for field_type in field_types.values():
+            used.update(_IDENTIFIER_PATTERN.findall(field_type))
+        return any(field.name in used or field.name in self.identifiers for field in spec.fields)
+
+    def render_field_call(self, constraints: Constraints | dict[str, Any]) -> str:
+        field_kwargs = dict(constraints)
+        if "pattern" in field_kwargs:
+            field_kwargs.update(get_pattern_kwargs(field_kwargs["pattern"]))
+            if isinstance(field_kwargs["pattern"], re.Pattern):
+                self.imports.add("import re")
+        arguments = ", ".join(f"{key}={render_value(value)}" for key, value in field_kwargs.items())
+        return f"Field({arguments})"
+
+    def render_class_field(self, field: FieldSpec, field_type: str) -> str:
+        annotation = field_type
+        if field.constraints:
+            self.imports.update(
+                ["from typing_extensions import Annotated", "from pydantic import Field"]
+            )
+            annotation = f"Annotated[{field_type}, {self.render_field_call(field.constraints)}]"
+        if field.required:
+            return f"{field.name}: {annotation}"
+        return f"{field.name}: {annotation} = {render_value(field.default)}"
+
+    def render_annotated_field(self, field: FieldSpec, field_type: str) -> str:
+        self.imports.update(
+            ["from typing_extensions import Annotated", "from pydantic import Field"]
+        )
+        default = ... if field.required else field.default
+        field_info = {"default": default, **dict(field.constraints)}
+        return f"Annotated[{field_type}, {self.render_field_call(field_info)}]"
+
+    def render(self) -> str:
+        """Returns the source code of the module."""
+        imports = sorted(self.imports, key=lambda line: (not line.startswith("import"), line))
+        import_groups = [
+            [line for line in imports if "pydantic" not in line],
+            [line for line in imports if "pydantic" in line],
+            sorted(self.validator_imports),
+        ]
+        sections = [
+            '"""Generated by pydantic-modelgen."""\n\n'
+            + "\n\n".join("\n".join(_merge_imports(group)) for group in import_groups if group)
+        ]
+        if self.format_validators:
+            sections.append(_FORMAT_VALIDATOR_HELPER)
+        sections.extend(self.blocks)
+        if self.has_forward_refs:
+            sections.append(
+                f"for _model in [{', '.join(self.model_identifiers)}]:\n    _model.model_rebuild()"
+            )
+        exports = ", ".join(repr(identifier) for identifier in dict.fromkeys(self.exports.values()))
+        sections.append(f"__all__ = [{exports}]")
+        return "\n\n\n".join(sections) + "\n"
+
+
+def _merge_imports(lines: list[str]) -> list[str]:
+    """Merges `from x import a` and `from x import b` into `from x import a, b`."""
+    merged: dict[str, list[str]] = {}
+    for line in lines:
+        if line.startswith("from "):
+            module, _, names = line[len("from ") :].partition(" import ")
+            merged.setdefault(f"from {module} import ", []).extend(names.split(", "))
+        else:
+            merged.setdefault(line, [])
+    return [
+        prefix + ", ".join(sorted(set(names), key=lambda name: (name.lower(), name)))
+        if names
+        else prefix
+        for prefix, names in merged.items()
+    ]
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timezone
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any, Literal, NamedTuple
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
+
+from .batch import RecordError, get_record_errors, make_list_type, revalidate_valid_records
+from .context import GenerationContext, get_generation_record
+from .generate_model import lower_schema
+from .ir import EnumType, FieldSpec, ModelSpec, ScalarType
+from .translation.field_type import load_enum_value
+
+Backend = Literal["numpy", "pyarrow"]
+
+# The dtypes of columns of scalar types, by the names of `SCALAR_TYPES`.
+_NUMPY_DTYPES = {
+    "int": "int64",
+    "float": "float64",
+    "bool": "bool",
+    "datetime": "datetime64[us]",
+    "date": "datetime64[D]",
+}
+# The values of null entries, which are masked. NumPy converts `None` to "NaT" for dates.
+_NUMPY_FILLERS: dict[str, Any] = {
+    "int": 0,
+    "float": 0.0,
+    "bool": False,
+    "datetime": None,
+    "date": None,
+}
+# The scalar types whose values pyarrow cannot infer and which are stored as their strings.
+_ARROW_STRING_TYPES = frozenset(("uuid", "ipv4", "ipv6", "uri", "iri"))
+
+# The attribute of a model holding the adapter and specification of `get_columns_adapter`.
+_COLUMNS_ADAPTER_ATTRIBUTE = "__pydanticmodelgen_columns_adapter__"
+
+
+class ColumnarResult(NamedTuple):
+    """
+    The result of `validate_columns`.
+
+    :param columns: One array per field of the model, in field order, with one entry per valid
+        record. Nulls are masked, see `validate_columns`.
+    :param indices: The input index of each valid record.
+    :param errors: One entry per error of an invalid record, see `BatchValidationResult`.
+    """
+
+    columns: dict[str, Any]
+    indices: list[int]
+    errors: list[RecordError]
+
+
+def validate_columns(
+    model: type[BaseModel],
+    records: Iterable[Any],
+    backend: Backend = "numpy",
+    strict: bool | None = None,
+) -> ColumnarResult:
+    """
+    Validates many records against a model and returns the valid ones as typed columns.
+
+    The records are validated like by `validate_many`, but into plain dicts instead of model
+    instances, see `generate_typeadapter`. The values of each field are then converted into one
+    array, typed according to the schema of the field:
+
+    - "integer", "number" and "boolean" become int64, float64 and bool arrays.
+    - "date-time" and "date" become datetime64 arrays, or pyarrow timestamp and date32 arrays.
+      Date-times are converted to UTC; naive ones are assumed to be in UTC already.
+    - Enums become arrays of the dtype of their values, or pyarrow dictionary arrays whose
+      dictionary are the values of the enum in schema order.
+    - All other fields, e.g. strings, nested objects and arrays, become object arrays, or
+      pyarrow arrays of the type pyarrow infers. UUIDs, IP addresses and URLs become pyarrow
+      string arrays, and nested values pyarrow cannot infer are converted as for JSON.
+
+    With NumPy, columns of optional fields and columns containing nulls are masked arrays whose
+    mask is true for the nulls. Pyarrow arrays mark nulls themselves.
+
+    :param model: The model, as returned by `generate_basemodel` or `generate_basemodels`.
+    :param records: The records to validate, e.g. dictionaries.
+    :param backend: Whether to build NumPy or pyarrow arrays. Requires the respective package.
+    :param strict: Whether to validate in strict mode, see `BaseModel.model_validate`.
+    :return: The columns of the valid records and the errors of the invalid ones.
+    :raises TypeError: If the model was not generated from a JSON Schema by this process.
+    :raises ImportError: If the package of the backend is not installed.
+    """
+    if backend not in ("numpy", "pyarrow"):
+        raise ValueError(f"Unknown backend: {backend!r}")
+    if find_spec(backend) is None:
+        raise ImportError(f"validate_columns(backend={backend!r}) requires {backend}")
+    if not isinstance(records, Sequence):
+        records = list(records)
+    adapter, spec = get_columns_adapter(model)
+    try:
+        rows = adapter.validate_python(records, strict=strict)
+    except ValidationError as e:
+        result = revalidate_valid_records(adapter, records, get_record_errors(e), strict)
+        rows, indices, errors = result
+    else:
+        indices, errors = list(range(len(rows))), []
+    create_column = create_numpy_column if backend == "numpy" else create_arrow_column
+    columns = {
+        field_spec.name: create_column([row[field_spec.name] for row in rows], field_spec)
+        for field_spec in spec.fields
+    }
+    return ColumnarResult(columns, indices, errors)
+
+
+def get_columns_adapter(model: type[BaseModel]) -> tuple[TypeAdapter[Any], ModelSpec]:
+    """
+    Returns the `TypeAdapter` validating lists of records of a model into dicts, and the
+    specification of the model.
+
+    The adapter is built from the IR of the model once and released together with the model.
+    """
+    entry = vars(model).get(_COLUMNS_ADAPTER_ATTRIBUTE)
+    if entry is None:
+        record = get_generation_record(model)
+        if record is None:
+            raise TypeError(f"{model.__name__} was not generated from a JSON Schema")
+        context = GenerationContext(
+            record.context.format_validation, record.context.enums, target="typeddict"
+        )
+        typed_dict = lower_schema(record.schema_ir, context)
+        context.rebuild_models()
+        spec = dict(record.schema_ir.definitions)[record.schema_ir.root]
+        entry = (TypeAdapter(make_list_type(typed_dict)), spec)
+        setattr(model, _COLUMNS_ADAPTER_ATTRIBUTE, entry)
+    return entry
+
+
+def get_scalar_name(field_spec: FieldSpec) -> str | None:
+    """
+    Returns the name of the scalar type of a field's values, treating enums of date/time
+    formats like the format, or `None` if the field is not a scalar.
+    """
+    if isinstance(field_spec.type, ScalarType):
+        return field_spec.type.name
+    if isinstance(field_spec.type, EnumType) and field_spec.type.format == "date-time":
+        return "datetime"
+    if isinstance(field_spec.type, EnumType) and field_spec.type.format == "date":
+        return "date"
+    return None
+
+
+def to_utc(value: datetime) -> datetime:
+    """Converts a date-time to a naive one in UTC."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)  # noqa: UP017
+
+
+def is_homogeneous(values: Sequence[Any]) -> bool:
+    """Returns whether all values are of the same type, which excludes `None`."""
+    return len({type(value) for value in values}) == 1 and values[0] is not None
+
+
+def create_numpy_column(values: list[Any], field_spec: FieldSpec) -> Any:
+    numpy = import_module("numpy")
+    mask = numpy.fromiter((value is None for value in values), bool, len(values))
+    name = get_scalar_name(field_spec)
+    if name in _NUMPY_DTYPES:
+        filler = _NUMPY_FILLERS[name]
+        if name == "datetime":
+            values = [value if value is None else to_utc(value) for value in values]
+        data = numpy.array(
+            [filler if value is None else value for value in values], dtype=_NUMPY_DTYPES[name]
+        )
+    elif isinstance(field_spec.type, EnumType) and is_homogeneous(field_spec.type.values):
+        enum_values = numpy.array(field_spec.type.values)
+        filler = enum_values[0]
+        data = numpy.array(
+            [filler if value is None else value for value in values], dtype=enum_values.dtype
+        )
+    else:
+        data = numpy.empty(len(values), dtype=object)
+        data[:] = values
+    if not field_spec.required or mask.any():
+        return numpy.ma.MaskedArray(data, mask=mask)
+    return data
+
+
+def create_arrow_column(values: list[Any], field_spec: FieldSpec) -> Any:
+    pyarrow = import_module("pyarrow")
+    name = get_scalar_name(field_spec)
+    arrow_types = {
+        "int": pyarrow.int64(),
+        "float": pyarrow.float64(),
+        "bool": pyarrow.bool_(),
+        "datetime": pyarrow.timestamp("us", tz="UTC"),
+        "date": pyarrow.date32(),
+        "str": pyarrow.string(),
+    }
+    if name in _ARROW_STRING_TYPES:
+        return pyarrow.array(
+            [None if value is None else str(value) for value in values], pyarrow.string()
+        )
+    if name in arrow_types:
+        if name == "datetime":
+            values = [value if value is None else to_utc(value) for value in values]
+        return pyarrow.array(values, type=arrow_types[name])
+    if isinstance(field_spec.type, EnumType):
+        enum_type = field_spec.type
+        enum_values = [load_enum_value(value, enum_type.format) for value in enum_type.values]
+        codes = {value: code for code, value in enumerate(enum_values)}
+        return pyarrow.DictionaryArray.from_arrays(
+            pyarrow.array(
+                [None if value is None else codes[value] for value in values], pyarrow.int32()
+            ),
+            pyarrow.array(enum_values),
+        )
+    try:
+        return pyarrow.array(values)
+    except pyarrow.ArrowException:
+        # Nested values pyarrow cannot infer, e.g. UUIDs within objects, are stored as JSON.
+        return pyarrow.array(to_jsonable_python(values))
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, List, cast
+
+from .formats import STRICT_FORMAT_TYPES, STRING_FORMATS
+from .ir import (
+    SCALAR_TYPES,
+    ArrayType,
+    Constraints,
+    EnumType,
+    FieldSpec,
+    ModelSpec,
+    ModelType,
+    RefType,
+    ScalarType,
+    SchemaIR,
+    TypeSpec,
+    iter_type_refs,
+    make_constraints,
+)
+from .resolver import SchemaResolver
+from .translation import (
+    handle_array_kwargs,
+    handle_numeric_kwargs,
+    handle_string_kwargs,
+)
+from .translation.field_type import map_schema_to_field_type
+
+_SCALAR_NAMES = {field_type: name for name, field_type in SCALAR_TYPES.items()}
+
+
+def compile_schema(
+    schema: Mapping[str, Any],
+    model_name: str | None = None,
+    schema_store: Mapping[str, Any] | None = None,
+    strict_formats: bool = False,
+) -> SchemaIR:
+    """
+    Compiles a JSON Schema into its intermediate representation (IR).
+
+    The schema is not validated.
+
+    :param schema: The JSON Schema to compile.
+    :param model_name: The name of the root model. If not provided, uses the title of the schema
+        or "DynamicModel".
+    :param schema_store: A mapping of URIs to JSON Schema documents that references to other
+        documents are resolved against.
+    :param strict_formats: Whether to map standard formats to native Pydantic types, see
+        `SchemaCompiler`.
+    :return: The IR of the schema.
+    """
+    model_name = model_name or schema.get("title") or "DynamicModel"
+    return SchemaCompiler(schema_store, strict_formats).compile(schema, model_name)
+
+
+def is_object_schema(schema: Mapping[str, Any]) -> bool:
+    return schema.get("type") == "object" or ("properties" in schema and "type" not in schema)
+
+
+def without_ref(schema: Mapping[str, Any]) -> dict[str, Any]:
+    """Returns the keywords next to a `$ref`, such as "description" or "default"."""
+    return {key: value for key, value in schema.items() if key != "$ref"}
+
+
+def is_strict_format(prop_schema: Mapping[str, Any]) -> bool:
+    """
+    Returns whether a string property can be compiled into the type of its format in the
+    "strict formats" mode, see `formats.STRING_FORMATS`.
+    """
+    string_format = prop_schema.get("format")
+    if string_format not in STRICT_FORMAT_TYPES:
+        return False
+    return string_format in STRING_FORMATS or not any(
+        keyword in prop_schema for keyword in ("minLength", "maxLength", "pattern")
+    )
+
+
+class SchemaCompiler:
+    """
+    Compiles JSON Schemas into their IR.
+
+    Targets of references are compiled once per location, even across multiple schemas compiled
+    by the same compiler.
+
+    :param schema_store: A mapping of URIs to JSON Schema documents that references to other
+        documents are resolved against.
+    :param strict_formats: Whether strings with one of the formats of `STRICT_FORMAT_TYPES`, such
+        as "ipv4" or "email", are compiled into the scalar type of that name, which validates the
+        format, instead of "str".
+    """
+
+    def __init__(
+        self, schema_store: Mapping[str, Any] | None = None, strict_formats: bool = False
+    ) -> None:
+        self.resolver = SchemaResolver(schema_store)
+        self.strict_formats = strict_formats
+        self.definitions: dict[str, ModelSpec | None] = {}
+
+    def add_document(self, uri: str, schema: Mapping[str, Any]) -> str:
+        """Makes a schema available to references from other schemas, see `SchemaResolver`."""
+        return self.resolver.add_document(uri, schema)
+
+    def compile(self, schema: Mapping[str, Any], model_name: str, uri: str = "") -> SchemaIR:
+        """
+        Compiles a whole JSON Schema document.
+
+        :param schema: The JSON Schema to compile.
+        :param model_name: The name of the root model.
+        :param uri: The URI of the schema, used to resolve relative references. Defaults to the
+            `$id` of the schema.
+        :return: The IR of the schema.
+        """
+        base_uri = self.add_document(uri, schema)
+        with self.resolver.in_scope(base_uri):
+            root = self.compile_definition(base_uri, "", schema, model_name)
+        keys = [root.ref]
+        definitions = {}
+        while keys:
+            key = keys.pop()
+            if key in definitions:
+                continue
+            definition = cast(ModelSpec, self.definitions[key])
+            definitions[key] = definition
+            for field in definition.fields:
+                keys.extend(iter_type_refs(field.type))
+        return SchemaIR(root.ref, tuple(definitions.items()))
+
+    def compile_definition(
+        self, document_uri: str, pointer: str, schema: Mapping[str, Any], model_name: str
+    ) -> RefType:
+        """Compiles the target of a reference into a model definition, once per location."""
+        key = f"{document_uri}#{pointer}"
+        if key not in self.definitions:
+            self.definitions[key] = None  # Marks recursive references
+            self.definitions[key] = self.compile_model(schema, model_name)
+        return RefType(key)
+
+    def compile_model(self, schema: Mapping[str, Any], model_name: str) -> ModelSpec:
+        properties: Mapping[str, Mapping[str, Any]] = schema.get("properties", {})
+        required = schema.get("required", [])
+        fields = tuple(
+            self.compile_field(prop_name, prop_schema, prop_name in required)
+            for prop_name, prop_schema in properties.items()
+        )
+        return ModelSpec(
+            model_name,
+            fields,
+            bool(schema.get("additionalProperties", False)),
+            schema.get("title"),
+        )
+
+    def compile_field(
+        self, prop_name: str, prop_schema: Mapping[str, Any], required: bool
+    ) -> FieldSpec:
+        if "$ref" in prop_schema:
+            with self.resolver.resolving(prop_schema["$ref"]) as (uri, pointer, target):
+                if not is_object_schema(target):
+                    return self.compile_field(
+                        prop_name, {**target, **without_ref(prop_schema)}, required
+                    )
+                field_type: TypeSpec = self.compile_reference(uri, pointer, target)
+                constraints = self.compile_constraints(prop_schema, field_type)
+        else:
+            field_type, constraints = self.compile_type(prop_name, prop_schema)
+        return FieldSpec(
+            prop_name,
+            field_type,
+            required=required,
+            default=prop_schema.get("default"),
+            constraints=constraints,
+            format=prop_schema.get("format"),
+        )
+
+    def compile_reference(
+        self, document_uri: str, pointer: str, schema: Mapping[str, Any]
+    ) -> RefType:
+        model_name = schema.get("title") or pointer.rsplit("/", 1)[-1] or "DynamicModel"
+        return self.compile_definition(document_uri, pointer, schema, model_name)
+
+    def compile_type(
+        self, prop_name: str, prop_schema: Mapping[str, Any]
+    ) -> tuple[TypeSpec, Constraints]:
+        """Compiles the type of a property and the constraints of the corresponding field."""
+        field_type: TypeSpec
+        if "enum" in prop_schema:
+            field_type = EnumType(prop_name, prop_schema["enum"], prop_schema.get("format"))
+        elif is_object_schema(prop_schema):
+            model_name = prop_schema.get("title") or prop_name + "Object"
+            field_type = ModelType(self.compile_model(prop_schema, model_name))
+        else:
+            python_type = map_schema_to_field_type(prop_schema)
+            if python_type is List:
+                field_type = self.compile_array(prop_name, prop_schema)
+            elif self.strict_formats and python_type is str and is_strict_format(prop_schema):
+                field_type = ScalarType(prop_schema["format"])
+            else:
+                field_type = ScalarType(_SCALAR_NAMES[python_type])
+        return field_type, self.compile_constraints(prop_schema, field_type)
+
+    def compile_array(self, prop_name: str, prop_schema: Mapping[str, Any]) -> ArrayType:
+        item_name = prop_name + "_item"
+        items_schema = cast("Mapping[str, Any]", prop_schema.get("items", {}))
+        if "$ref" in items_schema:
+            with self.resolver.resolving(items_schema["$ref"]) as (uri, pointer, target):
+                if is_object_schema(target):
+                    return self.make_array(
+                        prop_schema, self.compile_reference(uri, pointer, target)
+                    )
+                item_type, item_constraints = self.compile_type(item_name, target)
+        elif is_object_schema(items_schema):
+            item_type = ModelType(self.compile_model(items_schema, item_name + "Item"))
+            item_constraints = ()
+        else:
+            item_type, item_constraints = self.compile_type(item_name, items_schema)
+        return self.make_array(prop_schema, item_type, item_constraints)
+
+    @staticmethod
+    def make_array(
+        prop_schema: Mapping[str, Any], item_type: TypeSpec, item_constraints: Constraints = ()
+    ) -> ArrayType:
+        return ArrayType(item_type, item_constraints, bool(prop_schema.get("uniqueItems", False)))
+
+    @staticmethod
+    def compile_constraints(prop_schema: Mapping[str, Any], field_type: TypeSpec) -> Constraints:
+        """Compiles the keyword arguments for the Pydantic Field, except for the default."""
+        field_kwargs: dict[str, Any] = {}
+        if "description" in prop_schema:
+            field_kwargs["description"] = prop_schema["description"]
+
+        if isinstance(field_type, ScalarType):
+            if field_type.name in ("int", "float"):
+                handle_numeric_kwargs(prop_schema, field_kwargs)
+            elif field_type.name == "str" or field_type.name in STRING_FORMATS:
+                handle_string_kwargs(prop_schema, field_kwargs)
+        elif isinstance(field_type, ArrayType):
+            handle_array_kwargs(prop_schema, field_kwargs)
+            # Unique items are represented by the type instead.
+            field_kwargs.pop("unique_items", None)
+
+        return make_constraints(field_kwargs)
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Hashable, Mapping
+from typing import (
+    Any,
+    Callable,
+    Literal,
+    NamedTuple,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from pydantic import BaseModel
+from pydantic.dataclasses import is_pydantic_dataclass, rebuild_dataclass
+from typing_extensions import Annotated, get_type_hints, is_typeddict
+
+from .batch_formats import BatchFormatValidator
+from .enums import EnumRegistry
+from .ir import EnumType, FieldSpec, ModelSpec, ModelType, RefType, SchemaIR
+from .lazy import LazyModel
+from .profiling import count, timed
+
+ModelBuilder = Callable[[ModelSpec, "GenerationContext"], Type[BaseModel]]
+FieldBuilder = Callable[[FieldSpec, "GenerationContext"], Any]
+# The kind of classes built for the models of a schema.
+ModelTarget = Literal["model", "dataclass", "typeddict"]
+# Where a model is defined within a run: ("ref", key of the definition) for referenced models,
+# ("model", specification) for nested models.
+Locator = Tuple[str, Union[str, ModelSpec]]  # noqa: UP007
+
+
+class GenerationReport(NamedTuple):
+    """Counts of the models and enums built during a generation run."""
+
+    models_built: int
+    models_shared: int
+    enums_built: int
+    enums_shared: int
+
+    @property
+    def shared(self) -> int:
+        """The total number of models and enums that were reused instead of rebuilt."""
+        return self.models_shared + self.enums_shared
+
+
+class GenerationRecord(NamedTuple):
+    """How a root model was generated, kept with the model for `regenerate_basemodel`."""
+
+    schema_ir: SchemaIR
+    context: GenerationContext
+
+
+_RECORD_ATTRIBUTE = "__pydanticmodelgen_generation__"
+_LOCATOR_ATTRIBUTE = "__pydanticmodelgen_locator__"
+
+
+def get_generation_record(model: type[BaseModel]) -> GenerationRecord | None:
+    """Returns how a root model was generated, or `None` if it was not generated from an IR."""
+    return vars(model).get(_RECORD_ATTRIBUTE)
+
+
+def get_model_locator(model: type[BaseModel]) -> tuple[GenerationContext, Locator] | None:
+    """
+    Returns the context a model was built by and where it is defined within the run, or `None`
+    if it was not generated from an IR.
+    """
+    return vars(model).get(_LOCATOR_ATTRIBUTE)
+
+
+class GenerationContext:
+    """
+    State shared by all models generated from IRs in one run.
+
+    Nested models and enums are keyed by their structure, so that identical ones are only built
+    once and share the same class. Models that are the target of a `$ref` are keyed by their
+    location instead. References to a model that is still being built, as in recursive schemas,
+    are represented by forward references which are resolved by `rebuild_models` once all models
+    exist.
+
+    In lazy mode, nested and referenced models are represented by `LazyModel` annotations and
+    only built when they are first used, possibly long after the run.
+
+    :param format_validation: A mapping of custom format names to validation functions.
+    :param enum_registry: The registry to build enums with. Defaults to a new one for this run.
+    :param lazy: Whether to build nested and referenced models on first use.
+    :param frozen: Whether to build immutable, hashable models with tuples instead of lists.
+    :param target: Whether to build BaseModels, slotted Pydantic dataclasses or TypedDicts.
+    """
+
+    def __init__(
+        self,
+        format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
+        enum_registry: EnumRegistry | None = None,
+        lazy: bool = False,
+        frozen: bool = False,
+        target: ModelTarget = "model",
+    ):
+        self.format_validation = format_validation
+        self.lazy = lazy
+        self.frozen = frozen
+        self.target = target
+        self.lazy_models: dict[Hashable, LazyModel] = {}
+        self.lock = threading.RLock()
+        # Dataclasses check batch format validators per instance, see `lower_model`.
+        self.has_batch_formats = target == "model" and any(
+            isinstance(validator, BatchFormatValidator)
+            for validator in (format_validation or {}).values()
+        )
+        self.definitions: dict[str, ModelSpec] = {}
+        self.field_types: dict[FieldSpec, Any] = {}
+        self.reusable_field_types: dict[FieldSpec, Any] = {}
+        self.fields_reused = 0
+        self.models: dict[Hashable, type[BaseModel]] = {}
+        self.enums = enum_registry if enum_registry is not None else EnumRegistry()
+        self.referenced_models: dict[str, type[BaseModel]] = {}
+        self.forward_refs: dict[str, str] = {}
+        self.namespace: dict[str, type[BaseModel]] = {}
+        self.built_models: list[type[BaseModel]] = []
+        self.models_built = 0
+        self.models_shared = 0
+        self.enums_built = 0
+        self.enums_shared = 0
+        # The hash of this run, computed once all models are built, and its pickled arguments,
+        # computed when a model is first pickled, see `pickling`.
+        self.generation_key: str | None = None
+        self.pickled_generation: bytes | None = None
+
+    def get_enum_type(self, enum_type: EnumType) -> Any:
+        """Returns the type of an enum, reusing one with identical values and format if possible."""
+        enum_class = self.enums.get(enum_type)
+        if enum_class is not None:
+            self.enums_shared += 1
+            return enum_class
+        with timed("enums"):
+            enum_class = self.enums.build(enum_type)
+        self.enums_built += 1
+        count("enums")
+        return enum_class
+
+    def get_field_type(self, field_spec: FieldSpec, build: FieldBuilder) -> Any:
+        """
+        Returns the annotated type of a field, reusing the one of an earlier run if it has been
+        made available in `reusable_field_types`.
+        """
+        field_type = self.reusable_field_types.get(field_spec)
+        if field_type is None:
+            field_type = build(field_spec, self)
+        else:
+            self.fields_reused += 1
+        self.field_types[field_spec] = field_type
+        return field_type
+
+    def get_nested_model(self, spec: ModelSpec, build: ModelBuilder) -> type[BaseModel]:
+        """
+        Returns the model for an inline model specification, building it only if no structurally
+        identical model has been built in this run yet.
+
+        :param spec: The specification of the nested model.
+        :param build: The function building the model.
+        :return: The nested model.
+        """
+        key = spec.structure()
+        model = self.models.get(key)
+        if model is not None:
+            self.models_shared += 1
+            return model
+        model = build(spec, self)
+        setattr(model, _LOCATOR_ATTRIBUTE, (self, ("model", spec)))
+        self.models[key] = model
+        self.models_built += 1
+        count("nested_models")
+        return model
+
+    def get_referenced_model(self, ref: str, build: ModelBuilder) -> type[BaseModel] | str:
+        """
+        Returns the model for a definition, building it once per location.
+
+        :param ref: The key of the definition.
+        :param build: The function building the model.
+        :return: The model, or the name of a forward reference to it if it is still being built.
+        """
+        model = self.referenced_models.get(ref)
+        if model is not None:
+            self.models_shared += 1
+            return model
+        if ref in self.forward_refs:
+            return self.forward_refs[ref]
+        forward_ref = f"_Ref{len(self.forward_refs)}"
+        self.forward_refs[ref] = forward_ref
+        model = build(self.definitions[ref], self)
+        setattr(model, _LOCATOR_ATTRIBUTE, (self, ("ref", ref)))
+        self.referenced_models[ref] = model
+        self.namespace[forward_ref] = model
+        self.models_built += 1
+        count("referenced_models")
+        return model
+
+    def get_lazy_model(
+        self,
+        type_spec: Union[ModelType, RefType],  # noqa: UP007
+        build: ModelBuilder,
+    ) -> Any:
+        """
+        Returns the annotation of a nested or referenced model that is built on first use.
+
+        The models are shared like those of `get_nested_model` and `get_referenced_model`.
+
+        :param type_spec: The type of the nested model or the reference.
+        :param build: The function building the model.
+        :return: An annotation with a `LazyModel`.
+        """
+        if isinstance(type_spec, RefType):
+            key: Hashable = type_spec.ref
+            name = self.definitions[type_spec.ref].name
+        else:
+            key = type_spec.model.structure()
+            name = type_spec.model.name
+        lazy_model = self.lazy_models.get(key)
+        if lazy_model is None:
+            lazy_model = LazyModel(name, lambda: self.build_lazy_model(type_spec, build))
+            self.lazy_models[key] = lazy_model
+        return Annotated[Any, lazy_model]
+
+    def build_lazy_model(
+        self,
+        type_spec: Union[ModelType, RefType],  # noqa: UP007
+        build: ModelBuilder,
+    ) -> type[BaseModel]:
+        """Builds the model of a `LazyModel` once it is used."""
+        with self.lock:
+            if isinstance(type_spec, RefType):
+                model = self.get_referenced_model(type_spec.ref, build)
+            else:
+                model = self.get_nested_model(type_spec.model, build)
+            self.rebuild_models()
+        return cast("type[BaseModel]", model)
+
+    def rebuild_models(self) -> None:
+        """
+        Resolves the forward references of recursive models in a single pass, and registers the
+        models for pickling. It is called once all models of a run are built.
+        """
+        if self.target == "model":
+            # Imported here, since pickling depends on this module.
+            from .pickling import register_models
+
+            register_models(self)
+        with timed("rebuild"):
+            for model in self.built_models:
+                if is_typeddict(model):
+                    # TypedDicts are validated by `TypeAdapter`s, which cannot be given a
+                    # namespace, so their forward references are resolved in place.
+                    model.__annotations__ = get_type_hints(
+                        model, globalns=self.namespace, include_extras=True
+                    )
+                elif model.__pydantic_complete__:
+                    pass
+                elif is_pydantic_dataclass(model):
+                    rebuild_dataclass(model, _types_namespace=self.namespace)
+                else:
+                    model.model_rebuild(_types_namespace=self.namespace)
+
+    def record(self, model: type[BaseModel], schema_ir: SchemaIR) -> None:
+        """Keeps the IR and this context with a root model, see `get_generation_record`."""
+        setattr(model, _RECORD_ATTRIBUTE, GenerationRecord(schema_ir, self))
+
+    def report(self) -> GenerationReport:
+        """Summarizes how many models and enums were built and shared."""
+        return GenerationReport(
+            self.models_built, self.models_shared, self.enums_built, self.enums_shared
+        )
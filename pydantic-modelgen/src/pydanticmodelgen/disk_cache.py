@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Mapping
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+import pydantic
+
+from .cache import schema_fingerprint
+from .ir import IR_FORMAT_VERSION, SchemaIR, node_from_dict
+
+
+@lru_cache(maxsize=None)  # noqa: UP033
+def get_cache_version() -> str:
+    """Returns the versions an on-disk cache entry is only valid for."""
+    try:
+        library_version = version("pydantic-modelgen")
+    except PackageNotFoundError:
+        library_version = "unknown"
+    return f"{library_version}-{pydantic.VERSION}-{IR_FORMAT_VERSION}"
+
+
+class DiskCache:
+    """
+    A persistent cache of compiled schemas in a local directory.
+
+    Stores the intermediate representation (IR) of JSON Schemas as JSON files, so that a new
+    process can generate models from them without resolving references, translating the schema
+    or validating it against the meta-schema again. Entries are keyed by the schema, the
+    arguments influencing the IR and the versions of this library and Pydantic, so upgrading
+    either invalidates the cache.
+
+    :param directory: The directory to store the cache entries in. It is created if necessary.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def make_key(
+        self,
+        schema: Mapping[str, Any],
+        validate_schema: bool = True,
+        model_name: str | None = None,
+        schema_store: Mapping[str, Any] | None = None,
+        strict_formats: bool = False,
+    ) -> str:
+        """
+        Builds the key of the cache entry for the given arguments of `generate_basemodel`.
+
+        If a schema store is given, its whole content is part of the key.
+        """
+        parts = [
+            get_cache_version(),
+            schema_fingerprint(schema),
+            repr(model_name),
+            repr(validate_schema),
+            "" if schema_store is None else schema_fingerprint(schema_store),
+            repr(strict_formats),
+        ]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def load(self, key: str) -> SchemaIR | None:
+        """Returns the IR stored under the key, or `None` if there is no (readable) entry."""
+        try:
+            data = json.loads(self._path(key).read_bytes())
+            return node_from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def store(self, key: str, schema_ir: SchemaIR) -> None:
+        """
+        Stores an IR under the key.
+
+        The entry is written to a temporary file first and then moved into place, so concurrent
+        processes never read partially written entries.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                json.dump(schema_ir.to_dict(), file, separators=(",", ":"))
+            os.replace(temporary_path, self._path(key))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        for path in self.directory.glob("*.json"):
+            path.unlink()
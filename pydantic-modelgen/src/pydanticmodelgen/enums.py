@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections.abc import Hashable
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Literal, cast
+
+from pydantic import AfterValidator, GetCoreSchemaHandler, WithJsonSchema
+from pydantic_core import CoreSchema, core_schema
+from typing_extensions import Annotated
+
+from .ir import EnumType, freeze
+from .registry import get_scoped_name, register
+from .translation.field_type import create_enum_type, load_enum_value
+
+_FORMAT_TYPES: dict[str, type] = {"date-time": datetime, "date": date, "time": time}
+
+
+def is_literal_value(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def create_compact_enum_type(enum_type: EnumType) -> Any:
+    """
+    Creates a type accepting the values of an enum without creating an Enum class.
+
+    Enums of date/time formats become the date/time type restricted to the values, all others
+    `Literal` types. Both are validated by hash lookups and, unlike Enum classes with thousands
+    of members, are cheap to create and small in memory.
+
+    :param enum_type: The enum.
+    :return: The type, or `None` if the values cannot be represented compactly.
+    """
+    if enum_type.format in _FORMAT_TYPES:
+        allowed = frozenset(load_enum_value(value, enum_type.format) for value in enum_type.values)
+        name = enum_type.name
+
+        def check_value(value: Any) -> Any:
+            if value not in allowed:
+                raise ValueError(f"Input should be one of the {len(allowed)} values of '{name}'")
+            return value
+
+        json_schema = {"type": "string", "format": enum_type.format, "enum": list(enum_type.values)}
+        field_type = _FORMAT_TYPES[enum_type.format]
+        return Annotated[field_type, AfterValidator(check_value), WithJsonSchema(json_schema)]
+    if all(is_literal_value(value) for value in enum_type.values):
+        return Literal[enum_type.values]  # type: ignore[valid-type]
+    return None
+
+
+class EnumValueSerialization:
+    """
+    Serializes the values of an Enum field without calling into Python.
+
+    Pydantic serializes Enum fields with a Python function that extracts the values of the
+    members. Generated models store the values themselves, see `use_enum_values`, so they can be
+    serialized natively by inferring their types.
+    """
+
+    def __get_pydantic_core_schema__(
+        self, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        schema = cast("dict[str, Any]", handler(source_type))
+        schema["serialization"] = core_schema.simple_ser_schema("any")
+        return cast(CoreSchema, schema)
+
+
+_ENUM_VALUE_SERIALIZATION = EnumValueSerialization()
+
+
+def annotate_enum_type(enum_class: Any) -> Any:
+    """Returns the type of an enum field, see `EnumValueSerialization`."""
+    if isinstance(enum_class, type) and issubclass(enum_class, Enum):
+        return Annotated[enum_class, _ENUM_VALUE_SERIALIZATION]
+    return enum_class
+
+
+def get_registered_name(enum_class: type[Enum], enum_type: EnumType) -> str:
+    """
+    Returns the name under which an Enum class is registered for pickling. It is scoped by a
+    hash of the enum, so that every process creating the same enum uses the same name, while
+    the qualified name of the class, e.g. in JSON Schemas, stays its plain name.
+    """
+    name = enum_class.__name__
+    typed_values = [[type(value).__name__, value] for value in enum_type.values]
+    data = json.dumps([name, typed_values, enum_type.format], default=repr)
+    return get_scoped_name(name, hashlib.sha256(data.encode()).hexdigest())
+
+
+class EnumRegistry:
+    """
+    Builds the types of enums once and shares them between all models generated with it.
+
+    Enums are keyed by their values and format, so properties with identical enums share one
+    type regardless of their names; the type is named after the first property.
+
+    Every generation run shares enums between the models it builds. Pass the same registry to
+    multiple runs, e.g. `generate_basemodel(..., enum_registry=registry)`, to share them across
+    runs as well.
+
+    :param large_enum_threshold: Enums with more values than this are not represented by Enum
+        classes but by `Literal` types, or for date/time formats by the date/time type
+        restricted to the values. Validated values are the same as with Enum classes, since
+        generated models store the values of enum members anyway. `None` always uses Enum
+        classes.
+    """
+
+    def __init__(self, large_enum_threshold: int | None = None) -> None:
+        self.large_enum_threshold = large_enum_threshold
+        self._types: dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    @staticmethod
+    def make_key(enum_type: EnumType) -> Hashable:
+        """
+        Returns the key of an enum in the registry. The values are frozen as (type, value) pairs,
+        so e.g. `[1, 0]` and `[True, False]` get different types.
+        """
+        return freeze(enum_type.values), enum_type.format
+
+    def get(self, enum_type: EnumType) -> Any | None:
+        """Returns the type of an enum if it has been built already."""
+        return self._types.get(self.make_key(enum_type))
+
+    def build(self, enum_type: EnumType) -> Any:
+        """
+        Builds and stores the type of an enum.
+
+        If another thread has built it in the meantime, its type is returned instead, so that
+        all models generated with the registry share it.
+        """
+        key = self.make_key(enum_type)
+        with self._lock:
+            enum_class = self._types.get(key)
+            if enum_class is None:
+                enum_class = self._create(enum_type)
+                self._types[key] = enum_class
+        return enum_class
+
+    def _create(self, enum_type: EnumType) -> Any:
+        enum_class = None
+        if (
+            self.large_enum_threshold is not None
+            and len(enum_type.values) > self.large_enum_threshold
+        ):
+            enum_class = create_compact_enum_type(enum_type)
+        if enum_class is None:
+            enum_class = create_enum_type(
+                enum_type.name, {"enum": list(enum_type.values), "format": enum_type.format}
+            )
+            register(enum_class, get_registered_name(enum_class, enum_type))
+        return enum_class
+
+    def clear(self) -> None:
+        """Removes all enums."""
+        self._types.clear()
@@ -4,3 +4,11 @@ class SchemaConversionError(Exception):
 
 class EnumConversionError(Exception):
     """Raised when there's an error converting an enum value to a Pydantic field."""
+
+
+class UnresolvableReferenceError(SchemaConversionError):
+    """Raised when a `$ref` in a JSON schema cannot be resolved."""
+
+
+class CodeGenerationError(Exception):
+    """Raised when Python source code cannot be generated for a JSON schema."""
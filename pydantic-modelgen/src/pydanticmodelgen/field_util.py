@@ -1,24 +1,43 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import Annotated, Any, List, Set
+from typing import Any, FrozenSet, List, Set, Tuple
 
 from pydantic import Field, field_validator
+from pydantic.fields import FieldInfo
+from typing_extensions import Annotated, get_args, get_origin
 
 
-def validation_decorator(validator_func: Callable[[Any], bool], prop_name: str) -> classmethod:
-    """Creates a Pydantic validator from a function."""
+def create_format_check(
+    validator_func: Callable[[Any], bool], prop_name: str
+) -> Callable[[Any], Any]:
+    """Creates a function that returns valid values and raises a `ValueError` otherwise."""
 
-    def validation_method(cls, value: Any) -> Any:
+    def check_format(value: Any) -> Any:
         if not validator_func(value):
             raise ValueError(f"Invalid value for format in field '{prop_name}': {value}")
         return value
 
+    return check_format
+
+
+def validation_decorator(validator_func: Callable[[Any], bool], prop_name: str) -> classmethod:
+    """Creates a Pydantic validator from a function."""
+    check_format = create_format_check(validator_func, prop_name)
+
+    def validation_method(cls, value: Any) -> Any:
+        return check_format(value)
+
     return field_validator(prop_name)(validation_method)  # type: ignore
 
 
-def annotate_field_type(field_type: Any, field_info: dict[str, Any]) -> Any:
-    """Creates a Pydantic Field with the given type and information."""
+def annotate_field_type(field_type: Any, field_info: dict[str, Any], frozen: bool = False) -> Any:
+    """
+    Creates a Pydantic Field with the given type and information.
+
+    With `frozen`, arrays become tuples and frozensets instead of lists and sets, so that they
+    are immutable and hashable.
+    """
     if field_type is List and "item_type" in field_info:
         item_type = field_info.pop("item_type")
         item_field = field_info.pop("item_field", Field())
@@ -26,7 +45,26 @@ def annotate_field_type(field_type: Any, field_info: dict[str, Any]) -> Any:
 
         # Pydantic uses `set` for `unique_items`, see
         # https://github.com/pydantic/pydantic-core/issues/296.
-        field_type = Set[item_type] if field_info.pop("unique_items", False) else List[item_type]  # type: ignore
+        if field_info.pop("unique_items", False):
+            field_type = FrozenSet[item_type] if frozen else Set[item_type]  # type: ignore
+        else:
+            field_type = Tuple[item_type, ...] if frozen else List[item_type]  # type: ignore
 
     field_type = Annotated[field_type, Field(**field_info)]
     return field_type
+
+
+def as_field_definition(field_type: Any) -> tuple[Any, Any]:
+    """
+    Converts a field type built by `annotate_field_type` into a `(type, default)` definition
+    for `create_model`.
+
+    Before Pydantic 2.11, `create_model` only keeps the first metadata of `Annotated` field
+    types, which drops the `Field` of types that are annotated already, such as enums or
+    constrained strings. The type is kept whole, since splitting off the `Field` would merge
+    its constraints with those of the type instead of applying both.
+    """
+    metadata = get_args(field_type)[1:] if get_origin(field_type) is Annotated else ()
+    if metadata and isinstance(metadata[-1], FieldInfo):
+        return field_type, metadata[-1].default
+    return field_type, ...
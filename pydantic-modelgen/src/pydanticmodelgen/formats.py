@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from importlib.util import find_spec
+from ipaddress import IPv4Address, IPv6Address
+from typing import Any
+
+from pydantic import AnyUrl, StringConstraints
+from typing_extensions import Annotated
+
+# A pragmatic check of the shape of e-mail addresses, used if `email-validator` is missing.
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+HOSTNAME_PATTERN = (
+    r"^[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?"
+    r"(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)*\.?$"
+)
+JSON_POINTER_PATTERN = r"^(?:/(?:[^~/]|~[01])*)*$"
+
+
+def has_email_validator() -> bool:
+    """Returns whether `email-validator`, which `EmailStr` requires, is installed."""
+    return find_spec("email_validator") is not None
+
+
+def get_email_type() -> Any:
+    """Returns `pydantic.EmailStr`, or a string with a pattern if `email-validator` is missing."""
+    if has_email_validator():
+        from pydantic import EmailStr
+
+        return EmailStr
+    return Annotated[str, StringConstraints(pattern=EMAIL_PATTERN)]
+
+
+# The types of the "strict formats" mode by format. Most of them are validated by
+# pydantic-core without calling back into Python.
+STRICT_FORMAT_TYPES: dict[str, Any] = {
+    "email": get_email_type(),
+    "idn-email": get_email_type(),
+    "ipv4": IPv4Address,
+    "ipv6": IPv6Address,
+    "uri": AnyUrl,
+    "iri": AnyUrl,
+    "duration": timedelta,
+    "hostname": Annotated[str, StringConstraints(pattern=HOSTNAME_PATTERN, max_length=253)],
+    "json-pointer": Annotated[str, StringConstraints(pattern=JSON_POINTER_PATTERN)],
+}
+
+# The strict formats whose types are strings, so that "minLength", "maxLength" and "pattern"
+# still apply to them. Properties with other strict formats and these keywords keep the type
+# `str` and are validated as in the default mode.
+STRING_FORMATS = frozenset(("email", "idn-email", "hostname", "json-pointer"))
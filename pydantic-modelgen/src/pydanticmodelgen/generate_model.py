@@ -1,18 +1,63 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable, Mapping
-from typing import Any, List, cast
+from functools import partial
+from typing import Any, List, NamedTuple, cast
 
-from jsonschema import Draft7Validator, validate
-from pydantic import BaseModel, ConfigDict, Field, create_model
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    create_model,
+    with_config,
+)
+from pydantic.dataclasses import dataclass
+from typing_extensions import Annotated, NotRequired, Required, TypedDict
 
-from .field_util import annotate_field_type, validation_decorator
-from .translation import (
-    get_field_type,
-    handle_array_kwargs,
-    handle_numeric_kwargs,
-    handle_string_kwargs,
+from .batch_formats import (
+    BatchFormatValidator,
+    FormatPlan,
+    create_batch_format_validator,
+    register_format_plan,
+)
+from .cache import ModelCache
+from .compiler import SchemaCompiler, compile_schema
+from .context import GenerationContext, GenerationReport
+from .disk_cache import DiskCache
+from .enums import EnumRegistry, annotate_enum_type
+from .field_util import (
+    annotate_field_type,
+    as_field_definition,
+    create_format_check,
+    validation_decorator,
+)
+from .formats import STRICT_FORMAT_TYPES
+from .ir import (
+    SCALAR_TYPES,
+    ArrayType,
+    Constraints,
+    EnumType,
+    FieldSpec,
+    ModelSpec,
+    ModelType,
+    RefType,
+    SchemaIR,
+    TypeSpec,
 )
+from .patterns import get_pattern_kwargs
+from .pickling import reduce_model_instance
+from .profiling import count, timed, timed_property
+from .validation import validate_json_schema
+
+
+class BatchResult(NamedTuple):
+    """The result of `generate_basemodels`."""
+
+    models: dict[str, type[BaseModel]]
+    report: GenerationReport
 
 
 def generate_basemodel(
@@ -20,6 +65,13 @@ def generate_basemodel(
     validate_schema: bool = True,
     model_name: str | None = None,
     format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
+    cache: ModelCache | None = None,
+    schema_store: Mapping[str, Any] | None = None,
+    disk_cache: DiskCache | None = None,
+    enum_registry: EnumRegistry | None = None,
+    strict_formats: bool = False,
+    lazy: bool = False,
+    frozen: bool = False,
 ) -> type[BaseModel]:
     """
     Generates a Pydantic BaseModel from a JSON Schema.
@@ -31,103 +83,396 @@ def generate_basemodel(
     :param format_validation: A mapping of custom format names to validation functions.
         The functions are assumed to take the value and return whether or not they are valid based
         on the format.
+    :param cache: An optional `ModelCache`. If the same schema has already been converted with the
+        same arguments, the cached model is returned instead of building a new one. Concurrent
+        calls for the same missing model build it only once.
+    :param schema_store: A mapping of URIs to JSON Schema documents that references to other
+        documents, such as "address.json#/definitions/Address", are resolved against. See
+        `load_schema_store` to load all JSON Schemas of a directory.
+    :param disk_cache: An optional `DiskCache`. The compiled schema is loaded from it if present,
+        skipping validation and compilation, and stored in it otherwise.
+    :param enum_registry: An optional `EnumRegistry` to share enums with other generation runs
+        or to represent large enums compactly.
+    :param strict_formats: Whether to validate the standard formats "email", "idn-email", "ipv4",
+        "ipv6", "uri", "iri", "duration", "hostname" and "json-pointer" with native Pydantic types
+        such as `IPv4Address` or `AnyUrl` instead of accepting any string. Validated values are of
+        these types. "minLength", "maxLength" and "pattern" still apply to the string formats
+        "email", "idn-email", "hostname" and "json-pointer"; strings of the other formats with
+        these keywords remain plain strings, validated as without this option.
+        "email" requires the optional `email-validator` package for full validation; without it,
+        only the basic shape of addresses is checked.
+    :param lazy: Whether to build nested and referenced models only when a field holding them is
+        first validated, so that generating models of large schemas only pays for the parts that
+        are actually used. Such fields are validated by calling into Python, their instances are
+        not validated in strict mode, and only the root model is returned right away.
+    :param frozen: Whether to generate immutable models. Their instances are hashable, since
+        arrays are validated into tuples, or frozensets for "uniqueItems", instead of lists and
+        sets. See `generate_dataclass` for a representation with less memory per instance.
     :return: The generated Pydantic BaseModel.
     """
 
-    if validate_schema:
-        validate(schema, Draft7Validator.META_SCHEMA)
+    if cache is not None:
+        key = cache.make_key(
+            schema,
+            validate_schema,
+            model_name,
+            format_validation,
+            schema_store,
+            enum_registry,
+            strict_formats,
+            lazy,
+            frozen,
+        )
+        build = partial(
+            generate_basemodel,
+            schema,
+            validate_schema,
+            model_name,
+            format_validation=format_validation,
+            schema_store=schema_store,
+            disk_cache=disk_cache,
+            enum_registry=enum_registry,
+            strict_formats=strict_formats,
+            lazy=lazy,
+            frozen=frozen,
+        )
+        return cache.get_or_build(key, build, format_validation, schema_store)
 
-    fields, validators = create_fields_and_validators_from_schema(
-        schema, format_validation=format_validation
+    schema_ir = load_schema_ir(
+        schema, validate_schema, model_name, schema_store, disk_cache, strict_formats
     )
-    model_name = model_name or schema.get("title") or "DynamicModel"  # Default model name
-    config_dict = ConfigDict(
-        extra="allow" if schema.get("additionalProperties", False) else "ignore",
-        use_enum_values=True,
+    return generate_basemodel_from_ir(
+        schema_ir,
+        format_validation=format_validation,
+        enum_registry=enum_registry,
+        lazy=lazy,
+        frozen=frozen,
     )
-    result = create_model(model_name, __config__=config_dict, __validators__=validators, **fields)
-    return result
 
 
-def create_fields_and_validators_from_schema(
+def load_schema_ir(
+    schema: Mapping[str, Any],
+    validate_schema: bool,
+    model_name: str | None,
+    schema_store: Mapping[str, Any] | None,
+    disk_cache: DiskCache | None,
+    strict_formats: bool,
+) -> SchemaIR:
+    """Validates and compiles a JSON Schema, or loads its IR from the disk cache."""
+    schema_ir = None
+    if disk_cache is not None:
+        disk_key = disk_cache.make_key(
+            schema, validate_schema, model_name, schema_store, strict_formats
+        )
+        with timed("disk_cache"):
+            schema_ir = disk_cache.load(disk_key)
+
+    if schema_ir is None:
+        if validate_schema:
+            with timed("meta_validation"):
+                validate_json_schema(schema)
+        with timed("compile"):
+            schema_ir = compile_schema(
+                schema,
+                model_name=model_name,
+                schema_store=schema_store,
+                strict_formats=strict_formats,
+            )
+        if disk_cache is not None:
+            with timed("disk_cache"):
+                disk_cache.store(disk_key, schema_ir)
+    return schema_ir
+
+
+def generate_dataclass(
+    schema: Mapping[str, Any],
+    validate_schema: bool = True,
+    model_name: str | None = None,
+    format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
+    schema_store: Mapping[str, Any] | None = None,
+    disk_cache: DiskCache | None = None,
+    enum_registry: EnumRegistry | None = None,
+    strict_formats: bool = False,
+    frozen: bool = False,
+) -> type[Any]:
+    """
+    Generates a Pydantic dataclass with `__slots__` from a JSON Schema.
+
+    Instances of slotted dataclasses have no `__dict__` and no storage for extra properties, so
+    they take considerably less memory than BaseModel instances. They are validated when they
+    are created, with keyword arguments only, and by `pydantic.TypeAdapter`. Properties not in
+    the schema are ignored even if "additionalProperties" is true, and batch format validators
+    check each instance on its own. Requires Python 3.10 or newer.
+
+    See `generate_basemodel` for the parameters.
+
+    :return: The generated Pydantic dataclass.
+    :raises RuntimeError: If the Python version does not support slotted dataclasses.
+    """
+    if sys.version_info < (3, 10):  # noqa: UP036
+        raise RuntimeError("Generating dataclasses with __slots__ requires Python 3.10")
+    schema_ir = load_schema_ir(
+        schema, validate_schema, model_name, schema_store, disk_cache, strict_formats
+    )
+    context = GenerationContext(format_validation, enum_registry, frozen=frozen, target="dataclass")
+    model = lower_schema(schema_ir, context)
+    context.rebuild_models()
+    return model
+
+
+def generate_typeadapter(
     schema: Mapping[str, Any],
+    validate_schema: bool = True,
+    model_name: str | None = None,
+    format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
+    schema_store: Mapping[str, Any] | None = None,
+    disk_cache: DiskCache | None = None,
+    enum_registry: EnumRegistry | None = None,
+    strict_formats: bool = False,
+) -> TypeAdapter[Any]:
+    """
+    Generates a Pydantic TypeAdapter validating JSON Schema instances into plain dicts.
+
+    Objects are represented by TypedDicts instead of BaseModels, so `validate_python` and
+    `validate_json` return dicts, including nested ones, without creating any model instances.
+    The dicts are equal to the `model_dump` of the instances of the corresponding BaseModel:
+    missing optional properties are filled in with their defaults, and additional properties
+    are kept if "additionalProperties" is true. Batch format validators check each value on
+    its own.
+
+    See `generate_basemodel` for the parameters.
+
+    :return: The TypeAdapter of the root TypedDict.
+    """
+    schema_ir = load_schema_ir(
+        schema, validate_schema, model_name, schema_store, disk_cache, strict_formats
+    )
+    context = GenerationContext(format_validation, enum_registry, target="typeddict")
+    typed_dict = lower_schema(schema_ir, context)
+    context.rebuild_models()
+    return TypeAdapter(typed_dict)
+
+
+def generate_basemodel_from_ir(
+    schema_ir: SchemaIR,
+    format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
+    enum_registry: EnumRegistry | None = None,
+    lazy: bool = False,
+    frozen: bool = False,
+) -> type[BaseModel]:
+    """
+    Generates a Pydantic BaseModel from the intermediate representation of a JSON Schema.
+
+    :param schema_ir: The IR as returned by `compile_schema`.
+    :param format_validation: A mapping of custom format names to validation functions, see
+        `generate_basemodel`.
+    :param enum_registry: An optional `EnumRegistry`, see `generate_basemodel`.
+    :param lazy: Whether to build nested models on first use, see `generate_basemodel`.
+    :param frozen: Whether to generate immutable, hashable models, see `generate_basemodel`.
+    :return: The generated Pydantic BaseModel.
+    """
+    context = GenerationContext(format_validation, enum_registry, lazy, frozen)
+    model = lower_schema(schema_ir, context)
+    context.rebuild_models()
+    context.record(model, schema_ir)
+    return model
+
+
+def generate_basemodels(
+    schemas: Mapping[str, Mapping[str, Any]],
+    validate_schema: bool = True,
     format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
-) -> tuple[dict[str, Any], dict[str, classmethod]]:
+    schema_store: Mapping[str, Any] | None = None,
+    enum_registry: EnumRegistry | None = None,
+    strict_formats: bool = False,
+    lazy: bool = False,
+    frozen: bool = False,
+) -> BatchResult:
+    """
+    Generates Pydantic BaseModels for many JSON Schemas at once.
+
+    Identical nested object schemas and enums are only converted once for the whole batch and
+    the resulting classes are shared between all models that use them. The schemas can reference
+    each other by their names, e.g. `{"$ref": "Address"}`.
+
+    :param schemas: A mapping of model names to the JSON Schemas to convert.
+    :param validate_schema: Whether to validate the JSON Schemas. Defaults to True.
+    :param format_validation: A mapping of custom format names to validation functions, see
+        `generate_basemodel`.
+    :param schema_store: A mapping of URIs to additional JSON Schema documents that references
+        are resolved against, see `generate_basemodel`.
+    :param enum_registry: An optional `EnumRegistry`, see `generate_basemodel`.
+    :param strict_formats: Whether to validate standard formats with native Pydantic types, see
+        `generate_basemodel`.
+    :param lazy: Whether to build nested models on first use, see `generate_basemodel`. The
+        report only counts the models built so far.
+    :param frozen: Whether to generate immutable, hashable models, see `generate_basemodel`.
+    :return: The generated models by name and a report on how many nested models and enums were
+        shared.
+    """
+    if validate_schema:
+        with timed("meta_validation"):
+            for schema in schemas.values():
+                validate_json_schema(schema)
+
+    compiler = SchemaCompiler(schema_store, strict_formats)
+    for name, schema in schemas.items():
+        compiler.add_document(name, schema)
+    context = GenerationContext(format_validation, enum_registry, lazy, frozen)
+    models = {}
+    for name, schema in schemas.items():
+        with timed("compile"):
+            schema_ir = compiler.compile(schema, name, uri=name)
+        models[name] = lower_schema(schema_ir, context)
+        context.record(models[name], schema_ir)
+    context.rebuild_models()
+    return BatchResult(models, context.report())
+
+
+def lower_schema(schema_ir: SchemaIR, context: GenerationContext) -> type[BaseModel]:
+    """Builds the root model of an IR, sharing models and enums with the context."""
+    context.definitions.update(schema_ir.definitions)
+    return cast("type[BaseModel]", context.get_referenced_model(schema_ir.root, lower_model))
+
+
+def lower_model(spec: ModelSpec, context: GenerationContext) -> type[BaseModel]:
     fields: dict[str, Any] = {}
     validators: dict[str, classmethod] = {}
-    properties: dict[str, dict[str, Any]] = schema.get("properties", {})
-    for prop_name, prop_schema in properties.items():
-        required = prop_name in schema.get("required", [])
-        field, validator = create_field_and_validator_from_properties(
-            prop_name, prop_schema, required=required, format_validation=format_validation
+    batch_fields: dict[str, BatchFormatValidator] = {}
+    for field_spec in spec.fields:
+        with timed_property(spec.name, field_spec.name):
+            fields[field_spec.name] = context.get_field_type(field_spec, lower_field)
+        format_validation = context.format_validation
+        format_name = field_spec.format
+        if format_validation and format_name is not None and format_name in format_validation:
+            validator = format_validation[format_name]
+            if isinstance(validator, BatchFormatValidator) and context.target == "model":
+                batch_fields[field_spec.name] = validator
+            elif context.target == "typeddict":
+                check = AfterValidator(create_format_check(validator, field_spec.name))
+                fields[field_spec.name] = Annotated[fields[field_spec.name], check]
+                count("validators")
+            else:
+                validators[field_spec.name + "_validator"] = validation_decorator(
+                    validator, field_spec.name
+                )
+    if batch_fields:
+        validators["batch_format_validator"] = create_batch_format_validator(batch_fields)
+    if context.target == "dataclass":
+        with timed("create_model"):
+            result = create_dataclass(spec.name, fields, validators, context.frozen)
+    elif context.target == "typeddict":
+        with timed("create_model"):
+            result = create_typed_dict(spec, fields)
+    else:
+        config_dict = ConfigDict(
+            extra="allow" if spec.additional_properties else "ignore",
+            use_enum_values=True,
+            frozen=context.frozen,
         )
-        fields[prop_name] = field
-        if validator is not None:
-            validators[prop_name + "_validator"] = validator
-    return fields, validators
+        with timed("create_model"):
+            definitions = {name: as_field_definition(type_) for name, type_ in fields.items()}
+            result = create_model(
+                spec.name, __config__=config_dict, __validators__=validators, **definitions
+            )
+        result.__reduce__ = reduce_model_instance  # type: ignore[method-assign,assignment]
+    if context.has_batch_formats:
+        nested = tuple(field.name for field in spec.fields if contains_models(field.type))
+        if batch_fields or nested:
+            register_format_plan(result, FormatPlan(tuple(batch_fields.items()), nested))
+    context.built_models.append(result)
+    count("models")
+    count("fields", len(fields))
+    count("validators", len(validators))
+    return result
 
 
-def create_field_and_validator_from_properties(
-    prop_name: str,
-    prop_schema: Mapping[str, Any],
-    required: bool,
-    format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
-) -> tuple[Any, classmethod | None]:
-    field_type = get_field_type(prop_name, prop_schema)
+def create_dataclass(
+    name: str, fields: dict[str, Any], validators: dict[str, classmethod], frozen: bool
+) -> Any:
+    """
+    Creates a Pydantic dataclass with `__slots__` and keyword-only fields.
+
+    Slotted instances have no `__dict__`, so properties not in the schema are always ignored.
+    """
+    namespace: dict[str, Any] = {"__annotations__": fields, "__module__": __name__, **validators}
+    config_dict = ConfigDict(extra="ignore", use_enum_values=True)
+    decorate = dataclass(config=config_dict, frozen=frozen, slots=True, kw_only=True)  # type: ignore[call-overload]
+    return decorate(type(name, (), namespace))
 
-    field_kwargs = get_field_kwargs(prop_name, prop_schema, field_type)
-    default_value = prop_schema.get("default")
-    field_info = {"default": ... if required else default_value, **field_kwargs}
-    field = annotate_field_type(field_type, field_info)
 
-    validator = None
-    if format_validation and "format" in prop_schema:
-        format_name = prop_schema["format"]
-        if format_name in format_validation:
-            validator = validation_decorator(format_validation[format_name], prop_name)
+def create_typed_dict(spec: ModelSpec, fields: dict[str, Any]) -> Any:
+    """
+    Creates a TypedDict whose keys are required exactly if the properties are.
 
-    return field, validator
+    Pydantic fills in the defaults of missing optional keys, so validated dicts have the same
+    keys as the dumps of the corresponding BaseModel.
+    """
+    annotations = {
+        field_spec.name: (Required if field_spec.required else NotRequired)[fields[field_spec.name]]
+        for field_spec in spec.fields
+    }
+    typed_dict = TypedDict(spec.name, annotations, total=False)  # type: ignore[misc]
+    config_dict = ConfigDict(
+        extra="allow" if spec.additional_properties else "ignore", use_enum_values=True
+    )
+    return with_config(config_dict)(typed_dict)
 
 
-def get_field_kwargs(
-    prop_name: str, prop_schema: Mapping[str, Any], field_type: Any
-) -> dict[str, Any]:
-    """Generates keyword arguments for the Pydantic Field."""
+def lower_field(field_spec: FieldSpec, context: GenerationContext) -> Any:
+    default = field_spec.default
+    if context.frozen and isinstance(default, list):
+        default = (
+            frozenset(default) if getattr(field_spec.type, "unique", False) else tuple(default)
+        )
+    field_info = {
+        "default": ... if field_spec.required else default,
+        **lower_constraints(field_spec.constraints),
+    }
+    if isinstance(field_spec.type, ArrayType):
+        field_info.update(get_item_field_info(field_spec.type, context))
+        return annotate_field_type(List, field_info, context.frozen)
+    return annotate_field_type(lower_type(field_spec.type, context), field_info)
 
-    field_kwargs: dict[str, Any] = {}
-    if "description" in prop_schema:
-        field_kwargs["description"] = prop_schema["description"]
 
-    if field_type in [int, float]:
-        handle_numeric_kwargs(prop_schema, field_kwargs)
-    elif field_type is str:
-        handle_string_kwargs(prop_schema, field_kwargs)
-    elif field_type is List:
-        handle_item_type(prop_name, prop_schema, field_kwargs)
-        handle_array_kwargs(prop_schema, field_kwargs)
+def get_item_field_info(array_type: ArrayType, context: GenerationContext) -> dict[str, Any]:
+    """Returns the keys `annotate_field_type` uses to build the type of a list or set."""
+    item_field_info: dict[str, Any] = {
+        "item_type": lower_type(array_type.items, context),
+        "unique_items": array_type.unique,
+    }
+    if array_type.item_constraints:
+        item_field_info["item_field"] = Field(**lower_constraints(array_type.item_constraints))
+    return item_field_info
 
+
+def contains_models(type_spec: TypeSpec) -> bool:
+    """Returns whether values of a type contain model instances."""
+    if isinstance(type_spec, ArrayType):
+        return contains_models(type_spec.items)
+    return isinstance(type_spec, (ModelType, RefType))
+
+
+def lower_constraints(constraints: Constraints) -> dict[str, Any]:
+    """Converts constraints of the IR into keyword arguments for `pydantic.Field`."""
+    field_kwargs = dict(constraints)
+    if "pattern" in field_kwargs:
+        field_kwargs.update(get_pattern_kwargs(field_kwargs["pattern"]))
     return field_kwargs
 
 
-def handle_item_type(
-    prop_name: str, prop_schema: Mapping[str, Any], field_kwargs: dict[str, Any]
-) -> None:
-    # Get array item type and additional field parameters for items
-    item_type, item_field_kwargs = get_field_type_and_kwargs_for_array_items(
-        prop_name + "_item", cast(Mapping[str, Any], prop_schema.get("items", {}))
-    )
-    field_kwargs["item_type"] = item_type
-    if item_field_kwargs:
-        field_kwargs["item_field"] = Field(**item_field_kwargs)
-
-
-def get_field_type_and_kwargs_for_array_items(prop_name: str, prop_schema: Mapping[str, Any]):
-    if "$ref" in prop_schema:
-        item_type = generate_basemodel(prop_schema["$ref"], validate_schema=False)
-        return item_type, {}
-    if prop_schema.get("type") == "object":
-        item_type = generate_basemodel(prop_schema, model_name=prop_name + "Item")
-        return item_type, {}
-    item_type = get_field_type(prop_name, prop_schema)
-    item_field_kwargs = get_field_kwargs(prop_name, prop_schema, item_type)
-    return item_type, item_field_kwargs
+def lower_type(type_spec: TypeSpec, context: GenerationContext) -> Any:
+    """Converts a type of the IR into the corresponding Python type."""
+    if isinstance(type_spec, EnumType):
+        return annotate_enum_type(context.get_enum_type(type_spec))
+    if isinstance(type_spec, ArrayType):
+        return annotate_field_type(List, get_item_field_info(type_spec, context), context.frozen)
+    if isinstance(type_spec, (ModelType, RefType)) and context.lazy:
+        return context.get_lazy_model(type_spec, lower_model)
+    if isinstance(type_spec, ModelType):
+        return context.get_nested_model(type_spec.model, lower_model)
+    if isinstance(type_spec, RefType):
+        return context.get_referenced_model(type_spec.ref, lower_model)
+    if type_spec.name in STRICT_FORMAT_TYPES:
+        return STRICT_FORMAT_TYPES[type_spec.name]
+    return SCALAR_TYPES[type_spec.name]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import Any, NamedTuple, cast
+
+from pydantic import BaseModel
+
+from .compiler import compile_schema
+from .context import GenerationContext, GenerationRecord, GenerationReport, get_generation_record
+from .generate_model import lower_schema
+from .ir import (
+    FieldSpec,
+    ModelDiff,
+    ModelSpec,
+    ModelType,
+    SchemaIR,
+    diff_models,
+    iter_type_refs,
+)
+from .validation import validate_json_schema
+
+
+class RegenerationResult(NamedTuple):
+    """
+    The result of `regenerate_basemodel`.
+
+    :param model: The model for the new schema. It is the previous model if nothing changed.
+    :param diff: The differences between the fields of the previous and the new root model.
+    :param report: The numbers of models and enums that were built or reused.
+    :param fields_reused: The number of fields whose annotated types were reused.
+    """
+
+    model: type[BaseModel]
+    diff: ModelDiff
+    report: GenerationReport
+    fields_reused: int
+
+
+def regenerate_basemodel(
+    old_schema: Mapping[str, Any],
+    new_schema: Mapping[str, Any],
+    old_model: type[BaseModel],
+    validate_schema: bool = True,
+    model_name: str | None = None,
+    format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
+    schema_store: Mapping[str, Any] | None = None,
+    strict_formats: bool = False,
+) -> RegenerationResult:
+    """
+    Generates the model for a new version of a JSON Schema, reusing as much as possible of the
+    model generated for the previous version.
+
+    Both versions are compiled and compared definition by definition. Nested models, referenced
+    models, enums and the annotated types of fields that did not change, including anything
+    they refer to, are taken over from the previous model. Only the models that changed and
+    those containing them are rebuilt.
+
+    Reuse requires that `old_model` was generated by this process from `old_schema` with the
+    same arguments, e.g. by `generate_basemodel` or an earlier `regenerate_basemodel`.
+    Otherwise, the new model is generated from scratch.
+
+    :param old_schema: The previous version of the JSON Schema.
+    :param new_schema: The new version of the JSON Schema.
+    :param old_model: The model generated from the previous version.
+    :param validate_schema: Whether to validate the new JSON Schema. Defaults to True.
+    :param model_name: The name of the model, see `generate_basemodel`.
+    :param format_validation: A mapping of custom format names to validation functions, see
+        `generate_basemodel`.
+    :param schema_store: A mapping of URIs to JSON Schema documents, see `generate_basemodel`.
+    :param strict_formats: Whether to validate standard formats with native Pydantic types, see
+        `generate_basemodel`.
+    :return: The new model and a summary of what changed and what was reused.
+    """
+    if validate_schema:
+        validate_json_schema(new_schema)
+    old_ir = compile_schema(old_schema, model_name, schema_store, strict_formats)
+    new_ir = compile_schema(new_schema, model_name, schema_store, strict_formats)
+    diff = diff_models(old_ir.root_model, new_ir.root_model)
+
+    record = get_generation_record(old_model)
+    if record is None or not is_reusable(record, old_ir, format_validation):
+        context = GenerationContext(format_validation)
+    else:
+        stale = get_stale_definitions(old_ir, new_ir)
+        if old_ir.root == new_ir.root and new_ir.root not in stale:
+            return RegenerationResult(old_model, diff, GenerationReport(0, 0, 0, 0), 0)
+        context = GenerationContext(
+            format_validation, record.context.enums, record.context.lazy, record.context.frozen
+        )
+        reuse_unchanged(record.context, context, stale)
+
+    model = lower_schema(new_ir, context)
+    context.rebuild_models()
+    context.record(model, new_ir)
+    return RegenerationResult(model, diff, context.report(), context.fields_reused)
+
+
+def is_reusable(
+    record: GenerationRecord,
+    old_ir: SchemaIR,
+    format_validation: Mapping[str, Callable[[Any], bool]] | None,
+) -> bool:
+    """Returns whether a model was generated from an IR with the same format validation."""
+    old_validation = dict(record.context.format_validation or {})
+    return record.schema_ir == old_ir and old_validation == dict(format_validation or {})
+
+
+def get_stale_definitions(old_ir: SchemaIR, new_ir: SchemaIR) -> set[str]:
+    """
+    Returns the keys of the definitions of the new IR whose models cannot be reused, because
+    they or any definition they refer to changed.
+    """
+    old_definitions = dict(old_ir.definitions)
+    new_definitions = dict(new_ir.definitions)
+    stale = {key for key, spec in new_definitions.items() if old_definitions.get(key) != spec}
+    references = {key: set(get_model_refs(spec)) for key, spec in new_definitions.items()}
+    while True:
+        newly_stale = {key for key, refs in references.items() if key not in stale and refs & stale}
+        if not newly_stale:
+            return stale
+        stale |= newly_stale
+
+
+def get_model_refs(spec: ModelSpec) -> set[str]:
+    """Returns the keys of all definitions a model refers to, including through nested models."""
+    return set(iter_type_refs(ModelType(spec)))
+
+
+def reuse_unchanged(old: GenerationContext, new: GenerationContext, stale: set[str]) -> None:
+    """Makes everything of an earlier run that does not refer to stale definitions reusable."""
+    new.referenced_models.update(
+        (key, model) for key, model in old.referenced_models.items() if key not in stale
+    )
+    for key, model in old.models.items():
+        _, fields, _ = cast("tuple[str | None, tuple[FieldSpec, ...], bool]", key)
+        if not any(refers_to_stale(field, stale) for field in fields):
+            new.models[key] = model
+    new.reusable_field_types.update(
+        (field, field_type)
+        for field, field_type in old.field_types.items()
+        if not refers_to_stale(field, stale)
+    )
+
+
+def refers_to_stale(field: FieldSpec, stale: set[str]) -> bool:
+    return any(ref in stale for ref in iter_type_refs(field.type))
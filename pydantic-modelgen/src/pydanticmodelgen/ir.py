@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterator, Mapping
+from datetime import date, datetime, time
+from typing import Any, ClassVar, NamedTuple, Tuple, Union
+from uuid import UUID
+
+# Increased whenever the structure of the IR changes, which invalidates persisted IRs.
+IR_FORMAT_VERSION = 2
+
+# The Python types that scalar types of the IR stand for, by name.
+SCALAR_TYPES: dict[str, Any] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "null": None,
+    "any": Any,
+    "datetime": datetime,
+    "date": date,
+    "time": time,
+    "uuid": UUID,
+}
+
+# Keyword arguments for `pydantic.Field`, sorted by name.
+Constraints = Tuple[Tuple[str, Any], ...]
+
+
+def freeze(value: Any) -> Any:
+    """
+    Converts a JSON value into a hashable one.
+
+    Scalars are paired with their type, since e.g. `0 == 0.0 == False` but they are different
+    defaults or enum values. Lists and tuples are treated alike, as in JSON.
+    """
+    if isinstance(value, Mapping):
+        return dict, tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple, tuple(freeze(item) for item in value)
+    if isinstance(value, Node):
+        return value
+    return type(value), value
+
+
+def make_constraints(field_kwargs: Mapping[str, Any]) -> Constraints:
+    """Converts keyword arguments for `pydantic.Field` into `Constraints`."""
+    return tuple(sorted(field_kwargs.items()))
+
+
+class Node:
+    """
+    Base class of the nodes of the intermediate representation (IR) of JSON Schemas.
+
+    The IR is produced by a single pass over a JSON Schema (see `compile_schema`) and contains
+    everything needed to generate Pydantic models from it. Nodes are immutable and hashable and
+    can be serialized to and from JSON-compatible dictionaries, so an IR can be cached, compared
+    or converted into multiple outputs without parsing the schema again.
+    """
+
+    __slots__ = ("_hash", "_digest")
+    _hash: int | None
+    _digest: str | None
+    _fields: ClassVar[tuple[str, ...]] = ()
+    kind: ClassVar[str] = ""
+
+    def __init__(self, *args: Any) -> None:
+        for index, name in enumerate(self._fields):
+            object.__setattr__(self, name, args[index])
+        object.__setattr__(self, "_hash", None)
+        object.__setattr__(self, "_digest", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        if other is self:
+            return True
+        return freeze(self._values()) == freeze(other._values())  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        node_hash = self._hash
+        if node_hash is None:
+            node_hash = hash((self.kind, freeze(self._values())))
+            object.__setattr__(self, "_hash", node_hash)
+        return node_hash
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), self._values()
+
+    def __repr__(self) -> str:
+        arguments = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({arguments})"
+
+    def digest(self) -> str:
+        """
+        Returns a SHA-256 hex digest of the node that is the same in every process. Nested models
+        enter it by their digests, which are computed once per model.
+        """
+        node_digest = self._digest
+        if node_digest is None:
+            canonical = json.dumps(
+                [self.kind, *(_canonicalize(getattr(self, name)) for name in self._fields)],
+                default=repr,
+            )
+            node_digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+            object.__setattr__(self, "_digest", node_digest)
+        return node_digest
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializes the node into a JSON-compatible dictionary."""
+        result: dict[str, Any] = {"kind": self.kind}
+        for name in self._fields:
+            result[name] = _serialize(getattr(self, name))
+        return result
+
+
+def _canonicalize(value: Any) -> Any:
+    if isinstance(value, ModelSpec):
+        return value.digest()
+    if isinstance(value, Node):
+        return [value.kind, *(_canonicalize(getattr(value, name)) for name in value._fields)]
+    if isinstance(value, tuple):
+        return [_canonicalize(item) for item in value]
+    return value
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, Node):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_serialize(item) for item in value]
+    return value
+
+
+class ScalarType(Node):
+    """
+    A type without further structure, see `SCALAR_TYPES` and `formats.STRICT_FORMAT_TYPES` for
+    the possible names.
+    """
+
+    __slots__ = ("name",)
+    _fields = ("name",)
+    kind = "scalar"
+    name: str
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+
+
+class EnumType(Node):
+    """An enum of the given values, named after the property it belongs to."""
+
+    __slots__ = ("name", "values", "format")
+    _fields = ("name", "values", "format")
+    kind = "enum"
+    name: str
+    values: tuple[Any, ...]
+    format: str | None
+
+    def __init__(self, name: str, values: tuple[Any, ...], format: str | None = None) -> None:
+        super().__init__(name, tuple(values), format)
+
+
+class ArrayType(Node):
+    """A list, or a set if the items are unique, of items with the given type and constraints."""
+
+    __slots__ = ("items", "item_constraints", "unique")
+    _fields = ("items", "item_constraints", "unique")
+    kind = "array"
+    items: TypeSpec
+    item_constraints: Constraints
+    unique: bool
+
+    def __init__(self, items: TypeSpec, item_constraints: Constraints = (), unique: bool = False):
+        super().__init__(items, tuple(item_constraints), unique)
+
+
+class ModelType(Node):
+    """A nested model that is defined inline."""
+
+    __slots__ = ("model",)
+    _fields = ("model",)
+    kind = "model"
+    model: ModelSpec
+
+    def __init__(self, model: ModelSpec) -> None:
+        super().__init__(model)
+
+
+class RefType(Node):
+    """A reference to a model in the definitions of the `SchemaIR`, e.g. the target of a `$ref`."""
+
+    __slots__ = ("ref",)
+    _fields = ("ref",)
+    kind = "ref"
+    ref: str
+
+    def __init__(self, ref: str) -> None:
+        super().__init__(ref)
+
+
+TypeSpec = Union[ScalarType, EnumType, ArrayType, ModelType, RefType]  # noqa: UP007
+
+
+class FieldSpec(Node):
+    """A field of a model."""
+
+    __slots__ = ("name", "type", "required", "default", "constraints", "format")
+    _fields = ("name", "type", "required", "default", "constraints", "format")
+    kind = "field"
+    name: str
+    type: TypeSpec
+    required: bool
+    default: Any
+    constraints: Constraints
+    format: str | None
+
+    def __init__(
+        self,
+        name: str,
+        type: TypeSpec,
+        required: bool = False,
+        default: Any = None,
+        constraints: Constraints = (),
+        format: str | None = None,
+    ) -> None:
+        super().__init__(name, type, required, default, tuple(constraints), format)
+
+
+class ModelSpec(Node):
+    """
+    A model with the given fields.
+
+    :param title: The title of the model's schema, if it has one. Unlike names derived from
+        property names, it is part of the `structure` of the model.
+    """
+
+    __slots__ = ("name", "fields", "additional_properties", "title")
+    _fields = ("name", "fields", "additional_properties", "title")
+    kind = "model_spec"
+    name: str
+    fields: tuple[FieldSpec, ...]
+    additional_properties: bool
+    title: str | None
+
+    def __init__(
+        self,
+        name: str,
+        fields: tuple[FieldSpec, ...],
+        additional_properties: bool = False,
+        title: str | None = None,
+    ) -> None:
+        super().__init__(name, tuple(fields), additional_properties, title)
+
+    def structure(self) -> tuple[str | None, tuple[FieldSpec, ...], bool]:
+        """
+        The parts of the model that determine its behavior and its schema, i.e. everything but a
+        name that is not an explicit title. Nested models with equal structures are shared.
+        """
+        return self.title, self.fields, self.additional_properties
+
+
+class SchemaIR(Node):
+    """
+    The IR of a whole JSON Schema.
+
+    :param root: The key of the root model within the definitions.
+    :param definitions: The models that are referenced by `RefType`s, including the root model,
+        as (key, model) pairs sorted by key.
+    """
+
+    __slots__ = ("root", "definitions")
+    _fields = ("root", "definitions")
+    kind = "schema"
+    root: str
+    definitions: tuple[tuple[str, ModelSpec], ...]
+
+    def __init__(self, root: str, definitions: tuple[tuple[str, ModelSpec], ...]) -> None:
+        super().__init__(root, tuple(sorted(definitions, key=lambda item: item[0])))
+
+    @property
+    def root_model(self) -> ModelSpec:
+        """The specification of the root model."""
+        return dict(self.definitions)[self.root]
+
+
+def iter_type_refs(type_spec: TypeSpec) -> Iterator[str]:
+    """Yields the keys of all definitions a type refers to, including through nested models."""
+    if isinstance(type_spec, RefType):
+        yield type_spec.ref
+    elif isinstance(type_spec, ArrayType):
+        yield from iter_type_refs(type_spec.items)
+    elif isinstance(type_spec, ModelType):
+        for field in type_spec.model.fields:
+            yield from iter_type_refs(field.type)
+
+
+_NODE_TYPES: dict[str, type[Node]] = {
+    node_type.kind: node_type
+    for node_type in (ScalarType, EnumType, ArrayType, ModelType, RefType, FieldSpec, ModelSpec)
+}
+
+
+def node_from_dict(data: Mapping[str, Any]) -> Any:
+    """Deserializes a node serialized with `Node.to_dict`."""
+    if data["kind"] == SchemaIR.kind:
+        return SchemaIR(
+            data["root"],
+            tuple((key, node_from_dict(model)) for key, model in data["definitions"]),
+        )
+    node_type = _NODE_TYPES[data["kind"]]
+    return node_type(*(_deserialize(name, data[name]) for name in node_type._fields))
+
+
+def _deserialize(name: str, value: Any) -> Any:
+    if isinstance(value, Mapping) and "kind" in value:
+        return node_from_dict(value)
+    if name == "fields":
+        return tuple(node_from_dict(field) for field in value)
+    if name in ("constraints", "item_constraints"):
+        return tuple((key, constraint) for key, constraint in value)
+    if name == "values":
+        return tuple(value)
+    return value
+
+
+class ModelDiff(NamedTuple):
+    """The differences between the fields of two versions of a model."""
+
+    added: tuple[str, ...]
+    removed: tuple[str, ...]
+    changed: tuple[str, ...]
+    unchanged: tuple[str, ...]
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def diff_models(old: ModelSpec, new: ModelSpec) -> ModelDiff:
+    """
+    Compares two versions of a model field by field.
+
+    :param old: The previous version of the model.
+    :param new: The current version of the model.
+    :return: The names of the added, removed, changed and unchanged fields.
+    """
+    old_fields = {field.name: field for field in old.fields}
+    new_fields = {field.name: field for field in new.fields}
+    return ModelDiff(
+        added=tuple(name for name in new_fields if name not in old_fields),
+        removed=tuple(name for name in old_fields if name not in new_fields),
+        changed=tuple(
+            name
+            for name, field in new_fields.items()
+            if name in old_fields and old_fields[name] != field
+        ),
+        unchanged=tuple(
+            name
+            for name, field in new_fields.items()
+            if name in old_fields and old_fields[name] == field
+        ),
+    )
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel, GetCoreSchemaHandler, GetJsonSchemaHandler, ValidationInfo
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema, core_schema
+
+
+class LazyModel:
+    """
+    Annotation of a field whose nested model is only built when the field is first validated.
+
+    Fields annotated with `Annotated[Any, LazyModel(...)]` accept instances of the model and
+    anything the model validates, such as dictionaries. The model is built by the first
+    validation that needs it, at most once even if multiple threads validate concurrently. In
+    JSON Schemas, the field is only described as an object with the name of the model as title,
+    so that generating them neither builds models nor recurses endlessly.
+
+    :param name: The name of the model, used as title in JSON Schemas.
+    :param build: The function building the model.
+    """
+
+    def __init__(self, name: str, build: Callable[[], type[BaseModel]]) -> None:
+        self.name = name
+        self._build = build
+        self._model: type[BaseModel] | None = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        state = "built" if self.is_built else "not built"
+        return f"LazyModel({self.name!r}, {state})"
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the model has been built already."""
+        return self._model is not None
+
+    @property
+    def model(self) -> type[BaseModel]:
+        """The model, which is built if necessary."""
+        model = self._model
+        if model is None:
+            with self._lock:
+                if self._model is None:
+                    self._model = self._build()
+                model = self._model
+        return model
+
+    def validate(self, value: Any, info: ValidationInfo) -> BaseModel:
+        model = self.model
+        if isinstance(value, model):
+            return value
+        return model.model_validate(value, context=info.context)
+
+    def __get_pydantic_core_schema__(
+        self, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return core_schema.with_info_plain_validator_function(self.validate)
+
+    def __get_pydantic_json_schema__(
+        self, schema: CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return {"type": "object", "title": self.name}
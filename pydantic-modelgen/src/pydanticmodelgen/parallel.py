@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import os
+import pickle
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from multiprocessing.context import BaseContext
+from types import TracebackType
+from typing import Any
+
+from pydantic import BaseModel
+
+from .batch import BatchValidationResult, validate_many
+from .generate_model import generate_basemodel
+from .pickling import dumps_for_known_models, register_model
+from .streaming import shift_indices, validate_records
+from .validation import validate_json_schema
+
+# The model of the current worker process, built once by `initialize_worker`.
+_worker_model: type[BaseModel] | None = None
+
+
+def initialize_worker(schema: Mapping[str, Any], generate_kwargs: dict[str, Any]) -> None:
+    global _worker_model
+    _worker_model = generate_basemodel(schema, **generate_kwargs)
+
+
+def get_worker_model() -> type[BaseModel]:
+    if _worker_model is None:
+        raise RuntimeError("The worker process has not been initialized")
+    return _worker_model
+
+
+def dump_result(result: BatchValidationResult) -> bytes:
+    """
+    Pickles the result of a chunk for the parent process. The parent has generated the same
+    model, so the definitions of the model are left out of the instances.
+    """
+    return dumps_for_known_models(result, [get_worker_model()])
+
+
+def validate_chunk(records: list[Any], offset: int) -> bytes:
+    return dump_result(shift_indices(validate_many(get_worker_model(), records), offset))
+
+
+def validate_json_chunk(records: list[bytes], offset: int) -> bytes:
+    result = next(validate_records(get_worker_model(), records, chunk_size=len(records)))
+    return dump_result(shift_indices(result, offset))
+
+
+class ParallelValidator:
+    """
+    Validates records against the model of a JSON Schema in multiple processes.
+
+    The schema is sent to the worker processes, and each of them builds the model once when it
+    starts. The records are split into chunks that are validated by the workers with
+    `validate_many`. Results are returned in input order, and only a bounded number of chunks is
+    in flight at a time, so arbitrarily long iterables of records can be validated.
+
+    The instances of the results are instances of `model`, the model built in the current
+    process, see `register_model`. Since the current process knows the model, the workers do
+    not send its definitions along with the instances, see `dumps_for_known_models`.
+
+    Use it as a context manager or call `close` to stop the worker processes.
+
+    :param schema: The JSON Schema to validate against.
+    :param max_workers: The number of worker processes. Defaults to the number of CPUs.
+    :param chunk_size: The number of records validated per task.
+    :param validate_schema: Whether to validate the JSON Schema, once in the current process.
+    :param model_name: The name of the model, see `generate_basemodel`.
+    :param format_validation: A mapping of custom format names to validation functions. The
+        functions must be picklable, i.e. defined at the top level of a module.
+    :param schema_store: A mapping of URIs to JSON Schema documents, see `generate_basemodel`.
+    :param strict_formats: Whether to validate standard formats with native Pydantic types, see
+        `generate_basemodel`.
+    :param mp_context: The multiprocessing context to start the workers with.
+    """
+
+    def __init__(
+        self,
+        schema: Mapping[str, Any],
+        max_workers: int | None = None,
+        chunk_size: int = 1000,
+        validate_schema: bool = True,
+        model_name: str | None = None,
+        format_validation: Mapping[str, Callable[[Any], bool]] | None = None,
+        schema_store: Mapping[str, Any] | None = None,
+        strict_formats: bool = False,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if validate_schema:
+            validate_json_schema(schema)
+        generate_kwargs: dict[str, Any] = {
+            "validate_schema": False,
+            "model_name": model_name,
+            "format_validation": format_validation,
+            "schema_store": schema_store,
+            "strict_formats": strict_formats,
+        }
+        self.model = generate_basemodel(schema, **generate_kwargs)
+        register_model(self.model)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.executor = ProcessPoolExecutor(
+            self.max_workers,
+            mp_context=mp_context,
+            initializer=initialize_worker,
+            initargs=(schema, generate_kwargs),
+        )
+
+    def validate(self, records: Iterable[Any]) -> Iterator[BatchValidationResult]:
+        """
+        Validates records, e.g. dictionaries.
+
+        :param records: The records to validate.
+        :return: The results of the chunks in input order. Indices count the records from the
+            start of the iterable.
+        """
+        return self._map(validate_chunk, records)
+
+    def validate_json(self, records: Iterable[bytes]) -> Iterator[BatchValidationResult]:
+        """
+        Validates records given as raw JSON, e.g. the lines of an NDJSON file, see
+        `validate_records`.
+
+        :param records: The raw JSON of each record.
+        :return: The results of the chunks in input order.
+        """
+        return self._map(validate_json_chunk, records)
+
+    def _map(
+        self,
+        function: Callable[[list[Any], int], bytes],
+        records: Iterable[Any],
+    ) -> Iterator[BatchValidationResult]:
+        iterator = iter(records)
+        pending: deque[Future[bytes]] = deque()
+        offset = 0
+        while True:
+            while len(pending) < 2 * self.max_workers:
+                chunk = list(islice(iterator, self.chunk_size))
+                if not chunk:
+                    break
+                pending.append(self.executor.submit(function, chunk, offset))
+                offset += len(chunk)
+            if not pending:
+                return
+            yield pickle.loads(pending.popleft().result())
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        self.executor.shutdown()
+
+    def __enter__(self) -> ParallelValidator:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
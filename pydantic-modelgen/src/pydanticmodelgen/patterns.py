@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import re
+from typing import Any, NamedTuple, Union
+
+from pydantic_core import SchemaError, SchemaValidator, core_schema
+
+# A pattern for `pydantic.Field`: a string for the Rust regex engine of pydantic-core or a
+# compiled Python pattern, which makes Pydantic use Python's `re` for the field.
+FieldPattern = Union[str, "re.Pattern[str]"]  # noqa: UP007
+
+# ECMA-262 character classes only match ASCII characters, unlike their Python and Rust versions.
+_ASCII_CLASSES = {"d": "0-9", "w": "a-zA-Z0-9_"}
+
+# Matches only at the very end of the input, in Python, Rust and ECMA-262 alike. Python's `$`
+# also matches before a trailing newline.
+_END_OF_INPUT = r"(?![\s\S])"
+
+_patterns: dict[str, FieldPattern] = {}
+_hits = 0
+_misses = 0
+
+
+class PatternCacheInfo(NamedTuple):
+    """Statistics of the pattern cache, see `pattern_cache_info`."""
+
+    hits: int
+    misses: int
+    currsize: int
+    rust: int
+    python: int
+
+
+def normalize_pattern(pattern: str, end_anchor: str = "$") -> str:
+    """
+    Translates a JSON Schema (ECMA-262) regular expression into the common syntax of Python's
+    `re` and Rust's `regex`.
+
+    - `\\d`, `\\D`, `\\w` and `\\W` only match ASCII characters, as in ECMA-262.
+    - Named groups `(?<name>...)` are written as `(?P<name>...)`.
+    - The empty class `[]` and the class `[^]` matching any character are spelled out, and `[`
+      within classes is escaped.
+
+    Like in JSON Schema, patterns are not anchored, so they match anywhere in the string.
+
+    :param pattern: The pattern from the JSON Schema.
+    :param end_anchor: The replacement of `$` outside of character classes.
+    :return: The normalized pattern.
+    """
+    result = []
+    index = 0
+    in_class = False
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\" and index + 1 < len(pattern):
+            escaped = pattern[index + 1]
+            ranges = _ASCII_CLASSES.get(escaped.lower())
+            if ranges is None or (in_class and escaped.isupper()):
+                result.append(pattern[index : index + 2])
+            elif in_class:
+                result.append(ranges)
+            else:
+                result.append(f"[{ranges}]" if escaped.islower() else f"[^{ranges}]")
+            index += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+            if char == "[":  # Literal in ECMA-262, a nested class in Rust
+                char = "\\["
+        elif pattern.startswith("[]", index):
+            result.append("(?!)")
+            index += 2
+            continue
+        elif pattern.startswith("[^]", index):
+            result.append(r"[\s\S]")
+            index += 3
+            continue
+        elif char == "[":
+            in_class = True
+        elif char == "$":
+            char = end_anchor
+        elif pattern.startswith("(?<", index) and not pattern.startswith(("(?<=", "(?<!"), index):
+            result.append("(?P<")
+            index += 3
+            continue
+        result.append(char)
+        index += 1
+    return "".join(result)
+
+
+def is_rust_compatible(pattern: str) -> bool:
+    """Returns whether pydantic-core's Rust regex engine supports a pattern."""
+    try:
+        SchemaValidator(core_schema.str_schema(pattern=pattern))
+    except SchemaError:
+        return False
+    return True
+
+
+def get_pattern(pattern: str) -> FieldPattern:
+    """
+    Converts a JSON Schema pattern into the pattern for `pydantic.Field`, see `FieldPattern`.
+
+    The Rust regex engine is used whenever it supports the pattern, since it is faster and
+    guarantees linear matching time. Patterns using features it lacks, such as lookarounds or
+    backreferences, are compiled with Python's `re` instead. Each distinct pattern is only
+    normalized, checked and compiled once per process.
+
+    :param pattern: The pattern from the JSON Schema.
+    :return: The normalized pattern, or the compiled Python pattern.
+    :raises re.error: If the pattern is invalid.
+    """
+    global _hits, _misses
+    field_pattern = _patterns.get(pattern)
+    if field_pattern is not None:
+        _hits += 1
+        return field_pattern
+    _misses += 1
+    normalized = normalize_pattern(pattern)
+    if is_rust_compatible(normalized):
+        field_pattern = normalized
+    else:
+        field_pattern = re.compile(normalize_pattern(pattern, end_anchor=_END_OF_INPUT))
+    _patterns[pattern] = field_pattern
+    return field_pattern
+
+
+def get_pattern_kwargs(pattern: str) -> dict[str, Any]:
+    """
+    Returns the keyword arguments of `pydantic.Field` for a JSON Schema pattern.
+
+    The field validates with the pattern of `get_pattern`. If that differs from the original
+    pattern, the original is kept for the JSON Schemas of the models, e.g. for OpenAPI documents.
+
+    :param pattern: The pattern from the JSON Schema.
+    :return: The keyword arguments "pattern" and, if needed, "json_schema_extra".
+    :raises re.error: If the pattern is invalid.
+    """
+    field_pattern = get_pattern(pattern)
+    field_kwargs: dict[str, Any] = {"pattern": field_pattern}
+    if getattr(field_pattern, "pattern", field_pattern) != pattern:
+        field_kwargs["json_schema_extra"] = {"pattern": pattern}
+    return field_kwargs
+
+
+def pattern_cache_info() -> PatternCacheInfo:
+    """Returns statistics of the pattern cache."""
+    python = sum(isinstance(pattern, re.Pattern) for pattern in _patterns.values())
+    return PatternCacheInfo(_hits, _misses, len(_patterns), len(_patterns) - python, python)
+
+
+def clear_pattern_cache() -> None:
+    """Forgets all patterns and resets the statistics."""
+    global _hits, _misses
+    _patterns.clear()
+    _hits = _misses = 0
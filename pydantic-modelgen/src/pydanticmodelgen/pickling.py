@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+import threading
+import zlib
+from collections.abc import Iterable
+from contextvars import ContextVar
+from typing import Any, FrozenSet, NamedTuple, cast
+from weakref import WeakValueDictionary
+
+from pydantic import BaseModel
+
+from .context import GenerationContext, Locator, get_model_locator
+from .enums import EnumRegistry
+from .ir import ModelSpec
+from .registry import get_scoped_name, register
+
+_KEY_ATTRIBUTE = "__pydanticmodelgen_key__"
+_REFERENCE_ATTRIBUTE = "__pydanticmodelgen_reference__"
+_KNOWN_REFERENCE_ATTRIBUTE = "__pydanticmodelgen_known_reference__"
+
+_models: WeakValueDictionary[str, type[BaseModel]] = WeakValueDictionary()
+_contexts: WeakValueDictionary[str, GenerationContext] = WeakValueDictionary()
+_lock = threading.RLock()
+# The generation runs the receiving process of the pickles created in the current context is
+# known to have, see `dumps_for_known_models`.
+_known_generations: ContextVar[FrozenSet[str]] = ContextVar(
+    "known_generations", default=frozenset()
+)
+
+
+class ModelReference(NamedTuple):
+    """
+    Identifies a generated model across processes.
+
+    :param key: The hash of the generation run and the location of the model within it.
+    :param generation_key: The hash of the generation run, see `get_generation_key`.
+    :param generation: The compressed, pickled definitions and arguments of the generation run.
+        They are only unpickled by processes that do not know the run yet, and left out, i.e.
+        empty, if the receiving process is known to have them.
+    :param locator: The pickled location of the model within the run, see `get_model_locator`.
+    """
+
+    key: str
+    generation_key: str
+    generation: bytes
+    locator: bytes
+
+
+def get_generation_key(context: GenerationContext) -> str:
+    """
+    Returns the hash of a generation run.
+
+    The hash is computed from a canonical representation, so every process generating models
+    from the same schema with the same arguments computes the same hash.
+    """
+    with _lock:
+        if context.generation_key is None:
+            definitions = sorted(context.definitions.items(), key=lambda item: item[0])
+            format_validation = sorted((context.format_validation or {}).items())
+            canonical = json.dumps(
+                [
+                    [[key, spec.digest()] for key, spec in definitions],
+                    [[name, get_function_path(function)] for name, function in format_validation],
+                    context.enums.large_enum_threshold,
+                    context.lazy,
+                    context.frozen,
+                ],
+                default=repr,
+            )
+            context.generation_key = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+            _contexts[context.generation_key] = context
+        return context.generation_key
+
+
+def get_generation(context: GenerationContext) -> bytes:
+    """
+    Returns the compressed, pickled definitions and arguments of a generation run.
+
+    :raises pickle.PicklingError: If a format validation function cannot be pickled.
+    """
+    with _lock:
+        if context.pickled_generation is None:
+            arguments = (
+                sorted(context.definitions.items(), key=lambda item: item[0]),
+                sorted((context.format_validation or {}).items()),
+                context.enums.large_enum_threshold,
+                context.lazy,
+                context.frozen,
+            )
+            context.pickled_generation = zlib.compress(
+                pickle.dumps(arguments, pickle.HIGHEST_PROTOCOL)
+            )
+        return context.pickled_generation
+
+
+def get_function_path(function: Any) -> str:
+    return f"{getattr(function, '__module__', '')}:{getattr(function, '__qualname__', function)}"
+
+
+def get_model_key(model: type[BaseModel]) -> str:
+    """
+    Returns the hash of the generation run of a model and the location of the model within it,
+    registering the model under it.
+
+    :raises TypeError: If the model was not generated by this library.
+    """
+    key = vars(model).get(_KEY_ATTRIBUTE)
+    if key is not None:
+        return key
+    located = get_model_locator(model)
+    if located is None:
+        raise TypeError(f"{model.__name__} was not generated by pydanticmodelgen")
+    context, (kind, value) = located
+    location = json.dumps([kind, value.digest() if isinstance(value, ModelSpec) else value])
+    key = hashlib.sha256(f"{get_generation_key(context)}\n{location}".encode()).hexdigest()
+    with _lock:
+        setattr(model, _KEY_ATTRIBUTE, key)
+        _models[key] = model
+        register(model, get_scoped_name(model.__name__, key))
+    return key
+
+
+def register_models(context: GenerationContext) -> None:
+    """
+    Registers the models of a generation run that are not registered yet, see `register_model`.
+
+    Called once all models of the run have been built, since the hash of the run depends on all
+    of its definitions.
+    """
+    for model in context.built_models:
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            get_model_key(model)
+
+
+def get_model_reference(model: type[BaseModel]) -> ModelReference:
+    """
+    Returns the reference of a generated model.
+
+    :raises TypeError: If the model was not generated by this library.
+    :raises pickle.PicklingError: If a format validation function cannot be pickled.
+    """
+    reference = vars(model).get(_REFERENCE_ATTRIBUTE)
+    if reference is None:
+        key = get_model_key(model)
+        context, locator = cast("tuple[GenerationContext, Locator]", get_model_locator(model))
+        reference = ModelReference(
+            key, get_generation_key(context), get_generation(context), pickle.dumps(locator)
+        )
+        setattr(model, _REFERENCE_ATTRIBUTE, reference)
+    return reference
+
+
+def register_model(model: type[BaseModel]) -> str:
+    """
+    Returns the import path under which a generated model can be pickled by reference.
+    Instances of it that are unpickled in this process are instances of this model.
+
+    Models are registered when they are generated, or for models generated with
+    `generate_dataclass`, when they are first pickled.
+
+    :param model: The model, e.g. as returned by `generate_basemodel`.
+    :return: The import path of the model.
+    :raises TypeError: If the model was not generated by this library.
+    """
+    get_model_key(model)
+    return f"{model.__module__}.{model.__qualname__}"
+
+
+def reduce_model_instance(instance: BaseModel) -> tuple[Any, ...]:
+    """Pickles an instance of a generated model as the reference of its model and its state."""
+    model = type(instance)
+    reference = get_model_reference(model)
+    if reference.generation_key in _known_generations.get():
+        known_reference = vars(model).get(_KNOWN_REFERENCE_ATTRIBUTE)
+        if known_reference is None:
+            known_reference = reference._replace(generation=b"")
+            setattr(model, _KNOWN_REFERENCE_ATTRIBUTE, known_reference)
+        reference = known_reference
+    return load_model_instance, (reference, instance.__getstate__())
+
+
+def dumps_for_known_models(obj: Any, models: Iterable[type[BaseModel]]) -> bytes:
+    """
+    Pickles an object like `pickle.dumps`, but leaves the definitions of the given models out of
+    the pickled instances of them and of all other models generated by the same runs.
+
+    Use it if the receiving process has generated or unpickled the same models already, e.g.
+    the process that started a worker generating them, so that the definitions are not sent
+    again with every pickle. Other processes cannot load the pickle.
+
+    :param obj: The object to pickle, e.g. instances of generated models.
+    :param models: Models known to the receiving process, as returned by `generate_basemodel`.
+    :return: The pickle.
+    :raises TypeError: If a model was not generated from a JSON Schema by this process.
+    """
+    generation_keys = {get_model_reference(model).generation_key for model in models}
+    token = _known_generations.set(_known_generations.get() | generation_keys)
+    try:
+        return pickle.dumps(obj)
+    finally:
+        _known_generations.reset(token)
+
+
+def load_model_instance(reference: ModelReference, state: dict[Any, Any]) -> BaseModel:
+    model = load_model(reference)
+    instance = model.__new__(model)
+    instance.__setstate__(state)
+    return instance
+
+
+def load_model(reference: ModelReference) -> type[BaseModel]:
+    """
+    Returns the model of a reference, generating it once per process if necessary.
+
+    Models of the same generation run share one context, and thus their nested models and enums.
+    """
+    known = _models.get(reference.key)
+    if known is not None:
+        return known
+    # Imported here, since generated models refer to this module.
+    from .generate_model import lower_model
+
+    with _lock:
+        known = _models.get(reference.key)
+        if known is not None:
+            return known
+        context = _contexts.get(reference.generation_key)
+        if context is None:
+            if not reference.generation:
+                raise pickle.UnpicklingError(
+                    f"The definitions of the generation run {reference.generation_key} were "
+                    "left out of the pickle, but this process does not know the run"
+                )
+            definitions, format_validation, threshold, lazy, frozen = pickle.loads(
+                zlib.decompress(reference.generation)
+            )
+            context = GenerationContext(
+                dict(format_validation) or None, EnumRegistry(threshold), lazy, frozen
+            )
+            context.definitions.update(definitions)
+            context.generation_key = reference.generation_key
+            context.pickled_generation = reference.generation
+            _contexts[reference.generation_key] = context
+        kind, value = pickle.loads(reference.locator)
+        with context.lock:
+            if kind == "ref":
+                built = context.get_referenced_model(value, lower_model)
+            else:
+                built = context.get_nested_model(value, lower_model)
+            context.rebuild_models()
+        return cast("type[BaseModel]", built)
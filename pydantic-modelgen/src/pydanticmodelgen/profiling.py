@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from time import perf_counter
+from types import TracebackType
+
+_active_profile: ContextVar[GenerationProfile | None] = ContextVar("_active_profile", default=None)
+_NOT_PROFILING = nullcontext()
+
+
+class GenerationProfile:
+    """
+    Timings and counts collected while generating models, see `profile_generation`.
+
+    Timings are inclusive, so phases and properties can contain each other: "enum_values", the
+    parsing of enum values, is part of "enums", and the timing of a property with a nested model
+    includes the timings of the nested model's properties.
+
+    Phases are "meta_validation", "disk_cache", "compile", "enums", "enum_values",
+    "create_model" and "rebuild". Counts are kept of the "models", "nested_models",
+    "referenced_models", "enums", "fields" and "validators" that were built.
+    """
+
+    def __init__(self) -> None:
+        self.timings: defaultdict[str, float] = defaultdict(float)
+        self.calls: Counter[str] = Counter()
+        self.property_timings: defaultdict[str, float] = defaultdict(float)
+        self.counts: Counter[str] = Counter()
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Adds the duration of one run of a phase."""
+        self.timings[phase] += seconds
+        self.calls[phase] += 1
+
+    def record_property(self, name: str, seconds: float) -> None:
+        """Adds the time spent building the field of a property, named "Model.property"."""
+        self.property_timings[name] += seconds
+
+    def slowest_properties(self, n: int = 10) -> list[tuple[str, float]]:
+        """Returns the `n` properties that took the longest to build, with their timings."""
+        return sorted(self.property_timings.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def __repr__(self) -> str:
+        timings = ", ".join(
+            f"{phase}={seconds * 1000:.3f}ms" for phase, seconds in self.timings.items()
+        )
+        return f"GenerationProfile({timings}, counts={dict(self.counts)})"
+
+
+class _Timer:
+    __slots__ = ("record", "name", "start")
+
+    def __init__(self, record: Callable[[str, float], None], name: str) -> None:
+        self.record = record
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.record(self.name, perf_counter() - self.start)
+
+
+@contextmanager
+def profile_generation(
+    callback: Callable[[GenerationProfile], None] | None = None,
+) -> Iterator[GenerationProfile]:
+    """
+    Profiles all model generation in the current thread or task within the context.
+
+    Without an active profile the instrumentation only costs a context variable lookup per
+    measured step, so it can be enabled for a sample of production builds.
+
+    :param callback: An optional function that is called with the profile when the context
+        exits, e.g. to log or export it.
+    :return: The profile, which is filled while the context is active.
+    """
+    profile = GenerationProfile()
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
+        if callback is not None:
+            callback(profile)
+
+
+def timed(phase: str) -> AbstractContextManager[None]:
+    """Measures a phase if profiling is active."""
+    profile = _active_profile.get()
+    if profile is None:
+        return _NOT_PROFILING
+    return _Timer(profile.record, phase)
+
+
+def timed_property(model_name: str, prop_name: str) -> AbstractContextManager[None]:
+    """Measures building the field of a property if profiling is active."""
+    profile = _active_profile.get()
+    if profile is None:
+        return _NOT_PROFILING
+    return _Timer(profile.record_property, f"{model_name}.{prop_name}")
+
+
+def count(name: str, n: int = 1) -> None:
+    """Increases a count if profiling is active."""
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.counts[name] += n
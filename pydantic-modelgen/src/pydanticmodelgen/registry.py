@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from weakref import WeakValueDictionary
+
+# The generated models and enums that can be pickled by reference, i.e. as
+# "pydanticmodelgen.registry.<name>". Names are derived from hashes of the schema, so every
+# process that generated or unpickled the same model registers it under the same name.
+_namespace: WeakValueDictionary[str, type] = WeakValueDictionary()
+
+
+def register(cls: type, name: str) -> str:
+    """
+    Makes a generated class importable as an attribute of this module.
+
+    :param cls: The class.
+    :param name: The name of the class within this module. A dotted name "<scope>.<name>"
+        keeps the last part as the qualified name seen by e.g. the definitions of JSON Schemas.
+    :return: The import path of the class.
+    """
+    cls.__module__ = __name__
+    cls.__qualname__ = name
+    _namespace[name] = cls
+    return f"{__name__}.{name}"
+
+
+def get_identifier(name: str) -> str:
+    """Converts the name of a class into an identifier, for the names in this module."""
+    identifier = "".join(char if char.isalnum() else "_" for char in name)
+    return identifier if identifier[:1].isalpha() else "_" + identifier
+
+
+def get_scoped_name(name: str, digest: str) -> str:
+    """
+    Returns the name to register a class under, "<name>_<hash>.<name>", which keeps the name of
+    the class as the last part of its qualified name, see `register`.
+
+    :param name: The name of the class.
+    :param digest: A hex digest identifying the class across processes.
+    """
+    return f"{get_identifier(name)}_{digest[:16]}.{name.replace('.', '_')}"
+
+
+def __getattr__(name: str) -> Any:
+    cls = _namespace.get(name)
+    if cls is not None:
+        return cls
+    prefix = name + "."
+    scope = {key[len(prefix) :]: cls for key, cls in _namespace.items() if key.startswith(prefix)}
+    if scope:
+        return SimpleNamespace(**scope)
+    raise AttributeError(
+        f"module {__name__!r} has no attribute {name!r}. Generated classes are only "
+        "registered in processes that generated or unpickled them."
+    )
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote, urldefrag, urljoin
+
+from .errors import UnresolvableReferenceError
+
+
+def load_schema_store(directory: str | Path) -> dict[str, Any]:
+    """
+    Loads all JSON files below a directory into a store that can be used to resolve references.
+
+    :param directory: The directory to load the JSON Schemas from.
+    :return: A mapping of the file paths relative to the directory, e.g. "common/address.json", to
+        the loaded documents.
+    """
+    directory = Path(directory)
+    store: dict[str, Any] = {}
+    for path in sorted(directory.rglob("*.json")):
+        with path.open(encoding="utf-8") as file:
+            store[path.relative_to(directory).as_posix()] = json.load(file)
+    return store
+
+
+def resolve_json_pointer(document: Any, pointer: str) -> Any:
+    """
+    Resolves a JSON Pointer (RFC 6901), such as "/definitions/Person", within a document.
+
+    :param document: The document to resolve the pointer in.
+    :param pointer: The (URI fragment encoded) JSON Pointer. The empty pointer refers to the whole
+        document.
+    :return: The referenced part of the document.
+    :raises UnresolvableReferenceError: If the pointer does not exist in the document.
+    """
+    pointer = unquote(pointer)
+    if not pointer:
+        return document
+    if not pointer.startswith("/"):
+        raise UnresolvableReferenceError(f"Invalid JSON Pointer '{pointer}'")
+    target = document
+    for token in pointer[1:].split("/"):
+        token = token.replace("~1", "/").replace("~0", "~")
+        try:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            raise UnresolvableReferenceError(
+                f"Unresolvable JSON Pointer '{pointer}': no member '{token}'"
+            ) from e
+    return target
+
+
+class SchemaResolver:
+    """
+    Resolves `$ref`s of JSON Schemas.
+
+    Supports local references such as "#/definitions/Person" or "#/$defs/Person" as well as
+    references to other documents such as "address.json#/definitions/Address", which are looked
+    up in the store. Relative references are resolved against the document that contains them.
+
+    :param store: A mapping of URIs to JSON Schema documents, see `load_schema_store`.
+    """
+
+    def __init__(self, store: Mapping[str, Any] | None = None) -> None:
+        self.store: dict[str, Any] = {}
+        for uri, document in (store or {}).items():
+            self.add_document(uri, document)
+        self._scopes = [""]
+
+    def add_document(self, uri: str, document: Any) -> str:
+        """
+        Adds a document to the store.
+
+        :param uri: The URI of the document. The `$id` of the document takes precedence, but the
+            document remains available under this URI as well.
+        :param document: The JSON Schema document.
+        :return: The base URI of the document.
+        """
+        uri = urldefrag(uri)[0]
+        self.store[uri] = document
+        if isinstance(document, Mapping) and "$id" in document:
+            uri = urldefrag(urljoin(uri, str(document["$id"])))[0]
+            self.store[uri] = document
+        return uri
+
+    @property
+    def resolution_scope(self) -> str:
+        """The URI of the document references are currently resolved against."""
+        return self._scopes[-1]
+
+    @contextmanager
+    def in_scope(self, uri: str) -> Iterator[None]:
+        """Resolves references against the document with the given URI for the context."""
+        self._scopes.append(uri)
+        try:
+            yield
+        finally:
+            self._scopes.pop()
+
+    def resolve(self, ref: str) -> tuple[str, Any, str, Any]:
+        """
+        Resolves a reference against the current resolution scope.
+
+        :param ref: The value of the `$ref`.
+        :return: The URI of the document containing the target, the document itself, the JSON
+            Pointer of the target within it and the target.
+        :raises UnresolvableReferenceError: If the document or the pointer does not exist.
+        """
+        document_uri, pointer = urldefrag(urljoin(self.resolution_scope, ref))
+        try:
+            document = self.store[document_uri]
+        except KeyError:
+            raise UnresolvableReferenceError(
+                f"Unresolvable reference '{ref}': unknown document '{document_uri}'"
+            ) from None
+        return document_uri, document, pointer, resolve_json_pointer(document, pointer)
+
+    @contextmanager
+    def resolving(self, ref: str) -> Iterator[tuple[str, str, Any]]:
+        """
+        Resolves a reference and makes the document containing the target the resolution scope
+        for the duration of the context.
+
+        :param ref: The value of the `$ref`.
+        :return: The URI of the document containing the target, the JSON Pointer of the target
+            within it and the target itself.
+        """
+        document_uri, _, pointer, target = self.resolve(ref)
+        with self.in_scope(document_uri):
+            yield document_uri, pointer, target
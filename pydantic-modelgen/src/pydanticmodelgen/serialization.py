@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from pydantic import BaseModel
+
+from .batch import get_list_adapter
+
+
+def dump_many_json(
+    model: type[BaseModel],
+    instances: Iterable[BaseModel],
+    ndjson: bool = False,
+    by_alias: bool = False,
+    exclude_none: bool = False,
+) -> bytes:
+    """
+    Serializes many instances of a model to JSON at once.
+
+    As a JSON array, all instances are serialized by a single call into pydantic-core, with the
+    serializer of the model compiled when the model was generated, into a single buffer. As
+    NDJSON, each instance is serialized by one call and the lines are joined into one buffer.
+
+    :param model: The model of the instances, e.g. as returned by `generate_basemodel`.
+    :param instances: The instances to serialize.
+    :param ndjson: Whether to write one JSON object per line instead of a JSON array. Each line,
+        including the last one, ends with a newline.
+    :param by_alias: Whether to use the aliases of the fields, see `BaseModel.model_dump_json`.
+    :param exclude_none: Whether to exclude fields that are `None`, see
+        `BaseModel.model_dump_json`.
+    :return: The UTF-8 encoded JSON.
+    """
+    if not ndjson:
+        if not isinstance(instances, Sequence):
+            instances = list(instances)
+        return get_list_adapter(model).dump_json(
+            instances, by_alias=by_alias, exclude_none=exclude_none
+        )
+    to_json: Any = model.__pydantic_serializer__.to_json
+    lines = [
+        to_json(instance, by_alias=by_alias, exclude_none=exclude_none) for instance in instances
+    ]
+    lines.append(b"")
+    return b"\n".join(lines)
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from functools import partial
+from itertools import islice
+from time import perf_counter
+from typing import BinaryIO, Iterable, Union
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from .batch import BatchValidationResult, RecordError, validate_many
+
+# A binary file, the raw bytes, or an iterable of byte chunks, e.g. the lines of a file.
+ByteSource = Union[BinaryIO, bytes, bytearray, Iterable[bytes]]  # noqa: UP007
+
+_READ_SIZE = 1 << 16
+_JSON_STRUCTURE = re.compile(rb'["\\\[\]{},]')
+_QUOTE, _BACKSLASH, _COMMA = ord('"'), ord("\\"), ord(",")
+_OPENING, _CLOSING = b"[{", b"]}"
+
+
+class StreamStats:
+    """
+    Counts and timings of a streaming validation, updated while the results are consumed.
+
+    The time only includes reading and validating, not the processing of the results.
+    """
+
+    def __init__(self) -> None:
+        self.records = 0
+        self.invalid_records = 0
+        self.errors = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    @property
+    def valid_records(self) -> int:
+        return self.records - self.invalid_records
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamStats(records={self.records}, invalid_records={self.invalid_records}, "
+            f"errors={self.errors}, bytes={self.bytes}, seconds={self.seconds:.3f})"
+        )
+
+
+def iter_chunks(source: ByteSource) -> Iterator[bytes]:
+    """Iterates over a source in chunks of bytes."""
+    if isinstance(source, (bytes, bytearray)):
+        return iter((bytes(source),))
+    read = getattr(source, "read", None)
+    if read is not None:
+        return iter(partial(read, _READ_SIZE), b"")
+    return iter(source)  # type: ignore[arg-type]
+
+
+def iter_ndjson_records(source: ByteSource) -> Iterator[bytes]:
+    """Yields the raw JSON of each non-empty line of newline-delimited JSON."""
+    remainder = b""
+    for chunk in iter_chunks(source):
+        lines = (remainder + chunk).split(b"\n")
+        remainder = lines.pop()
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield line
+    remainder = remainder.strip()
+    if remainder:
+        yield remainder
+
+
+def iter_json_array_records(source: ByteSource) -> Iterator[bytes]:
+    """
+    Yields the raw JSON of each item of a JSON array without parsing the items.
+
+    Only the structure of the array is scanned, so malformed items are yielded as they are and
+    fail their validation.
+
+    :raises ValueError: If the JSON is not an array, or if anything but whitespace follows it.
+    """
+    chunks = iter_chunks(source)
+    buffer = b""
+    position = 0
+    depth = 0
+    in_string = False
+    start: int | None = None
+    for chunk in chunks:
+        buffer += chunk
+        while True:
+            match = _JSON_STRUCTURE.search(buffer, position)
+            if match is None:
+                position = len(buffer)
+                break
+            char = buffer[match.start()]
+            position = match.end()
+            if in_string:
+                if char == _BACKSLASH:
+                    if position == len(buffer):  # The escaped character is in the next chunk.
+                        position = match.start()
+                        break
+                    position += 1
+                elif char == _QUOTE:
+                    in_string = False
+            elif depth == 0 and buffer[: match.start()].strip():
+                raise ValueError("Expected a JSON array")
+            elif char == _QUOTE:
+                in_string = True
+            elif char in _OPENING:
+                if depth == 0:
+                    if char != _OPENING[0]:
+                        raise ValueError("Expected a JSON array")
+                    start = position
+                depth += 1
+            elif char in _CLOSING:
+                depth -= 1
+                if depth == 0:
+                    item = buffer[start : match.start()].strip()
+                    if item:
+                        yield item
+                    if buffer[position:].strip() or any(rest.strip() for rest in chunks):
+                        raise ValueError("Unexpected data after the JSON array")
+                    return
+            elif char == _COMMA and depth == 1:
+                yield buffer[start : match.start()].strip()
+                start = position
+        # Drop what has been yielded already, so the buffer only holds the current item.
+        offset = position if start is None else start
+        buffer = buffer[offset:]
+        position -= offset
+        if start is not None:
+            start = 0
+    if depth or start is None:
+        raise ValueError("Expected a JSON array")
+
+
+def validate_records(
+    model: type[BaseModel],
+    records: Iterable[bytes],
+    chunk_size: int = 1000,
+    stats: StreamStats | None = None,
+) -> Iterator[BatchValidationResult]:
+    """
+    Validates records given as raw JSON in chunks of bounded size.
+
+    The records of each chunk are parsed one by one and validated by a single `validate_many`
+    call. Records that are not exactly one JSON value are reported as invalid records with the
+    error type "json_invalid", see `validate_chunk`.
+
+    :param model: The model, e.g. as returned by `generate_basemodel`.
+    :param records: The raw JSON of each record.
+    :param chunk_size: The maximum number of records per chunk.
+    :param stats: An optional `StreamStats` to update.
+    :return: The results of the chunks. Indices count the records from the start of the stream.
+    """
+    stats = stats if stats is not None else StreamStats()
+    iterator = iter(records)
+    offset = 0
+    started = perf_counter()
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        result = validate_chunk(model, chunk)
+        if offset:
+            result = shift_indices(result, offset)
+        stats.records += len(chunk)
+        stats.invalid_records += len(chunk) - len(result.instances)
+        stats.errors += len(result.errors)
+        stats.bytes += sum(map(len, chunk))
+        offset += len(chunk)
+        stats.seconds += perf_counter() - started
+        yield result
+        started = perf_counter()
+    stats.seconds += perf_counter() - started
+
+
+def validate_chunk(model: type[BaseModel], chunk: list[bytes]) -> BatchValidationResult:
+    """
+    Parses the records of a chunk one by one and validates them by a single `validate_many` call.
+
+    Joining the records into one JSON array instead would let a record that is not exactly one
+    JSON value, e.g. `{"a": 1}, {"a": 2}` or one with an unterminated string, merge with or split
+    into its neighbours. Parsing each record on its own reports it as an invalid record.
+    """
+    records = []
+    positions = []
+    json_errors = []
+    for index, record in enumerate(chunk):
+        try:
+            records.append(from_json(record))
+        except ValueError as e:
+            json_errors.append(RecordError(index, (), "json_invalid", f"Invalid JSON: {e}"))
+        else:
+            positions.append(index)
+    result = validate_many(model, records)
+    if not json_errors:
+        return result
+    errors = [error._replace(record_index=positions[error.record_index]) for error in result.errors]
+    return BatchValidationResult(
+        result.instances,
+        [positions[index] for index in result.indices],
+        sorted([*errors, *json_errors], key=lambda error: error.record_index),
+    )
+
+
+def shift_indices(result: BatchValidationResult, offset: int) -> BatchValidationResult:
+    """Makes the indices of the result of a chunk relative to the start of the stream."""
+    return BatchValidationResult(
+        result.instances,
+        [index + offset for index in result.indices],
+        [error._replace(record_index=error.record_index + offset) for error in result.errors],
+    )
+
+
+def validate_ndjson(
+    model: type[BaseModel],
+    source: ByteSource,
+    chunk_size: int = 1000,
+    stats: StreamStats | None = None,
+) -> Iterator[BatchValidationResult]:
+    """
+    Lazily validates newline-delimited JSON, see `validate_records`.
+
+    Only one chunk of records is held in memory at a time.
+
+    :param model: The model, e.g. as returned by `generate_basemodel`.
+    :param source: A binary file, bytes or an iterable of byte chunks. Empty lines are skipped.
+    :param chunk_size: The maximum number of records per chunk.
+    :param stats: An optional `StreamStats` to update.
+    :return: The results of the chunks.
+    """
+    return validate_records(model, iter_ndjson_records(source), chunk_size, stats)
+
+
+def validate_json_array(
+    model: type[BaseModel],
+    source: ByteSource,
+    chunk_size: int = 1000,
+    stats: StreamStats | None = None,
+) -> Iterator[BatchValidationResult]:
+    """
+    Lazily validates the items of a JSON array, see `validate_records`.
+
+    Only one chunk of records is held in memory at a time.
+
+    :param model: The model, e.g. as returned by `generate_basemodel`.
+    :param source: A binary file, bytes or an iterable of byte chunks.
+    :param chunk_size: The maximum number of records per chunk.
+    :param stats: An optional `StreamStats` to update.
+    :return: The results of the chunks.
+    :raises ValueError: If the JSON is not an array.
+    """
+    return validate_records(model, iter_json_array_records(source), chunk_size, stats)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any
+
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
+
+from .cache import schema_fingerprint
+
+_MAX_REMEMBERED_SCHEMAS = 4096
+
+_meta_schema_validator: Draft7Validator | None = None
+_validated_fingerprints: OrderedDict[str, None] = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_meta_schema_validator() -> Draft7Validator:
+    """Returns the Draft 7 meta-schema validator, which is only built on first use."""
+    global _meta_schema_validator
+    if _meta_schema_validator is None:
+        _meta_schema_validator = Draft7Validator(Draft7Validator.META_SCHEMA)
+    return _meta_schema_validator
+
+
+def validate_json_schema(schema: Mapping[str, Any]) -> None:
+    """
+    Validates a JSON Schema against the Draft 7 meta-schema.
+
+    Equivalent to `jsonschema.validate(schema, Draft7Validator.META_SCHEMA)`, but reuses a single
+    validator and skips schemas whose fingerprint has already been validated successfully.
+
+    :param schema: The JSON Schema to validate.
+    :raises jsonschema.ValidationError: If the schema is invalid.
+    """
+    fingerprint = schema_fingerprint(schema)
+    with _lock:
+        if fingerprint in _validated_fingerprints:
+            _validated_fingerprints.move_to_end(fingerprint)
+            return
+    error = best_match(get_meta_schema_validator().iter_errors(schema))
+    if error is not None:
+        raise error
+    with _lock:
+        _validated_fingerprints[fingerprint] = None
+        if len(_validated_fingerprints) > _MAX_REMEMBERED_SCHEMAS:
+            _validated_fingerprints.popitem(last=False)
+
+
+def clear_validated_schemas() -> None:
+    """Forgets which schemas have already been validated."""
+    with _lock:
+        _validated_fingerprints.clear()
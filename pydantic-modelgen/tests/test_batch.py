@@ -0,0 +1,66 @@
+import gc
+import json
+import sys
+import weakref
+
+import pytest
+from pydantic import ValidationError
+from pydanticmodelgen import RecordError, generate_basemodel, validate_many, validate_many_json
+
+SCHEMA = {
+    "type": "object",
+    "required": ["name"],
+    "properties": {
+        "name": {"type": "string"},
+        "age": {"type": "integer", "minimum": 0},
+    },
+}
+
+
+def test_all_valid() -> None:
+    Model = generate_basemodel(SCHEMA)
+    records = ({"name": f"person {index}", "age": index} for index in range(3))
+    result = validate_many(Model, records)
+    assert [instance.age for instance in result.instances] == [0, 1, 2]
+    assert all(isinstance(instance, Model) for instance in result.instances)
+    assert result.indices == [0, 1, 2]
+    assert result.errors == []
+
+
+def test_invalid_records() -> None:
+    Model = generate_basemodel(SCHEMA)
+    records = [{"name": "a"}, {"age": -1}, {"name": "c", "age": "x"}, {"name": "d", "age": 4}]
+    result = validate_many(Model, records)
+    assert [instance.name for instance in result.instances] == ["a", "d"]
+    assert result.indices == [0, 3]
+    assert result.invalid_indices == [1, 2]
+    assert [(error.record_index, error.loc, error.type) for error in result.errors] == [
+        (1, ("name",), "missing"),
+        (1, ("age",), "greater_than_equal"),
+        (2, ("age",), "int_parsing"),
+    ]
+    assert result.errors[0] == RecordError(1, ("name",), "missing", "Field required")
+
+
+def test_json() -> None:
+    Model = generate_basemodel(SCHEMA)
+    records = [{"name": "a", "age": 1}, {"age": 2}, {"name": "c"}]
+    result = validate_many_json(Model, json.dumps(records))
+    assert [instance.name for instance in result.instances] == ["a", "c"]
+    assert result.indices == [0, 2]
+    assert result.invalid_indices == [1]
+
+    with pytest.raises(ValidationError):
+        validate_many_json(Model, '{"name": "a"}')
+    with pytest.raises(ValidationError):
+        validate_many_json(Model, "[{")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="typing.List caches its item types")
+def test_models_are_released() -> None:
+    Model = generate_basemodel(SCHEMA)
+    validate_many(Model, [{"name": "a"}])
+    reference = weakref.ref(Model)
+    del Model
+    gc.collect()
+    assert reference() is None
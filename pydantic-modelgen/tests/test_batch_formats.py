@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from pydantic import ValidationError
+from pydanticmodelgen import (
+    BatchFormatValidator,
+    generate_basemodel,
+    validate_many,
+    validate_many_json,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "code": {"type": "string", "format": "even-length"},
+        "children": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"code": {"type": "string", "format": "even-length"}},
+            },
+        },
+    },
+}
+
+
+class CountingValidator:
+    def __init__(self) -> None:
+        self.columns: list[list[str]] = []
+
+    def __call__(self, values: list[str]) -> list[bool]:
+        self.columns.append(list(values))
+        return [len(value) % 2 == 0 for value in values]
+
+
+def test_one_call_per_batch() -> None:
+    function = CountingValidator()
+    Model = generate_basemodel(
+        SCHEMA, format_validation={"even-length": BatchFormatValidator(function)}
+    )
+    records = [
+        {"code": "aa"},
+        {"code": "abc", "children": [{"code": "bb"}]},
+        {"code": "aa", "children": [{"code": "b"}, {"code": "cc"}]},
+        {},
+    ]
+    result = validate_many(Model, records)
+    assert result.indices == [0, 3]
+    assert [(error.record_index, error.loc, error.type) for error in result.errors] == [
+        (1, ("code",), "value_error"),
+        (2, ("children", 0, "code"), "value_error"),
+    ]
+    # Repeated values are checked once and missing fields are not checked at all.
+    assert function.columns == [["aa", "abc", "bb", "b", "cc"]]
+
+    json_result = validate_many_json(Model, json.dumps(records))
+    assert json_result.errors == result.errors
+    assert function.columns[1:] == []
+
+
+def test_single_record() -> None:
+    Model = generate_basemodel(
+        SCHEMA, format_validation={"even-length": BatchFormatValidator(CountingValidator())}
+    )
+    assert Model(code="aa").code == "aa"
+    with pytest.raises(ValidationError, match="Invalid value for format in field 'code'"):
+        Model(code="abc")
+    with pytest.raises(ValidationError):
+        Model(children=[{"code": "a"}])
+
+
+def test_memoization() -> None:
+    function = CountingValidator()
+    validator = BatchFormatValidator(function, maxsize=2)
+    assert validator.validate_column(["a", "bb", "a"]) == [False, True, False]
+    assert validator.validate_column(["bb", "ccc"]) == [True, False]
+    assert function.columns == [["a", "bb"], ["ccc"]]
+    validator.cache_clear()
+    assert validator("bb")
+    assert function.columns[-1] == ["bb"]
+
+    unmemoized = BatchFormatValidator(function, memoize=False)
+    unmemoized.validate_column(["a"])
+    unmemoized.validate_column(["a"])
+    assert function.columns[-2:] == [["a"], ["a"]]
+
+
+def test_invalid_mask() -> None:
+    validator = BatchFormatValidator(lambda values: [True])
+    with pytest.raises(ValueError, match="returned 1 results for 2 values"):
+        validator.validate_column(["a", "b"])
+
+
+def test_numpy_array() -> None:
+    numpy = pytest.importorskip("numpy")
+    validator = BatchFormatValidator(lambda values: numpy.char.str_len(values) % 2 == 0, array=True)
+    assert validator.validate_column(["a", "bb"]) == [False, True]
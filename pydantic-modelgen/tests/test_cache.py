@@ -0,0 +1,49 @@
+from pydanticmodelgen import ModelCache, generate_basemodel, schema_fingerprint
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"name": {"type": "string"}, "age": {"type": "integer"}},
+}
+
+
+def test_cache_hit() -> None:
+    cache = ModelCache()
+    first = generate_basemodel(SCHEMA, cache=cache)
+    second = generate_basemodel(dict(reversed(list(SCHEMA.items()))), cache=cache)
+    assert first is second
+    info = cache.info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_cache_key_includes_arguments() -> None:
+    cache = ModelCache()
+    default_name = generate_basemodel(SCHEMA, cache=cache)
+    custom_name = generate_basemodel(SCHEMA, model_name="Person", cache=cache)
+    with_format = generate_basemodel(SCHEMA, format_validation={"x": lambda v: True}, cache=cache)
+    assert len({default_name, custom_name, with_format}) == 3
+
+
+def test_cache_eviction() -> None:
+    cache = ModelCache(maxsize=2)
+    schemas = [{"type": "object", "properties": {str(i): {"type": "string"}}} for i in range(3)]
+    first = generate_basemodel(schemas[0], cache=cache)
+    generate_basemodel(schemas[1], cache=cache)
+    generate_basemodel(schemas[0], cache=cache)  # Marks the first schema as recently used
+    generate_basemodel(schemas[2], cache=cache)
+    assert len(cache) == 2
+    assert generate_basemodel(schemas[0], cache=cache) is first
+
+
+def test_cache_invalidate() -> None:
+    cache = ModelCache()
+    first = generate_basemodel(SCHEMA, cache=cache)
+    generate_basemodel(SCHEMA, model_name="Person", cache=cache)
+    assert cache.invalidate(SCHEMA) == 2
+    assert generate_basemodel(SCHEMA, cache=cache) is not first
+
+
+def test_schema_fingerprint_is_order_independent() -> None:
+    assert schema_fingerprint({"a": 1, "b": [1, 2]}) == schema_fingerprint({"b": [1, 2], "a": 1})
+    assert schema_fingerprint({"a": 1}) != schema_fingerprint({"a": 2})
@@ -0,0 +1,150 @@
+import importlib.util
+import json
+from datetime import datetime
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from pydantic import BaseModel, ValidationError
+from pydanticmodelgen import generate_basemodel, generate_module_source, write_module
+from pydanticmodelgen.__main__ import main
+from pydanticmodelgen.errors import CodeGenerationError
+
+SCHEMA = {
+    "title": "Person",
+    "type": "object",
+    "required": ["name"],
+    "properties": {
+        "name": {"type": "string", "minLength": 1, "description": "The name"},
+        "age": {"type": "integer", "minimum": 0, "default": 18},
+        "gender": {"enum": ["male", "female"]},
+        "birthday": {"type": "string", "format": "date"},
+        "tags": {"type": "array", "items": {"type": "string"}, "uniqueItems": True},
+        "address": {"type": "object", "properties": {"street": {"type": "string"}}},
+        "parent": {"$ref": "#"},
+        "pets": {"type": "array", "items": {"$ref": "#/definitions/Pet"}},
+    },
+    "definitions": {"Pet": {"type": "object", "properties": {"name": {"type": "string"}}}},
+}
+
+
+def is_even(value: int) -> bool:
+    return value % 2 == 0
+
+
+def import_module(path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generated_module_matches_runtime_model(tmp_path: Path) -> None:
+    path = tmp_path / "person_models.py"
+    write_module(path, {"Person": SCHEMA})
+    module = import_module(path)
+    Person = module.Person
+    RuntimePerson = generate_basemodel(SCHEMA)
+
+    data = {
+        "name": "John",
+        "gender": "male",
+        "birthday": "2000-01-01",
+        "tags": ["a", "a"],
+        "address": {"street": "Main Street"},
+        "parent": {"name": "Jane", "pets": [{"name": "Rex"}]},
+    }
+    assert Person(**data).model_dump() == RuntimePerson(**data).model_dump()
+    assert Person.model_json_schema() == RuntimePerson.model_json_schema()
+    assert module.__all__ == ["Person"]
+    for invalid in ({"name": ""}, {"name": "John", "age": -1}, {"name": "John", "gender": "x"}):
+        with pytest.raises(ValidationError):
+            Person(**invalid)
+
+
+def test_non_identifier_field_names() -> None:
+    schema = {
+        "type": "object",
+        "properties": {"first-name": {"type": "string"}, "class": {"type": "integer"}},
+    }
+    namespace = {"__name__": "generated"}
+    exec(generate_module_source({"Some Model": schema}), namespace)
+    Model = namespace["Some_Model"]
+    assert isinstance(Model, type) and issubclass(Model, BaseModel)
+    assert Model.__name__ == "Some Model"
+    instance = Model(**{"first-name": "John", "class": 1})
+    assert instance.model_dump() == {"first-name": "John", "class": 1}
+
+
+def test_field_names_shadowing_types() -> None:
+    schema = {
+        "type": "object",
+        "properties": {
+            "int": {"type": "integer"},
+            "count": {"type": "integer"},
+            "datetime": {"type": "string", "format": "date-time"},
+            "UUID": {"type": "string", "format": "uuid"},
+            "u2": {"type": "string", "format": "uuid"},
+            "Address": {"title": "Address", "type": "object", "properties": {}},
+        },
+    }
+    namespace = {"__name__": "generated"}
+    exec(generate_module_source({"Model": schema}), namespace)
+    data = {
+        "int": 1,
+        "count": 2,
+        "datetime": "2024-01-01T00:00:00",
+        "UUID": "12345678-1234-5678-1234-567812345678",
+        "u2": "12345678-1234-5678-1234-567812345678",
+        "Address": {},
+    }
+    expected = generate_basemodel(schema).model_validate(data).model_dump()
+    assert namespace["Model"].model_validate(data).model_dump() == expected
+
+
+def test_date_time_enum(tmp_path: Path) -> None:
+    schema = {
+        "type": "object",
+        "properties": {
+            "at": {"type": "string", "format": "date-time", "enum": ["2024-01-01T00:00:00"]}
+        },
+    }
+    path = tmp_path / "event_models.py"
+    write_module(path, {"Event": schema})
+    Event = import_module(path).Event
+    data = {"at": datetime(2024, 1, 1)}
+    assert Event(**data).model_dump() == generate_basemodel(schema)(**data).model_dump()
+
+
+def test_format_validation_by_import_path() -> None:
+    schema = {"type": "object", "properties": {"value": {"type": "integer", "format": "even"}}}
+    for validator in (is_even, f"{__name__}:is_even"):
+        source = generate_module_source({"Model": schema}, format_validation={"even": validator})
+        namespace = {"__name__": "generated"}
+        exec(source, namespace)
+        Model = namespace["Model"]
+        assert Model(value=2).value == 2
+        with pytest.raises(ValidationError):
+            Model(value=3)
+
+
+def test_local_format_validator_is_rejected() -> None:
+    schema = {"type": "object", "properties": {"value": {"type": "integer", "format": "even"}}}
+    with pytest.raises(CodeGenerationError):
+        generate_module_source({"Model": schema}, format_validation={"even": lambda v: True})
+
+
+def test_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    schema_path = tmp_path / "person.json"
+    schema_path.write_text(json.dumps(SCHEMA))
+    output_path = tmp_path / "cli_models.py"
+    assert main([str(schema_path), "-o", str(output_path)]) == 0
+    assert import_module(output_path).Person(name="John").name == "John"
+
+    assert main([str(schema_path)]) == 0
+    assert "class Person(BaseModel):" in capsys.readouterr().out
+
+    schema_path.write_text(json.dumps({"type": "object", "properties": {"a": {"type": 1}}}))
+    assert main([str(schema_path)]) == 1
+    assert "error" in capsys.readouterr().err
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import gc
+import weakref
+from datetime import date, datetime
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+from pydanticmodelgen import generate_basemodel, validate_columns
+
+SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "required": ["id"],
+    "properties": {
+        "id": {"type": "integer"},
+        "score": {"type": "number"},
+        "active": {"type": "boolean"},
+        "created": {"type": "string", "format": "date-time"},
+        "day": {"type": "string", "format": "date"},
+        "kind": {"enum": ["a", "bb"]},
+        "name": {"type": "string"},
+    },
+}
+
+RECORDS = [
+    {
+        "id": 1,
+        "score": 1.5,
+        "active": True,
+        "created": "2024-01-01T01:00:00+01:00",
+        "day": "2024-01-02",
+        "kind": "bb",
+        "name": "x",
+    },
+    {"id": "invalid"},
+    {"id": 3},
+]
+
+
+def test_numpy_columns() -> None:
+    numpy = pytest.importorskip("numpy")
+    result = validate_columns(generate_basemodel(SCHEMA), RECORDS)
+    assert result.indices == [0, 2]
+    assert [error.record_index for error in result.errors] == [1]
+    columns = result.columns
+    assert columns["id"].dtype == numpy.int64
+    assert not isinstance(columns["id"], numpy.ma.MaskedArray)
+    assert columns["score"].dtype == numpy.float64
+    assert columns["score"].mask.tolist() == [False, True]
+    assert columns["active"].dtype == numpy.bool_
+    assert columns["created"][0] == numpy.datetime64(datetime(2024, 1, 1), "us")
+    assert columns["day"][0] == numpy.datetime64(date(2024, 1, 2))
+    assert columns["kind"].dtype.kind == "U"
+    assert columns["kind"].tolist() == ["bb", None]
+    assert columns["name"].dtype == object
+
+
+def test_arrow_columns() -> None:
+    pyarrow = pytest.importorskip("pyarrow")
+    result = validate_columns(generate_basemodel(SCHEMA), RECORDS, backend="pyarrow")
+    columns = result.columns
+    assert columns["id"].to_pylist() == [1, 3]
+    assert columns["score"].to_pylist() == [1.5, None]
+    assert columns["created"].type == pyarrow.timestamp("us", tz="UTC")
+    assert columns["day"].type == pyarrow.date32()
+    assert columns["kind"].dictionary.to_pylist() == ["a", "bb"]
+    assert columns["kind"].to_pylist() == ["bb", None]
+    assert pyarrow.table(columns).num_rows == 2
+
+
+def test_arrow_columns_of_types_pyarrow_cannot_infer() -> None:
+    pytest.importorskip("pyarrow")
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "string", "format": "uuid"},
+            "address": {"type": "string", "format": "ipv4"},
+            "homepage": {"type": "string", "format": "uri"},
+            "owner": {"type": "object", "properties": {"id": {"type": "string", "format": "uuid"}}},
+        },
+    }
+    uuid = "12345678-1234-5678-1234-567812345678"
+    records = [
+        {
+            "id": uuid,
+            "address": "10.0.0.1",
+            "homepage": "https://example.com/",
+            "owner": {"id": uuid},
+        },
+        {},
+    ]
+    Model = generate_basemodel(schema, strict_formats=True)
+    columns = validate_columns(Model, records, backend="pyarrow").columns
+    assert columns["id"].to_pylist() == [uuid, None]
+    assert columns["address"].to_pylist() == ["10.0.0.1", None]
+    assert columns["homepage"].to_pylist() == ["https://example.com/", None]
+    assert columns["owner"].to_pylist() == [{"id": uuid}, None]
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="Unknown backend"):
+        validate_columns(generate_basemodel(SCHEMA), RECORDS, backend="pandas")  # type: ignore[arg-type]
+    pytest.importorskip("numpy")
+
+    class Handwritten(BaseModel):
+        id: int
+
+    with pytest.raises(TypeError):
+        validate_columns(Handwritten, RECORDS)
+
+
+def test_models_are_released() -> None:
+    pytest.importorskip("numpy")
+    Model = generate_basemodel(SCHEMA)
+    validate_columns(Model, RECORDS)
+    reference = weakref.ref(Model)
+    del Model
+    gc.collect()
+    assert reference() is None
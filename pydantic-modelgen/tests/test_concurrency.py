@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pydantic import BaseModel, create_model
+from pydanticmodelgen import ModelCache, generate_basemodel, generate_basemodel_async
+
+SCHEMA = {"type": "object", "properties": {"name": {"type": "string"}}}
+
+
+def slow_build(calls: list[int]) -> type[BaseModel]:
+    calls.append(1)
+    time.sleep(0.05)
+    return create_model("Slow", name=(str, ...))
+
+
+def test_single_flight_threads() -> None:
+    cache = ModelCache()
+    calls: list[int] = []
+    with ThreadPoolExecutor(8) as executor:
+        models = list(
+            executor.map(lambda _: cache.get_or_build("key", lambda: slow_build(calls)), range(8))
+        )
+    assert len(calls) == 1
+    assert len(set(models)) == 1
+    assert cache.info().misses == 1
+    assert cache.info().hits == 7
+
+
+def test_failed_build_is_retried() -> None:
+    cache = ModelCache()
+
+    def fail() -> type[BaseModel]:
+        raise RuntimeError("broken")
+
+    with pytest.raises(RuntimeError, match="broken"):
+        cache.get_or_build("key", fail)
+    assert cache.get_or_build("key", lambda: slow_build([])).__name__ == "Slow"
+
+
+def test_generate_basemodel_threads() -> None:
+    cache = ModelCache()
+    barrier = threading.Barrier(4)
+
+    def generate(_: int) -> type[BaseModel]:
+        barrier.wait()
+        return generate_basemodel(SCHEMA, cache=cache)
+
+    with ThreadPoolExecutor(4) as executor:
+        models = list(executor.map(generate, range(4)))
+    assert len(set(models)) == 1
+    assert cache.info().misses == 1
+
+
+def test_generate_basemodel_async() -> None:
+    cache = ModelCache()
+
+    async def generate_all() -> list[type[BaseModel]]:
+        return await asyncio.gather(
+            *(generate_basemodel_async(SCHEMA, cache=cache) for _ in range(10))
+        )
+
+    models = asyncio.run(generate_all())
+    assert len(set(models)) == 1
+    assert cache.info().misses == 1
+    assert models[0](name="x").name == "x"
+    uncached = asyncio.run(generate_basemodel_async(SCHEMA, model_name="Person"))
+    assert uncached.__name__ == "Person"
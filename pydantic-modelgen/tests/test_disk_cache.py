@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+from pydanticmodelgen import DiskCache, generate_basemodel
+from pydanticmodelgen import generate_model as generate_model_module
+
+SCHEMA = {
+    "title": "Person",
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "gender": {"enum": ["male", "female", "other"]},
+        "friends": {"type": "array", "items": {"$ref": "#"}},
+    },
+    "required": ["name"],
+}
+
+
+def test_disk_cache_roundtrip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    disk_cache = DiskCache(tmp_path / "cache")
+    generate_basemodel(SCHEMA, disk_cache=disk_cache)
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The schema should not be compiled again")
+
+    # Simulates a new process that finds the compiled schema on disk.
+    monkeypatch.setattr(generate_model_module, "compile_schema", fail)
+    monkeypatch.setattr(generate_model_module, "validate_json_schema", fail)
+    Model = generate_basemodel(SCHEMA, disk_cache=DiskCache(tmp_path / "cache"))
+    person = Model(name="Alice", gender="female", friends=[{"name": "Bob"}])
+    assert person.friends[0].name == "Bob"
+    with pytest.raises(ValidationError):
+        Model(name="")
+
+
+def test_disk_cache_key(tmp_path: Path) -> None:
+    disk_cache = DiskCache(tmp_path)
+    key = disk_cache.make_key(SCHEMA)
+    assert key == disk_cache.make_key(dict(SCHEMA))
+    assert key != disk_cache.make_key(SCHEMA, model_name="Other")
+    assert key != disk_cache.make_key(SCHEMA, schema_store={"a.json": {}})
+
+
+def test_disk_cache_ignores_corrupt_entries(tmp_path: Path) -> None:
+    disk_cache = DiskCache(tmp_path)
+    key = disk_cache.make_key(SCHEMA)
+    (tmp_path / f"{key}.json").write_text("{not json")
+    assert disk_cache.load(key) is None
+    Model = generate_basemodel(SCHEMA, disk_cache=disk_cache)
+    assert Model(name="Alice").name == "Alice"
+    assert disk_cache.load(key) is not None
+    disk_cache.clear()
+    assert disk_cache.load(key) is None
@@ -1,6 +1,12 @@
+import sys
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Literal, get_args, get_origin
+
 import pytest
 from pydantic import ValidationError
-from pydanticmodelgen import generate_basemodel
+from pydanticmodelgen import EnumRegistry, generate_basemodel
+from pydanticmodelgen.translation.field_type import load_enum_value
 
 
 def test_enum():
@@ -22,3 +28,75 @@ def test_enum_wrong():
     model = generate_basemodel(schema)
     with pytest.raises(ValidationError):
         model(color="yellow")
+
+
+def test_enum_registry_shares_enums_across_runs():
+    registry = EnumRegistry()
+    first = generate_basemodel(
+        {"type": "object", "properties": {"color": {"enum": ["red", "green"]}}},
+        enum_registry=registry,
+    )
+    second = generate_basemodel(
+        {"type": "object", "properties": {"paint": {"enum": ["red", "green"]}}},
+        enum_registry=registry,
+    )
+    assert len(registry) == 1
+    assert first.model_fields["color"].annotation is second.model_fields["paint"].annotation
+
+
+def test_large_enum_as_literal():
+    values = [f"code_{index}" for index in range(100)]
+    schema = {
+        "type": "object",
+        "properties": {"code": {"enum": values}, "small": {"enum": ["a", "b"]}},
+    }
+    model = generate_basemodel(schema, enum_registry=EnumRegistry(large_enum_threshold=10))
+    assert get_origin(model.model_fields["code"].annotation) is Literal
+    assert issubclass(model.model_fields["small"].annotation, Enum)
+    assert model(code="code_99", small="a").model_dump() == {"code": "code_99", "small": "a"}
+    with pytest.raises(ValidationError):
+        model(code="code_100")
+    assert model.model_json_schema()["properties"]["code"]["enum"] == values
+
+
+def test_large_date_enum():
+    values = ["2020-01-01", "2020-01-02", "2020-01-03"]
+    schema = {"type": "object", "properties": {"day": {"enum": values, "format": "date"}}}
+    model = generate_basemodel(schema, enum_registry=EnumRegistry(large_enum_threshold=2))
+    assert model(day=date(2020, 1, 2)).day == date(2020, 1, 2)
+    assert model(day="2020-01-03").day == date(2020, 1, 3)
+    with pytest.raises(ValidationError):
+        model(day="2020-01-04")
+    assert model.model_json_schema()["properties"]["day"]["enum"] == values
+
+
+@pytest.mark.parametrize(
+    ("value", "format", "expected"),
+    [
+        ("2020-01-02T03:04:05", "date-time", datetime(2020, 1, 2, 3, 4, 5)),
+        ("January 2nd, 2020", "date-time", datetime(2020, 1, 2)),
+        ("2020-01-02", "date", date(2020, 1, 2)),
+        ("2020/01/02", "date", date(2020, 1, 2)),
+        ("03:04", "time", time(3, 4)),
+        ("3pm", "time", time(15)),
+    ],
+)
+def test_load_enum_value(value, format, expected):
+    assert load_enum_value(value, format) == expected
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 9, 1), reason="typing.Literal caches 1 and True as the same type"
+)
+def test_enum_registry_distinguishes_types_of_equal_values():
+    registry = EnumRegistry(large_enum_threshold=0)
+    flags = generate_basemodel(
+        {"type": "object", "properties": {"x": {"enum": [True, False]}}}, enum_registry=registry
+    )
+    numbers = generate_basemodel(
+        {"type": "object", "properties": {"x": {"enum": [1, 0]}}}, enum_registry=registry
+    )
+    assert len(registry) == 2
+    assert get_args(flags.model_fields["x"].annotation) == (True, False)
+    assert get_args(numbers.model_fields["x"].annotation) == (1, 0)
+    assert type(numbers(x=1).x) is int
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+from pydanticmodelgen import generate_basemodel, generate_dataclass
+
+SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "title": "Person",
+    "required": ["name"],
+    "properties": {
+        "name": {"type": "string", "format": "short"},
+        "tags": {"type": "array", "items": {"type": "string"}, "default": ["new"]},
+        "ids": {"type": "array", "items": {"type": "integer"}, "uniqueItems": True},
+        "address": {"type": "object", "properties": {"city": {"type": "string"}}},
+        "friends": {"type": "array", "items": {"$ref": "#"}},
+    },
+}
+
+
+def is_short(value: str) -> bool:
+    return len(value) < 5
+
+
+def test_frozen_model() -> None:
+    Model = generate_basemodel(SCHEMA, frozen=True)
+    instance = Model(name="x", ids=[1, 1], address={"city": "y"}, friends=[{"name": "z"}])
+    assert instance.tags == ("new",)
+    assert instance.ids == frozenset({1})
+    assert isinstance(instance.friends, tuple)
+    assert hash(instance) == hash(
+        Model(name="x", ids=[1], address={"city": "y"}, friends=[{"name": "z"}])
+    )
+    with pytest.raises(ValidationError):
+        instance.name = "other"  # type: ignore[misc]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Slotted dataclasses need Python 3.10")
+def test_dataclass() -> None:
+    Person = generate_dataclass(SCHEMA, format_validation={"short": is_short})
+    person = Person(name="x", friends=[{"name": "z"}], unknown=1)
+    assert not hasattr(person, "__dict__")
+    assert type(person.friends[0]) is Person
+    assert person.tags == ["new"]
+    person.name = "y"
+    with pytest.raises(ValidationError, match="Invalid value for format"):
+        Person(name="too long")
+    with pytest.raises(ValidationError):
+        Person()
+    loaded = TypeAdapter(Person).validate_json('{"name": "a", "address": {"city": "b"}}')
+    assert loaded.address.city == "b"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Slotted dataclasses need Python 3.10")
+def test_frozen_dataclass() -> None:
+    Person = generate_dataclass(SCHEMA, frozen=True)
+    person = Person(name="x", tags=["a"])
+    assert person == Person(name="x", tags=("a",))
+    assert len({person, Person(name="x", tags=["a"])}) == 1
+    with pytest.raises(AttributeError):
+        person.name = "y"
@@ -105,7 +105,6 @@ SCHEMA_WITH_PATTERN = {
     },
 }
 
-# TODO
 SCHEMA_WITH_OBJECT_REF = {
     "type": "object",
     "properties": {
@@ -211,3 +210,12 @@ def test_complex_schema() -> None:
     with pytest.raises(ValidationError):
         # Not enough items in "tags"
         Model(id="some_id", email="test@example.com", tags=[])
+
+
+def test_object_ref() -> None:
+    Model = generate_basemodel(SCHEMA_WITH_OBJECT_REF)
+    obj = Model(person={"name": "Alice", "age": 30})
+    assert obj.person.name == "Alice"
+
+    with pytest.raises(ValidationError):
+        Model(person={"name": "Alice", "age": "thirty"})
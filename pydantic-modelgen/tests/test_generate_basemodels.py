@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Any, get_args
+
+from pydanticmodelgen import generate_basemodels
+
+ADDRESS = {
+    "type": "object",
+    "properties": {"street": {"type": "string"}, "city": {"type": "string"}},
+}
+STATUS = {"type": "string", "enum": ["active", "inactive"]}
+
+SCHEMAS = {
+    "Person": {
+        "type": "object",
+        "properties": {
+            "addresses": {"type": "array", "items": ADDRESS},
+            "status": STATUS,
+        },
+    },
+    "Company": {
+        "type": "object",
+        "properties": {
+            "offices": {"type": "array", "items": ADDRESS},
+            "status": STATUS,
+            "mode": {"enum": ["active", "inactive"]},
+        },
+    },
+}
+
+
+def item_type(annotation: Any) -> Any:
+    (annotated_item,) = get_args(annotation)
+    return get_args(annotated_item)[0]
+
+
+def test_generate_basemodels() -> None:
+    models, _ = generate_basemodels(SCHEMAS)
+    assert set(models) == {"Person", "Company"}
+    assert models["Person"].__name__ == "Person"
+    person = models["Person"](addresses=[{"street": "Main St", "city": "Springfield"}])
+    assert person.addresses[0].city == "Springfield"
+
+
+def test_shared_nested_models_and_enums() -> None:
+    models, report = generate_basemodels(SCHEMAS)
+    person_address = item_type(models["Person"].model_fields["addresses"].annotation)
+    company_address = item_type(models["Company"].model_fields["offices"].annotation)
+    assert person_address is company_address
+    assert models["Person"].model_fields["status"].annotation is (
+        models["Company"].model_fields["status"].annotation
+    )
+    assert report.models_built == 3
+    assert report.models_shared == 1
+    assert report.enums_built == 1
+    assert report.enums_shared == 2
+    assert report.shared == 3
+
+
+def test_references_between_schemas() -> None:
+    schemas = {
+        "Employee": {"type": "object", "properties": {"employer": {"$ref": "Employer"}}},
+        "Employer": {"type": "object", "properties": {"name": {"type": "string"}}},
+    }
+    models, _ = generate_basemodels(schemas)
+    assert models["Employee"].model_fields["employer"].annotation is models["Employer"]
+
+
+def test_nested_models_with_equal_defaults_of_other_types_are_not_shared() -> None:
+    def nested(default: Any) -> dict[str, Any]:
+        inner = {"type": "object", "properties": {"n": {"type": "number", "default": default}}}
+        return {"type": "object", "properties": {"inner": inner}}
+
+    models, report = generate_basemodels({"C": nested(False), "D": nested(0)})
+    assert models["C"](inner={}).inner.n is False
+    d_default = models["D"](inner={}).inner.n
+    assert d_default == 0 and type(d_default) is int
+    assert report.models_shared == 0
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+from pydanticmodelgen import generate_basemodel, regenerate_basemodel
+
+SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "title": "Person",
+    "properties": {
+        "name": {"type": "string"},
+        "kind": {"enum": ["a", "b"]},
+        "address": {
+            "type": "object",
+            "properties": {
+                "city": {"type": "string"},
+                "geo": {"type": "object", "properties": {"lat": {"type": "number"}}},
+            },
+        },
+        "tags": {"type": "array", "items": {"$ref": "#/definitions/Tag"}},
+    },
+    "definitions": {"Tag": {"type": "object", "properties": {"label": {"type": "string"}}}},
+}
+
+
+def annotation(model: Any, *path: str) -> Any:
+    for name in path:
+        model = model.model_fields[name].annotation
+    return model
+
+
+def test_changed_nested_model() -> None:
+    Model = generate_basemodel(SCHEMA)
+    new_schema = copy.deepcopy(SCHEMA)
+    new_schema["properties"]["address"]["properties"]["zip"] = {"type": "string"}
+    new_schema["properties"]["age"] = {"type": "integer"}
+
+    result = regenerate_basemodel(SCHEMA, new_schema, Model)
+    assert result.diff.added == ("age",)
+    assert result.diff.changed == ("address",)
+    assert result.diff.unchanged == ("name", "kind", "tags")
+    assert result.report.models_built == 2  # The root and the address
+    NewModel = result.model
+    for name in ("kind", "tags"):
+        assert annotation(NewModel, name) is annotation(Model, name)
+    assert annotation(NewModel, "address", "geo") is annotation(Model, "address", "geo")
+    instance = NewModel(age=3, address={"zip": "12345", "geo": {"lat": 1.5}})
+    assert instance.address.zip == "12345"
+
+
+def test_changed_definition() -> None:
+    Model = generate_basemodel(SCHEMA)
+    new_schema = copy.deepcopy(SCHEMA)
+    new_schema["definitions"]["Tag"]["required"] = ["label"]
+
+    result = regenerate_basemodel(SCHEMA, new_schema, Model)
+    assert not result.diff.has_changes
+    assert result.model is not Model
+    assert annotation(result.model, "address") is annotation(Model, "address")
+    assert result.model(tags=[{"label": "x"}]).tags[0].label == "x"
+    assert Model(tags=[{}]).tags[0].label is None
+
+
+def test_unchanged_schema() -> None:
+    Model = generate_basemodel(SCHEMA)
+    result = regenerate_basemodel(SCHEMA, copy.deepcopy(SCHEMA), Model)
+    assert result.model is Model
+    assert result.report.models_built == 0
+
+
+def test_chained_regeneration() -> None:
+    Model = generate_basemodel(SCHEMA)
+    second = copy.deepcopy(SCHEMA)
+    second["properties"]["age"] = {"type": "integer"}
+    third = copy.deepcopy(second)
+    del third["properties"]["name"]
+    SecondModel = regenerate_basemodel(SCHEMA, second, Model).model
+    result = regenerate_basemodel(second, third, SecondModel)
+    assert result.diff.removed == ("name",)
+    assert annotation(result.model, "address") is annotation(Model, "address")
+
+
+def test_unknown_model_is_rebuilt() -> None:
+    Model = generate_basemodel(SCHEMA)
+    other_schema = {**SCHEMA, "title": "Other"}
+    result = regenerate_basemodel(other_schema, SCHEMA, Model)
+    assert result.model is not Model
+    assert result.fields_reused == 0
@@ -0,0 +1,89 @@
+import json
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+from pydanticmodelgen import (
+    compile_schema,
+    diff_models,
+    generate_basemodel_from_ir,
+    node_from_dict,
+)
+from pydanticmodelgen.ir import ArrayType, EnumType, ModelType, RefType, ScalarType
+
+SCHEMA = {
+    "title": "Order",
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer", "minimum": 1},
+        "status": {"enum": ["open", "closed"]},
+        "tags": {"type": "array", "items": {"type": "string", "maxLength": 3}, "uniqueItems": True},
+        "customer": {"type": "object", "properties": {"name": {"type": "string"}}},
+        "parent": {"$ref": "#"},
+    },
+    "required": ["id"],
+}
+
+
+def test_compile_schema() -> None:
+    schema_ir = compile_schema(SCHEMA)
+    fields = {field.name: field for field in schema_ir.root_model.fields}
+    assert schema_ir.root_model.name == "Order"
+    assert fields["id"].type == ScalarType("int")
+    assert fields["id"].required
+    assert dict(fields["id"].constraints) == {"ge": 1}
+    assert fields["status"].type == EnumType("status", ("open", "closed"))
+    assert fields["tags"].type == ArrayType(ScalarType("str"), (("max_length", 3),), unique=True)
+    assert isinstance(fields["customer"].type, ModelType)
+    assert fields["parent"].type == RefType(schema_ir.root)
+
+
+def test_ir_is_hashable_and_canonical() -> None:
+    reordered = {**SCHEMA, "properties": dict(SCHEMA["properties"])}
+    assert compile_schema(reordered) == compile_schema(SCHEMA)
+    assert hash(compile_schema(reordered)) == hash(compile_schema(SCHEMA))
+    assert compile_schema(SCHEMA, model_name="Other") != compile_schema(SCHEMA)
+
+
+def test_ir_serialization_roundtrip() -> None:
+    schema_ir = compile_schema(SCHEMA)
+    assert node_from_dict(json.loads(json.dumps(schema_ir.to_dict()))) == schema_ir
+
+
+def test_generate_basemodel_from_ir() -> None:
+    Model = generate_basemodel_from_ir(compile_schema(SCHEMA))
+    order = Model(id=1, status="open", tags=["a"], parent={"id": 2})
+    assert order.parent.id == 2
+    with pytest.raises(ValidationError):
+        Model(id=0)
+    with pytest.raises(ValidationError):
+        Model(id=1, tags=["abcd"])
+
+
+def test_diff_models() -> None:
+    changed = {
+        **SCHEMA,
+        "properties": {
+            **{key: value for key, value in SCHEMA["properties"].items() if key != "tags"},
+            "id": {"type": "integer", "minimum": 0},
+            "note": {"type": "string"},
+        },
+    }
+    diff = diff_models(compile_schema(SCHEMA).root_model, compile_schema(changed).root_model)
+    assert diff.added == ("note",)
+    assert diff.removed == ("tags",)
+    assert diff.changed == ("id",)
+    assert set(diff.unchanged) == {"status", "customer", "parent"}
+    assert diff.has_changes
+
+
+def test_ir_distinguishes_types_of_equal_values() -> None:
+    def compile_default(default: Any) -> Any:
+        schema = {"type": "object", "properties": {"x": {"type": "number", "default": default}}}
+        return compile_schema(schema)
+
+    schema_irs = [compile_default(default) for default in (0, False, 0.0)]
+    assert len(set(schema_irs)) == 3
+    assert schema_irs[0] != schema_irs[1]
+    assert compile_default([1]) == compile_default((1,))
+    assert EnumType("x", (1, 0)) != EnumType("x", (True, False))
@@ -0,0 +1,75 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+from pydanticmodelgen import generate_basemodel, generate_basemodels
+from pydanticmodelgen.lazy import LazyModel
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "address": {
+            "type": "object",
+            "properties": {"city": {"type": "string"}},
+            "required": ["city"],
+        },
+        "orders": {
+            "type": "array",
+            "items": {"type": "object", "properties": {"amount": {"type": "integer"}}},
+        },
+        "parent": {"$ref": "#"},
+    },
+}
+
+
+def get_lazy_model(model: Any, field_name: str) -> LazyModel:
+    field = model.model_fields[field_name]
+    metadata = field.metadata or field.annotation.__args__[0].__metadata__
+    return next(item for item in metadata if isinstance(item, LazyModel))
+
+
+def test_models_are_built_on_first_use() -> None:
+    Model = generate_basemodel(SCHEMA, lazy=True)
+    address = get_lazy_model(Model, "address")
+    orders = get_lazy_model(Model, "orders")
+    assert not address.is_built
+    assert not orders.is_built
+
+    instance = Model(address={"city": "Berlin"})
+    assert address.is_built
+    assert not orders.is_built
+    assert isinstance(instance.address, address.model)
+    assert instance.model_dump() == {"address": {"city": "Berlin"}, "orders": None, "parent": None}
+
+
+def test_validation() -> None:
+    Model = generate_basemodel(SCHEMA, lazy=True)
+    instance = Model.model_validate_json('{"parent": {"orders": [{"amount": 3}]}}')
+    assert type(instance.parent) is Model
+    assert instance.parent.orders[0].amount == 3
+    with pytest.raises(ValidationError) as exc_info:
+        Model(parent={"address": {}, "orders": [{"amount": "x"}]})
+    assert [error["loc"] for error in exc_info.value.errors()] == [
+        ("parent", "address", "city"),
+        ("parent", "orders", 0, "amount"),
+    ]
+
+
+def test_shared_between_models() -> None:
+    address = {"type": "object", "properties": {"city": {"type": "string"}}}
+    schemas = {
+        "Address": address,
+        "Person": {"type": "object", "properties": {"home": {"$ref": "Address"}}},
+    }
+    models, report = generate_basemodels(schemas, lazy=True)
+    assert report.models_built == 2
+    home = models["Person"](home={"city": "Paris"}).home
+    assert type(home) is models["Address"]
+
+
+def test_concurrent_first_use() -> None:
+    Model = generate_basemodel(SCHEMA, lazy=True)
+    with ThreadPoolExecutor(8) as executor:
+        instances = list(executor.map(lambda _: Model(address={"city": "Rome"}), range(32)))
+    assert len({type(instance.address) for instance in instances}) == 1
@@ -0,0 +1,69 @@
+import pytest
+from pydantic import BaseModel, ValidationError
+from pydanticmodelgen import generate_basemodel
+
+POINT = {
+    "type": "object",
+    "properties": {"x": {"type": "number"}, "y": {"type": "number"}},
+    "required": ["x", "y"],
+}
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "start": POINT,
+        "end": POINT,
+        "meta": {
+            "type": "object",
+            "properties": {
+                "author": {
+                    "type": "object",
+                    "properties": {"name": {"type": "string"}},
+                    "required": ["name"],
+                },
+            },
+        },
+    },
+}
+
+
+def test_nested_object() -> None:
+    Model = generate_basemodel(SCHEMA)
+    obj = Model(start={"x": 0, "y": 1}, meta={"author": {"name": "Alice"}})
+    assert obj.start.y == 1
+    assert obj.meta.author.name == "Alice"
+    assert isinstance(obj.meta, BaseModel)
+
+
+def test_nested_object_wrong() -> None:
+    Model = generate_basemodel(SCHEMA)
+    with pytest.raises(ValidationError):
+        Model(start={"x": 0})
+    with pytest.raises(ValidationError):
+        Model(meta={"author": {}})
+
+
+def test_identical_nested_objects_share_model() -> None:
+    Model = generate_basemodel(SCHEMA)
+    fields = Model.model_fields
+    assert fields["start"].annotation is fields["end"].annotation
+    assert fields["start"].annotation.__name__ == "startObject"
+
+
+def test_titled_nested_objects_are_not_merged() -> None:
+    schema = {
+        "type": "object",
+        "properties": {
+            "home": {**POINT, "title": "Home"},
+            "work": {**POINT, "title": "Work"},
+            "other": {**POINT, "title": "Work"},
+            "point": POINT,
+        },
+    }
+    Model = generate_basemodel(schema)
+    fields = Model.model_fields
+    assert fields["home"].annotation.__name__ == "Home"
+    assert fields["work"].annotation.__name__ == "Work"
+    assert fields["other"].annotation is fields["work"].annotation
+    assert fields["point"].annotation.__name__ == "pointObject"
+    assert set(Model.model_json_schema()["$defs"]) == {"Home", "Work", "pointObject"}
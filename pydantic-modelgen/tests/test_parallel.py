@@ -0,0 +1,46 @@
+import json
+
+import pytest
+from jsonschema import ValidationError
+from pydanticmodelgen import ParallelValidator
+
+SCHEMA = {
+    "type": "object",
+    "required": ["name"],
+    "properties": {
+        "name": {"type": "string"},
+        "age": {"type": "integer", "format": "even"},
+        "address": {"type": "object", "properties": {"street": {"type": "string"}}},
+    },
+}
+
+
+def is_even(value: int) -> bool:
+    return value % 2 == 0
+
+
+def test_results_in_order() -> None:
+    records = [{"name": str(index), "age": index, "address": {}} for index in range(50)]
+    records[10] = {"age": 10}
+    with ParallelValidator(
+        SCHEMA, max_workers=2, chunk_size=7, format_validation={"even": is_even}
+    ) as validator:
+        results = list(validator.validate(records))
+        json_results = list(
+            validator.validate_json(json.dumps(record).encode() for record in records)
+        )
+
+    for chunks in (results, json_results):
+        assert len(chunks) == 8
+        indices = [index for result in chunks for index in result.indices]
+        assert indices == [index for index in range(0, 50, 2) if index != 10]
+        errors = [error for result in chunks for error in result.errors]
+        assert [error.record_index for error in errors] == sorted([10, *range(1, 50, 2)])
+        instances = [instance for result in chunks for instance in result.instances]
+        assert isinstance(instances[0], validator.model)
+        assert instances[0].model_dump() == {"name": "0", "age": 0, "address": {"street": None}}
+
+
+def test_invalid_schema() -> None:
+    with pytest.raises(ValidationError):
+        ParallelValidator({"type": 1}, max_workers=1)
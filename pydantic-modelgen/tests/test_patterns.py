@@ -0,0 +1,77 @@
+import re
+
+import pytest
+from pydantic import ValidationError
+from pydanticmodelgen import clear_pattern_cache, generate_basemodel, pattern_cache_info
+from pydanticmodelgen.patterns import get_pattern, normalize_pattern
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        (r"^\d+$", "^[0-9]+$"),
+        (r"[\w-]", "[a-zA-Z0-9_-]"),
+        (r"\D\W", "[^0-9][^a-zA-Z0-9_]"),
+        (r"(?<year>\d{4})", "(?P<year>[0-9]{4})"),
+        (r"(?<=a)b(?<!c)", "(?<=a)b(?<!c)"),
+        (r"[[]", r"[\[]"),
+        (r"[^]", r"[\s\S]"),
+        (r"a[]", "a(?!)"),
+        (r"[$]\$", r"[$]\$"),
+    ],
+)
+def test_normalize_pattern(pattern: str, expected: str) -> None:
+    assert normalize_pattern(pattern) == expected
+
+
+def schema_with_pattern(pattern: str) -> dict:
+    return {"type": "object", "properties": {"code": {"type": "string", "pattern": pattern}}}
+
+
+def test_ecma_semantics() -> None:
+    Model = generate_basemodel(schema_with_pattern(r"^\d+$"))
+    assert Model(code="123").code == "123"
+    with pytest.raises(ValidationError):
+        Model(code="١٢٣")  # Arabic-Indic digits are no ASCII digits
+    Unanchored = generate_basemodel(schema_with_pattern("b"))
+    assert Unanchored(code="abc").code == "abc"
+
+
+def test_python_fallback() -> None:
+    pattern = r"^(a+)-\1$"
+    assert isinstance(get_pattern(pattern), re.Pattern)
+    Model = generate_basemodel(schema_with_pattern(pattern))
+    assert Model(code="aa-aa").code == "aa-aa"
+    for invalid in ("aa-a", "aa-aa\n"):
+        with pytest.raises(ValidationError):
+            Model(code=invalid)
+
+
+@pytest.mark.parametrize("pattern", [r"^a\d+$", r"^(a+)-\1$", "^[a-z]+$"])
+def test_json_schema_keeps_pattern(pattern: str) -> None:
+    schema = {
+        "type": "object",
+        "properties": {
+            "code": {"type": "string", "pattern": pattern},
+            "codes": {"type": "array", "items": {"type": "string", "pattern": pattern}},
+        },
+    }
+    properties = generate_basemodel(schema).model_json_schema()["properties"]
+    assert properties["code"]["pattern"] == pattern
+    assert properties["codes"]["items"]["pattern"] == pattern
+
+
+def test_cache_info() -> None:
+    clear_pattern_cache()
+    schema = {
+        "type": "object",
+        "properties": {
+            "a": {"type": "string", "pattern": "^[a-z]+$"},
+            "b": {"type": "array", "items": {"type": "string", "pattern": "^[a-z]+$"}},
+            "c": {"type": "string", "pattern": "(?=x)"},
+        },
+    }
+    generate_basemodel(schema)
+    assert pattern_cache_info() == (1, 2, 2, 1, 1)
+    clear_pattern_cache()
+    assert pattern_cache_info() == (0, 0, 0, 0, 0)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import pickle
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+from pydanticmodelgen import dumps_for_known_models, generate_basemodel, register_model
+
+SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "title": "Person",
+    "properties": {
+        "name": {"type": "string"},
+        "kind": {"enum": ["a", "b"]},
+        "address": {"type": "object", "properties": {"city": {"type": "string"}}},
+        "friends": {"type": "array", "items": {"$ref": "#"}},
+    },
+}
+
+CHILD_SCRIPT = """
+import json, pickle, sys
+from pydanticmodelgen import generate_basemodel
+Model = generate_basemodel(json.loads(sys.argv[1]))
+instance = Model(name="x", address={"city": "y"}, friends=[{"kind": "b"}])
+sys.stdout.buffer.write(pickle.dumps(instance))
+"""
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_round_trip(lazy: bool) -> None:
+    Model = generate_basemodel(SCHEMA, lazy=lazy)
+    instance = Model(name="x", kind="a", address={"city": "y"}, friends=[{"name": "z"}])
+    loaded = pickle.loads(pickle.dumps(instance))
+    assert type(loaded) is Model
+    assert type(loaded.address) is type(instance.address)
+    assert loaded == instance
+
+
+def test_pickle_model_by_reference() -> None:
+    Model = generate_basemodel(SCHEMA)
+    path = register_model(Model)
+    assert path.startswith("pydanticmodelgen.registry.Person_")
+    assert path.endswith(".Person")
+    assert pickle.loads(pickle.dumps(Model)) is Model
+    with pytest.raises(TypeError):
+        register_model(BaseModel)
+
+
+def pickle_in_other_process(schema: dict[str, Any]) -> bytes:
+    return subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, json.dumps(schema)],
+        check=True,
+        capture_output=True,
+    ).stdout
+
+
+def test_models_are_registered_when_generated() -> None:
+    Model = generate_basemodel(SCHEMA)
+    name = repr(Model)
+    assert Model.__module__ == "pydanticmodelgen.registry"
+    assert Model.__qualname__.endswith(".Person")
+    pickle.dumps(Model(friends=[{}]))
+    assert repr(Model) == name
+    assert "Person" in Model.model_json_schema()["$defs"]
+
+
+def test_load_in_other_process() -> None:
+    Model = generate_basemodel(SCHEMA)
+    register_model(Model)
+    instance = pickle.loads(pickle_in_other_process(SCHEMA))
+    assert type(instance) is Model
+    assert type(instance.friends[0]) is Model
+    assert instance.address.city == "y"
+
+
+def test_load_unknown_model() -> None:
+    schema = {**SCHEMA, "title": "Stranger"}
+    instance = pickle.loads(pickle_in_other_process(schema))
+    assert type(instance).__name__ == "Stranger"
+    assert instance.friends[0].kind == "b"
+    assert type(instance.friends[0]) is type(instance)
+    assert type(pickle.loads(pickle.dumps(instance))) is type(instance)
+
+
+def test_pickle_enum_by_reference() -> None:
+    Model = generate_basemodel(SCHEMA)
+    enum_class = Model.model_fields["kind"].annotation
+    assert enum_class.__module__ == "pydanticmodelgen.registry"
+    assert enum_class.__qualname__.endswith(".kindEnum")
+    assert pickle.loads(pickle.dumps(enum_class)) is enum_class
+    assert pickle.loads(pickle.dumps(enum_class("a"))) is enum_class("a")
+
+
+def test_leave_out_known_definitions() -> None:
+    Model = generate_basemodel(SCHEMA)
+    instance = Model(name="x", friends=[{"name": "z"}])
+    full = pickle.dumps(instance)
+    short = dumps_for_known_models(instance, [Model])
+    assert len(short) < len(full)
+    assert pickle.loads(short) == instance
+    assert len(pickle.dumps(instance)) == len(full)
+
+
+def test_load_left_out_definitions_in_other_process() -> None:
+    Model = generate_basemodel(SCHEMA)
+    data = dumps_for_known_models(Model(), [Model])
+    process = subprocess.run(
+        [sys.executable, "-c", "import pickle, sys; pickle.loads(sys.stdin.buffer.read())"],
+        input=data,
+        capture_output=True,
+    )
+    assert process.returncode != 0
+    assert b"UnpicklingError" in process.stderr
@@ -0,0 +1,50 @@
+from pydanticmodelgen import GenerationProfile, generate_basemodel, profile_generation
+from pydanticmodelgen.validation import clear_validated_schemas
+
+SCHEMA = {
+    "title": "Person",
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "format": "name"},
+        "birthday": {"enum": ["2000-01-01", "2001-01-01"], "format": "date"},
+        "address": {"type": "object", "properties": {"street": {"type": "string"}}},
+    },
+}
+
+
+def test_profile_generation() -> None:
+    clear_validated_schemas()
+    profiles: list[GenerationProfile] = []
+    with profile_generation(profiles.append) as profile:
+        generate_basemodel(SCHEMA, format_validation={"name": str.istitle})
+
+    assert profiles == [profile]
+    for phase in ("meta_validation", "compile", "enums", "enum_values", "create_model"):
+        assert profile.calls[phase] >= 1
+        assert profile.timings[phase] >= 0
+    assert profile.calls["create_model"] == 2
+    assert profile.counts == {
+        "models": 2,
+        "nested_models": 1,
+        "referenced_models": 1,
+        "enums": 1,
+        "fields": 4,
+        "validators": 1,
+    }
+    assert set(profile.property_timings) == {
+        "Person.name",
+        "Person.birthday",
+        "Person.address",
+        "addressObject.street",
+    }
+    slowest_name, slowest_time = profile.slowest_properties(1)[0]
+    assert slowest_time == max(profile.property_timings.values())
+    assert slowest_name in profile.property_timings
+
+
+def test_no_profile_outside_context() -> None:
+    with profile_generation() as profile:
+        pass
+    generate_basemodel(SCHEMA)
+    assert not profile.timings
+    assert not profile.counts
@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+from pydanticmodelgen import generate_basemodel, load_schema_store
+from pydanticmodelgen.errors import UnresolvableReferenceError
+
+SCHEMA_WITH_DEFS = {
+    "type": "object",
+    "properties": {
+        "home": {"$ref": "#/$defs/Address"},
+        "work": {"$ref": "#/$defs/Address", "description": "The work address"},
+        "previous": {"type": "array", "items": {"$ref": "#/$defs/Address"}},
+        "zip_code": {"$ref": "#/$defs/ZipCode"},
+    },
+    "required": ["home"],
+    "$defs": {
+        "Address": {"type": "object", "properties": {"city": {"type": "string"}}},
+        "ZipCode": {"type": "string", "pattern": "^[0-9]{5}$"},
+    },
+}
+
+RECURSIVE_SCHEMA = {
+    "title": "Node",
+    "type": "object",
+    "properties": {
+        "value": {"type": "integer"},
+        "children": {"type": "array", "items": {"$ref": "#"}},
+        "parent": {"$ref": "#/definitions/Parent"},
+    },
+    "definitions": {
+        "Parent": {"type": "object", "properties": {"node": {"$ref": "#"}}},
+    },
+}
+
+
+def test_ref_targets_are_built_once() -> None:
+    Model = generate_basemodel(SCHEMA_WITH_DEFS)
+    fields = Model.model_fields
+    assert fields["home"].annotation is fields["work"].annotation
+    assert fields["home"].annotation.__name__ == "Address"
+    assert fields["work"].description == "The work address"
+    obj = Model(home={"city": "Berlin"}, previous=[{"city": "Paris"}])
+    assert isinstance(obj.previous[0], fields["home"].annotation)
+
+
+def test_ref_to_non_object() -> None:
+    Model = generate_basemodel(SCHEMA_WITH_DEFS)
+    assert Model(home={}, zip_code="12345").zip_code == "12345"
+    with pytest.raises(ValidationError):
+        Model(home={}, zip_code="1234")
+
+
+def test_recursive_ref() -> None:
+    Model = generate_basemodel(RECURSIVE_SCHEMA)
+    obj = Model(value=1, children=[{"value": 2, "children": [{"value": 3}]}])
+    assert obj.children[0].children[0].value == 3
+    assert isinstance(obj.children[0], Model)
+    assert Model(parent={"node": {"value": 4}}).parent.node.value == 4
+    with pytest.raises(ValidationError):
+        Model(children=[{"value": "not a number"}])
+
+
+def test_ref_to_store(tmp_path: Path) -> None:
+    (tmp_path / "common").mkdir()
+    address = {
+        "definitions": {
+            "Address": {"type": "object", "properties": {"zip": {"$ref": "#/definitions/Zip"}}},
+            "Zip": {"type": "string", "maxLength": 5},
+        }
+    }
+    (tmp_path / "common" / "address.json").write_text(json.dumps(address))
+    schema = {
+        "type": "object",
+        "properties": {"address": {"$ref": "common/address.json#/definitions/Address"}},
+    }
+    Model = generate_basemodel(schema, schema_store=load_schema_store(tmp_path))
+    assert Model(address={"zip": "12345"}).address.zip == "12345"
+    with pytest.raises(ValidationError):
+        Model(address={"zip": "123456"})
+
+
+def test_unresolvable_ref() -> None:
+    with pytest.raises(UnresolvableReferenceError):
+        generate_basemodel({"type": "object", "properties": {"a": {"$ref": "#/$defs/Missing"}}})
+    with pytest.raises(UnresolvableReferenceError):
+        generate_basemodel({"type": "object", "properties": {"a": {"$ref": "other.json#"}}})
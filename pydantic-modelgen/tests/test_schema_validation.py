@@ -0,0 +1,49 @@
+import pytest
+from jsonschema import ValidationError
+from pydanticmodelgen import generate_basemodel, validation
+from pydanticmodelgen.validation import clear_validated_schemas, validate_json_schema
+
+NESTED_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "items": {
+            "type": "array",
+            "items": {"type": "object", "properties": {"name": {"type": "string"}}},
+        },
+    },
+}
+
+
+class CountingValidator:
+    def __init__(self) -> None:
+        self.validator = validation.get_meta_schema_validator()
+        self.calls = 0
+
+    def iter_errors(self, schema):
+        self.calls += 1
+        return self.validator.iter_errors(schema)
+
+
+@pytest.fixture
+def counting_validator(monkeypatch: pytest.MonkeyPatch) -> CountingValidator:
+    clear_validated_schemas()
+    counter = CountingValidator()
+    monkeypatch.setattr(validation, "get_meta_schema_validator", lambda: counter)
+    yield counter
+    clear_validated_schemas()
+
+
+def test_invalid_schema() -> None:
+    with pytest.raises(ValidationError):
+        generate_basemodel({"type": "object", "properties": {"name": {"type": 1}}})
+
+
+def test_validates_document_once(counting_validator: CountingValidator) -> None:
+    generate_basemodel(NESTED_SCHEMA)
+    assert counting_validator.calls == 1
+
+
+def test_remembers_validated_schemas(counting_validator: CountingValidator) -> None:
+    validate_json_schema(NESTED_SCHEMA)
+    validate_json_schema(dict(NESTED_SCHEMA))
+    assert counting_validator.calls == 1
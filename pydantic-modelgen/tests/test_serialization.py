@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+import warnings
+from typing import Any
+
+from pydanticmodelgen import dump_many_json, generate_basemodel
+
+SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "color": {"enum": ["red", "green"]},
+        "colors": {"type": "array", "uniqueItems": True, "items": {"enum": ["red", "green"]}},
+        "created": {"type": "string", "format": "date-time"},
+        "address": {"type": "object", "properties": {"city": {"type": "string"}}},
+    },
+}
+
+RECORDS = [
+    {"color": "red", "colors": ["green"], "created": "2024-01-01T12:00:00Z"},
+    {"address": {"city": "x"}},
+]
+
+
+def test_dump_many_json() -> None:
+    Model = generate_basemodel(SCHEMA)
+    instances = [Model.model_validate(record) for record in RECORDS]
+    expected = [json.loads(instance.model_dump_json()) for instance in instances]
+    assert json.loads(dump_many_json(Model, instances)) == expected
+    ndjson = dump_many_json(Model, iter(instances), ndjson=True, exclude_none=True)
+    assert ndjson.endswith(b"\n")
+    lines = [json.loads(line) for line in ndjson.splitlines()]
+    assert lines == [
+        {key: value for key, value in row.items() if value is not None} for row in expected
+    ]
+    assert dump_many_json(Model, []) == b"[]"
+    assert dump_many_json(Model, [], ndjson=True) == b""
+
+
+def test_enum_values_are_serialized_natively() -> None:
+    Model = generate_basemodel(SCHEMA)
+    instance = Model(color="green", colors=["red"])
+    assert json.loads(instance.model_dump_json())["color"] == "green"
+    assert instance.model_dump()["colors"] == {"red"}
+    assert Model.model_json_schema()["$defs"]["colorEnum"]["enum"] == ["red", "green"]
+    member = Model.model_fields["color"].annotation("red")  # type: ignore[misc]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert Model.model_construct(color=member).model_dump_json().startswith('{"color":"red"')
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+from pydanticmodelgen import StreamStats, generate_basemodel, validate_json_array, validate_ndjson
+from pydanticmodelgen.streaming import iter_json_array_records
+
+SCHEMA = {
+    "type": "object",
+    "required": ["name"],
+    "properties": {"name": {"type": "string"}, "age": {"type": "integer"}},
+}
+
+
+def test_ndjson() -> None:
+    Model = generate_basemodel(SCHEMA)
+    lines = [json.dumps({"name": f"person {index}", "age": index}) for index in range(10)]
+    lines[3] = json.dumps({"age": 3})
+    lines[7] = "{not json"
+    source = io.BytesIO(("\n".join(lines[:5]) + "\n\n" + "\n".join(lines[5:])).encode())
+
+    stats = StreamStats()
+    results = list(validate_ndjson(Model, source, chunk_size=4, stats=stats))
+    assert len(results) == 3
+    assert [index for result in results for index in result.indices] == [0, 1, 2, 4, 5, 6, 8, 9]
+    assert [error.record_index for result in results for error in result.errors] == [3, 7]
+    assert results[1].errors[0].type == "json_invalid"
+    assert results[2].instances[-1].name == "person 9"
+    assert (stats.records, stats.valid_records, stats.invalid_records) == (10, 8, 2)
+    assert stats.bytes == sum(len(line) for line in lines)
+    assert stats.records_per_second > 0
+
+
+def test_ndjson_line_with_several_records() -> None:
+    Model = generate_basemodel(SCHEMA)
+    source = b'{"name": "a"}\n{"name": "b"}, {"name": "c"}\n[{"name": "d"}\n{"name": "e"}]\n'
+    stats = StreamStats()
+    (result,) = validate_ndjson(Model, source, stats=stats)
+    assert result.indices == [0]
+    assert [error.record_index for error in result.errors] == [1, 2, 3]
+    assert (stats.records, stats.invalid_records) == (4, 3)
+
+
+def test_json_array() -> None:
+    Model = generate_basemodel(SCHEMA)
+    records = [{"name": 'with "quotes", [brackets] and {braces} \\', "age": 1}, {"name": "b"}, 5]
+    data = json.dumps(records).encode()
+    chunks = [data[index : index + 3] for index in range(0, len(data), 3)]
+    results = list(validate_json_array(Model, chunks, chunk_size=2))
+    assert [result.indices for result in results] == [[0, 1], []]
+    assert results[0].instances[0].name == records[0]["name"]
+    assert results[1].errors[0].record_index == 2
+
+
+def test_ndjson_lines_with_brackets_in_strings() -> None:
+    Model = generate_basemodel(SCHEMA)
+    source = b'{"name": "a", "s": "}"\n"s2": "{"}\n{"name": "b"}, {"name": "c"}\n{"name": "]"}\n'
+    (result,) = validate_ndjson(Model, source)
+    assert result.indices == [3]
+    assert result.instances[0].name == "]"
+    assert [error.record_index for error in result.errors] == [0, 1, 2]
+
+
+@pytest.mark.parametrize(
+    "data", [b"", b"{}", b'"text"', b"[1, 2", b"[1, 2] trailing", [b"[1]", b" [2]"]]
+)
+def test_not_a_json_array(data: bytes | list[bytes]) -> None:
+    with pytest.raises(ValueError):
+        list(iter_json_array_records(data))
+
+
+def test_empty_json_array() -> None:
+    assert list(iter_json_array_records(b" [ ] ")) == []
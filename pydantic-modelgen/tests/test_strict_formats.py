@@ -0,0 +1,109 @@
+from datetime import timedelta
+from ipaddress import IPv4Address, IPv6Address
+from typing import Any, Dict, List
+
+import pytest
+from pydantic import ValidationError
+from pydanticmodelgen import ModelCache, generate_basemodel, generate_module_source
+from pydanticmodelgen.formats import has_email_validator
+
+
+def schema_with_format(format_name: str) -> Dict[str, Any]:
+    return {
+        "type": "object",
+        "properties": {"value": {"type": "string", "format": format_name}},
+        "required": ["value"],
+    }
+
+
+@pytest.mark.parametrize(
+    ("format_name", "valid", "expected", "invalid"),
+    [
+        ("ipv4", "192.168.0.1", IPv4Address("192.168.0.1"), "256.0.0.1"),
+        ("ipv6", "::1", IPv6Address("::1"), "192.168.0.1"),
+        ("duration", "P1DT2H", timedelta(days=1, hours=2), "one day"),
+        ("hostname", "api.example.com", "api.example.com", "-example.com"),
+        ("json-pointer", "/a~1b/0", "/a~1b/0", "a/b"),
+        ("email", "jane@example.com", "jane@example.com", "jane.example.com"),
+    ],
+)
+def test_strict_formats(format_name: str, valid: str, expected: Any, invalid: str) -> None:
+    Model = generate_basemodel(schema_with_format(format_name), strict_formats=True)
+    assert Model(value=valid).value == expected
+    with pytest.raises(ValidationError):
+        Model(value=invalid)
+
+
+def test_uri() -> None:
+    Model = generate_basemodel(schema_with_format("uri"), strict_formats=True)
+    assert str(Model(value="https://example.com/path").value) == "https://example.com/path"
+    with pytest.raises(ValidationError):
+        Model(value="not a uri")
+
+
+@pytest.mark.parametrize(
+    ("format_name", "valid", "invalid"),
+    [
+        ("hostname", "ab.example.com", ["a.example.com", "abc.example.com", "xy.example.com"]),
+        ("json-pointer", "/ab/c", ["/a", "/abcdef", "/xy"]),
+        ("email", "ab@example.com", ["a@example.com", "abc@example.com", "xy@example.com"]),
+    ],
+)
+def test_string_constraints_apply_to_string_formats(
+    format_name: str, valid: str, invalid: List[str]
+) -> None:
+    schema = schema_with_format(format_name)
+    schema["properties"]["value"].update(minLength=len(valid), maxLength=len(valid), pattern="^.?a")
+    for strict_formats in (False, True):
+        Model = generate_basemodel(schema, strict_formats=strict_formats)
+        assert Model(value=valid).value == valid
+        for value in invalid:
+            with pytest.raises(ValidationError):
+                Model(value=value)
+
+
+def test_string_constraints_keep_other_formats_strings() -> None:
+    schema = schema_with_format("ipv4")
+    schema["properties"]["value"]["pattern"] = "^10\\."
+    Model = generate_basemodel(schema, strict_formats=True)
+    assert Model(value="10.0.0.1").value == "10.0.0.1"
+    with pytest.raises(ValidationError):
+        Model(value="192.168.0.1")
+
+
+def test_default_mode_accepts_any_string() -> None:
+    Model = generate_basemodel(schema_with_format("ipv4"))
+    assert Model(value="256.0.0.1").value == "256.0.0.1"
+
+
+def test_cache_key() -> None:
+    cache = ModelCache()
+    schema = schema_with_format("ipv4")
+    Lenient = generate_basemodel(schema, cache=cache)
+    Strict = generate_basemodel(schema, cache=cache, strict_formats=True)
+    assert Lenient is not Strict
+    assert generate_basemodel(schema, cache=cache, strict_formats=True) is Strict
+
+
+def test_generated_module() -> None:
+    schema = {
+        "type": "object",
+        "properties": {
+            "address": {"type": "string", "format": "ipv4"},
+            "host": {"type": "string", "format": "hostname", "maxLength": 12},
+            "email": {"type": "string", "format": "email"},
+        },
+    }
+    source = generate_module_source({"Server": schema}, strict_formats=True)
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)
+    Server = namespace["Server"]
+    assert Server(address="10.0.0.1").address == IPv4Address("10.0.0.1")
+    for invalid in (
+        {"host": "-example.com"},
+        {"host": "api.example.com"},
+        {"email": "jane.example.com"},
+    ):
+        with pytest.raises(ValidationError):
+            Server(**invalid)
+    assert ("EmailStr" in source) == has_email_validator()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+from pydanticmodelgen import generate_basemodel, generate_typeadapter
+
+SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "title": "Person",
+    "required": ["name"],
+    "additionalProperties": True,
+    "properties": {
+        "name": {"type": "string", "format": "short"},
+        "kind": {"enum": ["a", "b"]},
+        "tags": {"type": "array", "items": {"type": "string"}, "default": ["new"]},
+        "address": {
+            "type": "object",
+            "additionalProperties": False,
+            "properties": {"city": {"type": "string"}},
+        },
+        "friends": {"type": "array", "items": {"$ref": "#"}},
+    },
+}
+
+RECORD = {
+    "name": "x",
+    "kind": "a",
+    "address": {"city": "y", "zip": "1"},
+    "friends": [{"name": "z", "note": 1}],
+    "note": 2,
+}
+
+
+def is_short(value: str) -> bool:
+    return len(value) < 5
+
+
+def test_validates_into_dicts() -> None:
+    adapter = generate_typeadapter(SCHEMA, format_validation={"short": is_short})
+    Model = generate_basemodel(SCHEMA, format_validation={"short": is_short})
+    result = adapter.validate_python(RECORD)
+    assert type(result) is dict
+    assert type(result["friends"][0]) is dict
+    assert result == Model.model_validate(RECORD).model_dump()
+    assert adapter.validate_json(json.dumps(RECORD)) == result
+
+
+def test_errors() -> None:
+    adapter = generate_typeadapter(SCHEMA, format_validation={"short": is_short})
+    with pytest.raises(ValidationError, match="Field required"):
+        adapter.validate_python({"friends": [{}]})
+    with pytest.raises(ValidationError, match="Invalid value for format"):
+        adapter.validate_python({"name": "too long"})
+    with pytest.raises(ValidationError):
+        adapter.validate_python({"name": "x", "kind": "c"})